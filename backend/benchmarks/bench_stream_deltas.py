@@ -0,0 +1,99 @@
+"""
+Per-token CPU cost of the streaming hot path: a completion delta becomes a chat event,
+is buffered as a stream event and serialized as SSE data.
+
+The `pydantic` variant reproduces the models and serialization this path used before they
+were replaced by slotted dataclasses, so both can be compared on the same machine.
+
+Run from the backend directory:
+
+    PYTHONPATH=./ python benchmarks/bench_stream_deltas.py
+"""
+import json
+import time
+from typing import Literal, Union, Callable
+
+from pydantic import BaseModel
+
+from src.common.get_timestamp import get_timestamp
+from src.modules.ai.completions.models.Delta import Delta
+from src.modules.chat.helpers.serialize_chat_event import serialize_chat_event
+from src.modules.chat.models.ChatEvent import ChatMessageEvent
+from src.modules.chat.models.ChatStreamEvent import ChatStreamEvent
+
+TOKENS = 200_000
+ROUNDS = 5
+
+
+class _PydanticDelta(BaseModel):
+    role: str
+    content: str | None = None
+    reasoning_content: str | None = None
+    tool_call_id: str | None = None
+    tool_calls: list[dict] | None = None
+    context_message_override: str | None = None
+
+
+class _PydanticChatErrorEvent(BaseModel):
+    event: Literal['error'] = 'error'
+    message: str
+
+
+class _PydanticChatMessageEvent(BaseModel):
+    event: Literal['message'] = 'message'
+    source: str
+    message: str | None = None
+    reasoning: str | None = None
+
+
+class _PydanticChatStreamEvent(BaseModel):
+    index: int
+    timestamp: str
+    chat_event: Union[_PydanticChatErrorEvent, _PydanticChatMessageEvent]
+
+
+def _pydantic_token(index: int, content: str) -> str:
+    delta = _PydanticDelta(role='assistant', content=content)
+    chat_event = _PydanticChatMessageEvent(source=delta.role, message=delta.content,
+                                           reasoning=delta.reasoning_content)
+    stream_event = _PydanticChatStreamEvent(index=index, timestamp=get_timestamp(), chat_event=chat_event)
+    return json.dumps({
+        'timestamp': stream_event.timestamp,
+        **stream_event.chat_event.model_dump()
+    })
+
+
+def _dataclass_token(index: int, content: str) -> str:
+    delta = Delta(role='assistant', content=content)
+    chat_event = ChatMessageEvent(source=delta.role, message=delta.content, reasoning=delta.reasoning_content)
+    stream_event = ChatStreamEvent(index=index, timestamp=get_timestamp(), chat_event=chat_event)
+    return serialize_chat_event(stream_event.timestamp, stream_event.chat_event)
+
+
+def _measure(token: Callable[[int, str], str]) -> float:
+    """
+    :return: The best per-token CPU time in microseconds over `ROUNDS` rounds.
+    """
+    best = float('inf')
+
+    for _ in range(ROUNDS):
+        started = time.process_time()
+        for i in range(TOKENS):
+            token(i, ' token')
+        best = min(best, time.process_time() - started)
+
+    return best / TOKENS * 1_000_000
+
+
+def main():
+    assert json.loads(_pydantic_token(0, ' token')).keys() == json.loads(_dataclass_token(0, ' token')).keys()
+
+    pydantic_us = _measure(_pydantic_token)
+    dataclass_us = _measure(_dataclass_token)
+
+    print(f'pydantic:  {pydantic_us:.2f} µs/token')
+    print(f'dataclass: {dataclass_us:.2f} µs/token ({pydantic_us / dataclass_us:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
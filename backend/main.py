@@ -12,6 +12,7 @@ from src.api.chat import chat_router
 from src.api.conversation import conversation_router
 from src.api.document_chunker import document_chunker_router
 from src.api.group import group_router
+from src.api.image import image_router
 from src.api.ai import ai_router
 from src.api.collection import collection_router
 from src.api.login import login_router
@@ -29,8 +30,10 @@ async def lifespan(app: FastAPI):
     await setup_default_settings(app.state.services.settings_service)
     await setup_default_groups(app.state.services.group_service)
     await setup_default_models(app.state.services.model_service)
+    await app.state.services.model_capability_service.refresh()
     await setup_default_assistants(app.state.services.assistant_service)
     yield
+    await app.state.services.http_client_service.close()
 
 
 def create_app():
@@ -49,6 +52,7 @@ def create_app():
     api_router.include_router(conversation_router)
     api_router.include_router(document_chunker_router)
     api_router.include_router(group_router)
+    api_router.include_router(image_router)
     api_router.include_router(ai_router)
     api_router.include_router(login_router)
     api_router.include_router(model_router)
@@ -1,9 +1,18 @@
-from fastapi import APIRouter, HTTPException, status
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, HTTPException, status, Header, Response
 from pydantic import BaseModel, Field
 
 from src.common.services.fastapi_get_services import ServicesDependency
+from src.modules.ai.circuit_breaker.models.CircuitOpenError import CircuitOpenError
+from src.modules.ai.circuit_breaker.models.CircuitStatus import CircuitState
 from src.modules.ai.completions.models.Feature import features_from_string
+from src.modules.ai.response_cache.helpers.is_deterministic_request import is_deterministic_request
+from src.modules.ai.response_cache.helpers.make_response_cache_key import make_response_cache_key
+from src.modules.ai.scheduler.models.GenerationPriority import GenerationPriority
+from src.modules.ai.scheduler.models.GenerationRequest import GenerationRequest
 from src.modules.auth.auth_router_decorator import AuthRouterDecorator
+from src.modules.auth.authentication.models.AuthenticatedIdentity import AuthenticatedIdentity
 from src.modules.ai.completions.helpers.collect_streamed import collect_streamed
 from src.modules.ai.completions.models.Message import Message
 from src.modules.ai.completions.protocols.ICompletionsService import ICompletionsService
@@ -38,25 +47,150 @@ class RunResponse(BaseModel):
     '/completions',
     required_scopes=['ai.run'],
     summary='Run LLM completions',
+    description='''
+Deterministic requests (`temperature` 0 in `extra_params`, no web search or image generation)
+are answered from a cache of earlier identical requests. Send the `X-Completions-Cache` header
+as `use` to cache other requests too, or as `bypass` to never use the cache.
+The `X-Completions-Cache` response header is `hit`, `miss` or `skip` (not cached).
+Requests with their own `api_key` only get cached responses to requests with the same key.
+''',
     response_model=RunResponse,
 )
-async def completions(request: RunRequest, services: ServicesDependency):
+async def completions(
+        request: RunRequest,
+        response: Response,
+        services: ServicesDependency,
+        auth_identity: AuthenticatedIdentity,
+        x_completions_cache: Annotated[Literal['use', 'bypass'] | None, Header()] = None,
+):
     try:
+        messages = [
+            Message(
+                role=message.role,
+                content=message.content
+            )
+            for message in request.messages
+        ]
+        enabled_features = features_from_string(
+            ",".join(request.enabled_features)) if request.enabled_features else []
+        extra_params = request.extra_params if request.extra_params else {}
+
+        cache_key = None
+        if x_completions_cache == 'use' or (
+                x_completions_cache is None and is_deterministic_request(enabled_features, extra_params)):
+            cache_key = make_response_cache_key(request.model, messages, enabled_features, extra_params,
+                                                api_key=request.api_key)
+
+            cached = await services.response_cache_service.get_response(cache_key)
+            if cached is not None:
+                response.headers['X-Completions-Cache'] = 'hit'
+                return RunResponse(role=cached.role, content=cached.content)
+
         service: ICompletionsService = services.completions_factory.get(model=request.model,
                                                                         api_key=request.api_key if request.api_key else "")
-        message = await collect_streamed(service.run_completions(
-            messages=[
-                Message(
-                    role=message.role,
-                    content=message.content
-                )
-                for message in request.messages
-            ],
-            enabled_features=features_from_string(
-                ",".join(request.enabled_features)) if request.enabled_features else [],
-            extra_params=request.extra_params if request.extra_params else {}
-        ))
+        async with services.generation_scheduler.enqueue(GenerationRequest(
+                priority=GenerationPriority.BUFFERED,
+                model=request.model,
+                uid=auth_identity.uid
+        )):
+            message = await collect_streamed(service.run_completions(
+                messages=messages,
+                enabled_features=enabled_features,
+                extra_params=extra_params
+            ))
+
+        # Errors (such as a tool that was not found) and empty answers are not worth replaying
+        if cache_key is not None and message.role == 'assistant' and message.content:
+            await services.response_cache_service.set_response(cache_key, message)
 
+        response.headers['X-Completions-Cache'] = 'skip' if cache_key is None else 'miss'
         return RunResponse(role=message.role, content=message.content)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e),
+                            headers={'Retry-After': str(int(e.retry_after_seconds) + 1)})
+
+
+class GetCacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    entries: int
+    hit_ratio: float
+
+
+@auth.get(
+    '/completions/cache-stats',
+    ['settings.read'],
+    summary='Completions Cache Stats',
+    description='''
+Return how often `/ai/completions` was answered from the response cache since startup
+(`hit_ratio` is of the requests that looked in the cache) and how many responses it holds.
+''',
+    response_model=GetCacheStatsResponse,
+)
+async def get_cache_stats(services: ServicesDependency):
+    stats = await services.response_cache_service.get_stats()
+    lookups = stats.hits + stats.misses
+    return GetCacheStatsResponse(**stats.model_dump(), hit_ratio=stats.hits / lookups if lookups > 0 else 0.0)
+
+
+class GetHedgeStatsResponseModel(BaseModel):
+    model: str
+    primary_requests: int
+    hedged_requests: int
+    fallback_requests: int
+    wins: int
+    hedge_rate: float
+    win_rate: float
+
+
+class GetHedgeStatsResponse(BaseModel):
+    models: list[GetHedgeStatsResponseModel]
+
+
+@auth.get(
+    '/completions/hedge-stats',
+    ['settings.read'],
+    summary='Completions Hedge Stats',
+    description='''
+Return per-model counters (since startup) for assistants with fallback models:
+how often each model was started as primary or fallback, how often the primary
+missed its time to first token deadline (`hedge_rate`) and how often the model
+produced the answer that was used (`win_rate`).
+''',
+    response_model=GetHedgeStatsResponse,
+)
+async def get_hedge_stats(services: ServicesDependency):
+    stats = await services.hedge_stats_service.get_stats()
+    return GetHedgeStatsResponse(models=[GetHedgeStatsResponseModel(**s.model_dump()) for s in stats])
+
+
+class GetDiagnosticsResponseCircuit(BaseModel):
+    model: str
+    state: CircuitState
+    calls: int
+    error_rate: float
+    slow_rate: float
+    retry_after_seconds: float | None
+
+
+class GetDiagnosticsResponse(BaseModel):
+    circuits: list[GetDiagnosticsResponseCircuit]
+
+
+@auth.get(
+    '/diagnostics',
+    ['settings.read'],
+    summary='AI Diagnostics',
+    description='''
+Return the circuit breaker state of every model called since startup.
+While a circuit is `open` calls to the model fail immediately (or go to the
+assistant's fallback models), `half_open` means a trial call is in progress.
+`error_rate` and `slow_rate` are for calls within the last minute.
+''',
+    response_model=GetDiagnosticsResponse,
+)
+async def get_diagnostics(services: ServicesDependency):
+    statuses = await services.circuit_breaker.get_statuses()
+    return GetDiagnosticsResponse(circuits=[GetDiagnosticsResponseCircuit(**s.model_dump()) for s in statuses])
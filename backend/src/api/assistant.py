@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 
 from src.common.services.fastapi_get_services import ServicesDependency
 from src.modules.auth.auth_router_decorator import AuthRouterDecorator
+from src.modules.assistants.models.Assistant import RagScoringMode
 from src.modules.auth.authentication.models.AuthenticatedIdentity import AuthenticatedIdentity
 
 assistant_router = APIRouter(
@@ -141,6 +142,11 @@ class GetAssistantResponseAssistant(BaseModel):
     collection_id: str | None
     max_collection_results: int
     extra_llm_params: dict
+    rag_scoring_mode: RagScoringMode
+    fallback_models: list[str]
+    ttft_deadline_seconds: float | None
+    cache_tool_results: bool
+    semantic_cache: bool
 
 
 class GetAssistantResponse(BaseModel):
@@ -171,7 +177,12 @@ async def get_assistant(assistant_id: str, services: ServicesDependency, auth_id
             instructions=result.instructions,
             collection_id=result.collection_id,
             max_collection_results=result.max_collection_results,
-            extra_llm_params=result.extra_llm_params if result.extra_llm_params else {}
+            extra_llm_params=result.extra_llm_params if result.extra_llm_params else {},
+            rag_scoring_mode=result.rag_scoring_mode,
+            fallback_models=result.fallback_models,
+            ttft_deadline_seconds=result.ttft_deadline_seconds,
+            cache_tool_results=result.cache_tool_results,
+            semantic_cache=result.semantic_cache
         )
     )
 
@@ -208,6 +219,11 @@ class UpdateAssistantRequest(BaseModel):
     collection_id: str | None = Field(default=None, examples=['my-collection-id'])
     max_collection_results: int | None = None
     extra_llm_params: dict | None = Field(default=None, examples=[{}])
+    rag_scoring_mode: RagScoringMode | None = Field(default=None, examples=['batched'])
+    fallback_models: list[str] | None = Field(default=None, examples=[['anthropic/claude-sonnet-4-5']])
+    ttft_deadline_seconds: float | None = Field(default=None, examples=[5])
+    cache_tool_results: bool | None = Field(default=None, examples=[True])
+    semantic_cache: bool | None = Field(default=None, examples=[False])
 
 
 @auth.put(
@@ -223,6 +239,22 @@ frontend-specific details (name, description, image etc.).
 
 `extra_llm_params` is also a generic key-value store and is model-specific.
 It may contain properties such as `temperature` for certain models.
+
+`rag_scoring_mode` controls how collection results are scored for relevance:
+`individual` makes one scoring call per result, `batched` scores all results
+in a single call (falling back to `individual` if the response is invalid)
+and `rerank` scores results locally without calling an LLM.
+
+`fallback_models` are tried in order if `model` fails. If no first token has
+arrived after `ttft_deadline_seconds`, the next fallback is started as well and
+whichever model answers first is used (0 to only fall back on failure).
+
+`cache_tool_results` reuses results of identical tool calls, such as an image
+generated earlier from the same prompt. Disable it to always get a new result.
+
+`semantic_cache` answers the first message of a new chat with the answer to an
+earlier first message that is similar enough, without calling the model. Cached
+answers are dropped when `instructions`, `model` or the collection change.
 ''',
     response_404_description='Assistant not found',
 )
@@ -242,6 +274,11 @@ async def update_assistant(
         collection_id=body.collection_id,
         max_collection_results=body.max_collection_results,
         extra_llm_params=body.extra_llm_params,
+        rag_scoring_mode=body.rag_scoring_mode,
+        fallback_models=body.fallback_models,
+        ttft_deadline_seconds=body.ttft_deadline_seconds,
+        cache_tool_results=body.cache_tool_results,
+        semantic_cache=body.semantic_cache,
     )
 
     if not success:
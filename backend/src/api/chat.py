@@ -1,11 +1,17 @@
-from fastapi import APIRouter, HTTPException, status
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, status, Header
 from pydantic import BaseModel
 
 from src.common.services.fastapi_get_services import ServicesDependency
 from src.modules.auth.auth_router_decorator import AuthRouterDecorator
 from src.modules.auth.authentication.models.AuthenticatedIdentity import AuthenticatedIdentity
-from src.modules.chat.event_source_llm_generator import event_source_llm_generator
+from src.modules.chat.event_source_llm_generator import event_source_llm_generator, event_source_chat_stream
+from src.modules.chat.helpers.parse_last_event_id import parse_last_event_id
+from src.modules.chat.protocols.IChatStreamService import IChatStreamService
+from src.modules.settings.protocols.ISettingsService import ISettingsService
 from src.modules.ai.completions.models.Feature import features_from_string
+from src.modules.ai.scheduler.models.GenerationPriority import GenerationPriority
 
 chat_router = APIRouter(
     prefix='/chat',
@@ -113,7 +119,8 @@ async def buffered_chat(body: BufferedChatRequest, services: ServicesDependency,
             as_uid=auth_identity.uid,
             assistant_id=body.assistant_id,
             message=body.message,
-            enabled_features=[]
+            enabled_features=[],
+            priority=GenerationPriority.BUFFERED
     ):
         match delta.event:
             case 'conversation_id':
@@ -127,6 +134,8 @@ async def buffered_chat(body: BufferedChatRequest, services: ServicesDependency,
                     source="error",
                     message=delta.message
                 )
+            case 'queue_position':
+                pass
             case _:
                 print(f'unhandled chat event {delta.event}')
 
@@ -169,7 +178,8 @@ async def buffered_chat_continue(
             as_uid=auth_identity.uid,
             conversation_id=conversation_id,
             message=body.message,
-            enabled_features=[]
+            enabled_features=[],
+            priority=GenerationPriority.BUFFERED
     ):
         match delta.event:
             case 'message':
@@ -181,6 +191,8 @@ async def buffered_chat_continue(
                     source="error",
                     message=delta.message
                 )
+            case 'queue_position':
+                pass
             case _:
                 print(f'unhandled chat event {delta.event}')
 
@@ -225,6 +237,9 @@ async def store_message(body: StoreMessageRequest, services: ServicesDependency)
     description='''
 Chat against an assistant. 
 The response is streamed using Server-Side Events.
+
+Reconnecting with a `Last-Event-ID` header resumes the stream
+after that event, as long as the generation is still buffered.
     '''
 )
 async def stream_chat(
@@ -233,7 +248,14 @@ async def stream_chat(
         services: ServicesDependency,
         auth_identity: AuthenticatedIdentity,
         features: str = '',
+        last_event_id: Annotated[str | None, Header()] = None,
 ):
+    resumed = await _resume_chat_stream(last_event_id, auth_identity.uid, services.chat_stream_service,
+                                        services.settings_service)
+
+    if resumed is not None:
+        return resumed
+
     message = await services.message_store_service.consume_message(stored_message_id=stored_message_id)
 
     if message is None:
@@ -245,6 +267,8 @@ async def stream_chat(
         start_new_conversation=True,
         user_message=message,
         chat_service=services.chat_service,
+        chat_stream_service=services.chat_stream_service,
+        settings_service=services.settings_service,
         features=features_from_string(features)
     )
 
@@ -256,6 +280,9 @@ async def stream_chat(
     description='''
 Chat against an assistant by continuing an existing conversation.
 The response is streamed using Server-Side Events.
+
+Reconnecting with a `Last-Event-ID` header resumes the stream
+after that event, as long as the generation is still buffered.
     '''
 )
 async def stream_chat_continue(
@@ -264,7 +291,14 @@ async def stream_chat_continue(
         services: ServicesDependency,
         auth_identity: AuthenticatedIdentity,
         features: str = '',
+        last_event_id: Annotated[str | None, Header()] = None,
 ):
+    resumed = await _resume_chat_stream(last_event_id, auth_identity.uid, services.chat_stream_service,
+                                        services.settings_service)
+
+    if resumed is not None:
+        return resumed
+
     message = await services.message_store_service.consume_message(stored_message_id=stored_message_id)
 
     if message is None:
@@ -276,5 +310,87 @@ async def stream_chat_continue(
         start_new_conversation=False,
         user_message=message,
         chat_service=services.chat_service,
+        chat_stream_service=services.chat_stream_service,
+        settings_service=services.settings_service,
         features=features_from_string(features)
     )
+
+
+@auth.get(
+    '/sse/{conversation_id}/stream',
+    ['chat'],
+    summary='Follow chat (streamed via SSE)',
+    description='''
+Follow the response currently being generated in a conversation,
+e.g. from another tab. Streams all events from the start of the
+response, or after `Last-Event-ID` if given.
+    ''',
+    response_404_description='No response is being generated in the conversation',
+)
+async def stream_chat_follow(
+        conversation_id: str,
+        services: ServicesDependency,
+        auth_identity: AuthenticatedIdentity,
+        last_event_id: Annotated[str | None, Header()] = None,
+):
+    resumed = await _resume_chat_stream(last_event_id, auth_identity.uid, services.chat_stream_service,
+                                        services.settings_service)
+
+    if resumed is not None:
+        return resumed
+
+    stream_id = await services.chat_stream_service.get_conversation_stream_id(
+        as_uid=auth_identity.uid,
+        conversation_id=conversation_id
+    )
+
+    response = await event_source_chat_stream(
+        calling_uid=auth_identity.uid,
+        stream_id=stream_id,
+        chat_stream_service=services.chat_stream_service,
+        settings_service=services.settings_service
+    ) if stream_id is not None else None
+
+    if response is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, 'No response is being generated')
+
+    return response
+
+
+async def _resume_chat_stream(last_event_id: str | None, calling_uid: str, chat_stream_service: IChatStreamService,
+                              settings_service: ISettingsService):
+    parsed = parse_last_event_id(last_event_id)
+
+    if parsed is None:
+        return None
+
+    stream_id, index = parsed
+
+    return await event_source_chat_stream(
+        calling_uid=calling_uid,
+        stream_id=stream_id,
+        chat_stream_service=chat_stream_service,
+        settings_service=settings_service,
+        after_index=index
+    )
+
+
+class GetScoreCacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    entries: int
+
+
+@auth.get(
+    '/score-cache/stats',
+    ['settings.read'],
+    summary='RAG Score Cache Stats',
+    description='''
+Return hit/miss counters (since startup) and the number of cached
+entries of the RAG relevance score cache.
+''',
+    response_model=GetScoreCacheStatsResponse,
+)
+async def get_score_cache_stats(services: ServicesDependency):
+    stats = await services.score_cache_service.get_stats()
+    return GetScoreCacheStatsResponse(hits=stats.hits, misses=stats.misses, entries=stats.entries)
@@ -0,0 +1,56 @@
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, status, Header
+from fastapi.responses import StreamingResponse, Response
+
+from src.common.services.fastapi_get_services import ServicesDependency
+from src.modules.auth.auth_router_decorator import AuthRouterDecorator
+from src.modules.image_store.helpers.etag_matches import etag_matches
+
+image_router = APIRouter(
+    prefix='/image',
+    tags=['Image']
+)
+
+auth = AuthRouterDecorator(image_router)
+
+
+@auth.get(
+    '/{image_id}',
+    ['chat'],
+    summary='Get image',
+    description='''
+Get an image generated during a chat, as referenced by URL in the message.
+
+Any signed in user with the URL can read the image. The id is random and hard to guess, and
+identical generations are shared between users, so images have no single owner to check against.
+
+Images never change, so responses can be cached for good and
+revalidated with `If-None-Match`.
+''',
+    response_404_description='Image not found',
+)
+async def get_image(
+        image_id: str,
+        services: ServicesDependency,
+        if_none_match: Annotated[str | None, Header()] = None,
+):
+    image = await services.image_store_service.get_image(image_id)
+
+    if image is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, 'Image not found')
+
+    etag = f'"{image.etag}"'
+    headers = {
+        'ETag': etag,
+        'Cache-Control': 'private, max-age=31536000, immutable',
+    }
+
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return StreamingResponse(
+        services.image_store_service.read_image(image_id),
+        media_type=image.content_type,
+        headers={**headers, 'Content-Length': str(image.length)}
+    )
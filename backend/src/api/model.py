@@ -68,6 +68,8 @@ async def create_model(
             detail=f"Model with key '{request.key}' already exists or creation failed"
         )
 
+    await services.model_capability_service.refresh()
+
     created_model = await services.model_service.get_model(request.key, auth_identity.uid)
     if not created_model:
         raise HTTPException(
@@ -198,6 +200,8 @@ async def update_model(
             detail=f"Model with key '{key}' not found or version mismatch (concurrent update)"
         )
 
+    await services.model_capability_service.refresh()
+
     updated_model = await services.model_service.get_model(key, auth_identity.uid)
     if not updated_model:
         raise HTTPException(
@@ -238,3 +242,5 @@ async def delete_model(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Model with key '{key}' not found or is in use by assistants"
         )
+
+    await services.model_capability_service.refresh()
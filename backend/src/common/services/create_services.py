@@ -1,24 +1,33 @@
 import os
 
+import litellm
 from pymongo import AsyncMongoClient
 
 from src.common.services.models.Services import Services
+from src.modules.ai.circuit_breaker.factory import CircuitBreakerFactory
 from src.modules.ai.completions.tools.CompletionsToolsFactory import CompletionsToolsFactory
-from src.modules.ai.image_gen.factory import ImageGeneratorServiceFactory
+from src.modules.ai.rate_limit.factory import RateLimiterFactory
+from src.modules.ai.scheduler.factory import GenerationSchedulerFactory
+from src.modules.ai.image_gen.factory import ImageGeneratorServiceFactory, ImageCacheServiceFactory
 from src.modules.api_key.factory import ApiKeyServiceFactory
 from src.modules.assistants.factory import AssistantServiceFactory
 from src.modules.auth.authentication.factory import AuthenticationServiceFactory
 from src.modules.auth.authentication.models.AuthenticationType import AuthenticationType
 from src.modules.auth.authorization.factory import AuthorizationServiceFactory
-from src.modules.chat.factory import ChatServiceFactory, MessageStoreServiceFactory
+from src.modules.chat.factory import ChatServiceFactory, MessageStoreServiceFactory, ScoreCacheServiceFactory, \
+    ChatStreamServiceFactory, SemanticAnswerCacheServiceFactory
 from src.modules.collections.factory import CollectionServiceFactory
-from src.modules.conversations.factory import ConversationServiceFactory
+from src.modules.conversations.factory import ConversationServiceFactory, ConversationJournalServiceFactory
 from src.modules.document_chunker.factory import DocumentChunkerFactory
 from src.modules.groups.factory import GroupServiceFactory
-from src.modules.ai.completions.factory import CompletionsServiceFactory
+from src.modules.http_clients.factory import HttpClientServiceFactory
+from src.modules.image_store.factory import ImageStoreServiceFactory
+from src.modules.ai.completions.factory import CompletionsServiceFactory, HedgeStatsServiceFactory
+from src.modules.ai.response_cache.factory import ResponseCacheServiceFactory
 from src.modules.login.factory import LoginServiceFactory
-from src.modules.models.factory import ModelServiceFactory
+from src.modules.models.factory import ModelServiceFactory, ModelCapabilityServiceFactory
 from src.modules.notification.factory import NotificationServiceFactory
+from src.modules.rerank.factory import RerankServiceFactory
 from src.modules.resources.factory import ResourceServiceFactory
 from src.modules.settings.factory import SettingsServiceFactory
 from src.modules.token.factory import TokenServiceFactory
@@ -38,22 +47,39 @@ async def create_services() -> Services:
     ).get()
     settings_service = SettingsServiceFactory(mongo_database=mongo_database).get()
     notification_service = NotificationServiceFactory(settings_service=settings_service).get()
-    vector_service = VectorServiceFactory(settings_service=settings_service).get()
+    http_client_service = HttpClientServiceFactory().get()
+    # litellm sends OpenAI compatible requests (completions, image generation) through this client
+    litellm.aclient_session = http_client_service.get_async_client()
+    vector_service = VectorServiceFactory(settings_service=settings_service,
+                                          http_client_service=http_client_service).get()
     resource_service = ResourceServiceFactory(group_service=group_service).get()
     model_service = ModelServiceFactory(mongo_database=mongo_database).get()
+    model_capability_service = ModelCapabilityServiceFactory(model_service=model_service).get()
     assistant_service = AssistantServiceFactory(
         mongo_database=mongo_database, 
         resource_service=resource_service
     ).get()
     conversation_service = ConversationServiceFactory(mongo_database=mongo_database).get()
-    image_generator_factory = ImageGeneratorServiceFactory()
-    completions_tools_factory = CompletionsToolsFactory(image_generator_factory=image_generator_factory)
+    conversation_journal_service = ConversationJournalServiceFactory(mongo_database=mongo_database).get()
+    image_generator_factory = ImageGeneratorServiceFactory(settings_service=settings_service)
+    image_store_service = await ImageStoreServiceFactory(mongo_database=mongo_database).get()
+    completions_tools_factory = CompletionsToolsFactory(image_generator_factory=image_generator_factory,
+                                                        image_store_service=image_store_service,
+                                                        image_cache_service=ImageCacheServiceFactory().get())
+    hedge_stats_service = HedgeStatsServiceFactory().get()
+    circuit_breaker = CircuitBreakerFactory().get()
     completions_factory = CompletionsServiceFactory(setting_service=settings_service,
-                                                    completions_tools_factory=completions_tools_factory)
+                                                    completions_tools_factory=completions_tools_factory,
+                                                    rate_limiter=RateLimiterFactory().get(),
+                                                    circuit_breaker=circuit_breaker,
+                                                    model_capability_service=model_capability_service,
+                                                    hedge_stats_service=hedge_stats_service)
     collection_service = CollectionServiceFactory(
         mongo_database=mongo_database,
         vector_service=vector_service,
         chunker_factory=document_chunker_factory).get()
+    generation_scheduler = GenerationSchedulerFactory(settings_service=settings_service).get()
+    score_cache_service = await ScoreCacheServiceFactory(mongo_database=mongo_database).get()
 
     return Services(
         authentication_factory=AuthenticationServiceFactory(
@@ -69,6 +95,7 @@ async def create_services() -> Services:
         authorization_service=authorization_service,
         api_key_service=api_key_service,
         completions_factory=completions_factory,
+        generation_scheduler=generation_scheduler,
         document_chunker_factory=document_chunker_factory,
         vector_service=vector_service,
         collection_service=collection_service,
@@ -83,15 +110,33 @@ async def create_services() -> Services:
         settings_service=settings_service,
         assistant_service=assistant_service,
         model_service=model_service,
+        model_capability_service=model_capability_service,
         conversation_service=conversation_service,
         chat_service=ChatServiceFactory(
             completions_factory=completions_factory,
             assistant_service=assistant_service,
             conversation_service=conversation_service,
+            conversation_journal_service=conversation_journal_service,
             collection_service=collection_service,
+            settings_service=settings_service,
+            score_cache_service=score_cache_service,
+            rerank_service=RerankServiceFactory().get(),
+            model_capability_service=model_capability_service,
+            generation_scheduler=generation_scheduler,
+            semantic_answer_cache_service=SemanticAnswerCacheServiceFactory(vector_service=vector_service,
+                                                                            settings_service=settings_service).get(),
         ).get(),
+        chat_stream_service=ChatStreamServiceFactory().get(),
         message_store_service=await MessageStoreServiceFactory(mongo_database=mongo_database).get(),
         token_factory=TokenServiceFactory(assistant_service=assistant_service,
-                                          conversation_service=conversation_service),
+                                          conversation_service=conversation_service,
+                                          model_capability_service=model_capability_service),
         resource_service=resource_service,
+        score_cache_service=score_cache_service,
+        http_client_service=http_client_service,
+        hedge_stats_service=hedge_stats_service,
+        circuit_breaker=circuit_breaker,
+        image_store_service=image_store_service,
+        response_cache_service=await ResponseCacheServiceFactory(mongo_database=mongo_database,
+                                                                 settings_service=settings_service).get(),
     )
@@ -5,13 +5,22 @@ from src.modules.assistants.protocols.IAssistantService import IAssistantService
 from src.modules.auth.authentication.factory import AuthenticationServiceFactory
 from src.modules.auth.authorization.protocols.IAuthorizationService import IAuthorizationService
 from src.modules.chat.protocols.IChatService import IChatService
+from src.modules.chat.protocols.IChatStreamService import IChatStreamService
 from src.modules.chat.protocols.IMessageStoreService import IMessageStoreService
+from src.modules.chat.protocols.IScoreCacheService import IScoreCacheService
 from src.modules.collections.protocols.ICollectionService import ICollectionService
 from src.modules.conversations.protocols.IConversationService import IConversationService
 from src.modules.document_chunker.factory import DocumentChunkerFactory
 from src.modules.groups.protocols.IGroupService import IGroupService
+from src.modules.http_clients.protocols.IHttpClientService import IHttpClientService
+from src.modules.image_store.protocols.IImageStoreService import IImageStoreService
+from src.modules.ai.circuit_breaker.protocols.ICircuitBreaker import ICircuitBreaker
 from src.modules.ai.completions.factory import CompletionsServiceFactory
+from src.modules.ai.completions.protocols.IHedgeStatsService import IHedgeStatsService
+from src.modules.ai.scheduler.protocols.IGenerationScheduler import IGenerationScheduler
+from src.modules.ai.response_cache.protocols.IResponseCacheService import IResponseCacheService
 from src.modules.login.protocols.ILoginService import ILoginService
+from src.modules.models.protocols.IModelCapabilityService import IModelCapabilityService
 from src.modules.models.protocols.IModelService import IModelService
 from src.modules.notification.protocols.INotificationService import INotificationService
 from src.modules.resources.protocols.IResourceService import IResourceService
@@ -26,6 +35,7 @@ class Services:
     authorization_service: IAuthorizationService
     api_key_service: IApiKeyService
     completions_factory: CompletionsServiceFactory
+    generation_scheduler: IGenerationScheduler
     document_chunker_factory: DocumentChunkerFactory
     vector_service: IVectorService
     collection_service: ICollectionService
@@ -35,8 +45,16 @@ class Services:
     settings_service: ISettingsService
     assistant_service: IAssistantService
     model_service: IModelService
+    model_capability_service: IModelCapabilityService
     conversation_service: IConversationService
     chat_service: IChatService
+    chat_stream_service: IChatStreamService
     message_store_service: IMessageStoreService
     token_factory: TokenServiceFactory
     resource_service: IResourceService
+    score_cache_service: IScoreCacheService
+    http_client_service: IHttpClientService
+    hedge_stats_service: IHedgeStatsService
+    circuit_breaker: ICircuitBreaker
+    image_store_service: IImageStoreService
+    response_cache_service: IResponseCacheService
@@ -8,6 +8,7 @@ from pymongo import AsyncMongoClient
 
 from src.common.get_timestamp import get_timestamp
 from src.common.mock_services import MockSettingsService
+from src.modules.http_clients.PooledHttpClientService import PooledHttpClientService
 from src.modules.vector.ChromaDBLocalVectorService import ChromaDBLocalVectorService
 
 TEST_DB_PATH = './__test_chromadb'
@@ -17,7 +18,8 @@ TEST_DB_PATH = './__test_chromadb'
 def vector_service():
     path = TEST_DB_PATH + uuid.uuid4().hex
     shutil.rmtree(path, ignore_errors=True)
-    yield ChromaDBLocalVectorService(settings_service=MockSettingsService())
+    yield ChromaDBLocalVectorService(settings_service=MockSettingsService(),
+                                     http_client_service=PooledHttpClientService())
     shutil.rmtree(path, ignore_errors=True)
 
 
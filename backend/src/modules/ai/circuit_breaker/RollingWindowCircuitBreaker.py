@@ -0,0 +1,127 @@
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from src.modules.ai.circuit_breaker.models.CircuitOpenError import CircuitOpenError
+from src.modules.ai.circuit_breaker.models.CircuitStatus import CircuitStatus, CircuitState
+from src.modules.ai.circuit_breaker.protocols.ICircuitBreaker import ICircuitBreaker
+
+
+@dataclass
+class _Circuit:
+    state: CircuitState = 'closed'
+    outcomes: deque[tuple[float, bool, bool]] = field(default_factory=deque)
+    '''
+    (timestamp, failed, slow) for each call in the window.
+    '''
+    opened_at: float = 0
+    trial_started_at: float | None = None
+
+
+class RollingWindowCircuitBreaker(ICircuitBreaker):
+    """
+    Opens a model's circuit when, within the last `window_seconds` and over at least
+    `min_calls` calls, the share of failed or slow calls reaches its threshold.
+    After `open_seconds` one trial call is let through (half open) to decide whether to close
+    the circuit again. If the trial call never reports back, another one is let through
+    after another `open_seconds`.
+    """
+
+    def __init__(self, window_seconds: float = 60, min_calls: int = 10, error_rate_threshold: float = 0.5,
+                 slow_call_seconds: float = 30, slow_rate_threshold: float = 0.8, open_seconds: float = 30):
+        self._window_seconds = window_seconds
+        self._min_calls = min_calls
+        self._error_rate_threshold = error_rate_threshold
+        self._slow_call_seconds = slow_call_seconds
+        self._slow_rate_threshold = slow_rate_threshold
+        self._open_seconds = open_seconds
+        self._circuits: dict[str, _Circuit] = {}
+
+    def check(self, model: str) -> None:
+        circuit = self._circuits.get(model)
+
+        if circuit is None or circuit.state == 'closed':
+            return
+
+        now = time.monotonic()
+        retry_at = max(circuit.opened_at, circuit.trial_started_at or 0) + self._open_seconds
+
+        if now < retry_at:
+            raise CircuitOpenError(model=model, retry_after_seconds=retry_at - now)
+
+        circuit.state = 'half_open'
+        circuit.trial_started_at = now
+
+    def record_success(self, model: str, latency_seconds: float) -> None:
+        circuit = self._circuits.setdefault(model, _Circuit())
+        slow = latency_seconds >= self._slow_call_seconds
+
+        if circuit.state == 'half_open':
+            if slow:
+                self._open(model, circuit)
+            else:
+                self._close(circuit)
+            return
+
+        self._add_outcome(model, circuit, failed=False, slow=slow)
+
+    def record_failure(self, model: str) -> None:
+        circuit = self._circuits.setdefault(model, _Circuit())
+
+        if circuit.state == 'half_open':
+            self._open(model, circuit)
+            return
+
+        self._add_outcome(model, circuit, failed=True, slow=False)
+
+    async def get_statuses(self) -> list[CircuitStatus]:
+        now = time.monotonic()
+        statuses = []
+
+        for model, circuit in sorted(self._circuits.items()):
+            self._expire_outcomes(circuit, now)
+            calls = len(circuit.outcomes)
+            retry_at = max(circuit.opened_at, circuit.trial_started_at or 0) + self._open_seconds
+
+            statuses.append(CircuitStatus(
+                model=model,
+                state=circuit.state,
+                calls=calls,
+                error_rate=sum(failed for _, failed, _ in circuit.outcomes) / max(1, calls),
+                slow_rate=sum(slow for _, _, slow in circuit.outcomes) / max(1, calls),
+                retry_after_seconds=max(0.0, retry_at - now) if circuit.state != 'closed' else None,
+            ))
+
+        return statuses
+
+    def _add_outcome(self, model: str, circuit: _Circuit, failed: bool, slow: bool):
+        now = time.monotonic()
+        circuit.outcomes.append((now, failed, slow))
+        self._expire_outcomes(circuit, now)
+
+        # outcomes of calls started before the circuit opened don't change anything
+        if circuit.state != 'closed' or len(circuit.outcomes) < self._min_calls:
+            return
+
+        calls = len(circuit.outcomes)
+        error_rate = sum(f for _, f, _ in circuit.outcomes) / calls
+        slow_rate = sum(s for _, _, s in circuit.outcomes) / calls
+
+        if error_rate >= self._error_rate_threshold or slow_rate >= self._slow_rate_threshold:
+            self._open(model, circuit)
+
+    def _expire_outcomes(self, circuit: _Circuit, now: float):
+        while len(circuit.outcomes) > 0 and circuit.outcomes[0][0] < now - self._window_seconds:
+            circuit.outcomes.popleft()
+
+    def _open(self, model: str, circuit: _Circuit):
+        print(f'WARNING: Circuit for {model} opened, calls will fail for {self._open_seconds}s.')
+        circuit.state = 'open'
+        circuit.opened_at = time.monotonic()
+        circuit.trial_started_at = None
+
+    @staticmethod
+    def _close(circuit: _Circuit):
+        circuit.state = 'closed'
+        circuit.outcomes.clear()
+        circuit.trial_started_at = None
@@ -0,0 +1,7 @@
+from src.modules.ai.circuit_breaker.RollingWindowCircuitBreaker import RollingWindowCircuitBreaker
+from src.modules.ai.circuit_breaker.protocols.ICircuitBreaker import ICircuitBreaker
+
+
+class CircuitBreakerFactory:
+    def get(self) -> ICircuitBreaker:
+        return RollingWindowCircuitBreaker()
@@ -0,0 +1,17 @@
+import litellm
+
+
+def is_provider_failure(e: BaseException) -> bool:
+    """
+    Whether an error calling a model says something about the health of the model's provider
+    (a timeout, a connection error or a 5xx response), and so should count against its circuit.
+
+    Client errors such as a bad request, a too long prompt or an invalid key of a single
+    assistant are the caller's problem and must not open the circuit for everyone else.
+    """
+    if isinstance(e, (litellm.Timeout, litellm.APIConnectionError, TimeoutError, ConnectionError)):
+        return True
+
+    status_code = getattr(e, 'status_code', None)
+
+    return isinstance(status_code, int) and status_code >= 500
@@ -0,0 +1,21 @@
+import litellm
+import pytest
+
+from src.modules.ai.circuit_breaker.helpers.is_provider_failure import is_provider_failure
+
+
+@pytest.mark.parametrize('error, expected', [
+    (litellm.Timeout('timeout', model='gpt-4o', llm_provider='openai'), True),
+    (litellm.APIConnectionError('connection', llm_provider='openai', model='gpt-4o'), True),
+    (litellm.InternalServerError('500', llm_provider='openai', model='gpt-4o'), True),
+    (litellm.ServiceUnavailableError('503', llm_provider='openai', model='gpt-4o'), True),
+    (TimeoutError(), True),
+    (litellm.BadRequestError('400', model='gpt-4o', llm_provider='openai'), False),
+    (litellm.ContextWindowExceededError('too long', model='gpt-4o', llm_provider='openai'), False),
+    (litellm.AuthenticationError('401', llm_provider='openai', model='gpt-4o'), False),
+    (litellm.NotFoundError('404', model='gpt-4o', llm_provider='openai'), False),
+    (litellm.RateLimitError('429', llm_provider='openai', model='gpt-4o'), False),
+    (ValueError('invalid'), False),
+])
+def test_is_provider_failure(error, expected):
+    assert is_provider_failure(error) == expected
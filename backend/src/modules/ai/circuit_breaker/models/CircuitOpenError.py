@@ -0,0 +1,9 @@
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling a model whose circuit is open.
+    """
+
+    def __init__(self, model: str, retry_after_seconds: float):
+        super().__init__(f'{model} is currently unavailable, try again in {retry_after_seconds:.0f} seconds')
+        self.model = model
+        self.retry_after_seconds = retry_after_seconds
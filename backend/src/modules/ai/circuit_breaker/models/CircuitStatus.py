@@ -0,0 +1,25 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+CircuitState = Literal['closed', 'open', 'half_open']
+'''
+- `closed`: calls go through, outcomes are tracked.
+- `open`: calls fail immediately, until the open period has passed.
+- `half_open`: a single trial call goes through, closing the circuit if it succeeds and reopening it otherwise.
+'''
+
+
+class CircuitStatus(BaseModel):
+    model: str
+    state: CircuitState
+    calls: int
+    '''
+    Calls in the current window.
+    '''
+    error_rate: float
+    slow_rate: float
+    retry_after_seconds: float | None
+    '''
+    When open, seconds until a trial call is allowed.
+    '''
@@ -0,0 +1,30 @@
+from typing import Protocol
+
+from src.modules.ai.circuit_breaker.models.CircuitStatus import CircuitStatus
+
+
+class ICircuitBreaker(Protocol):
+    """
+    Tracks the health of each model, so calls to a model that keeps failing
+    or responding slowly can fail fast instead of waiting for a timeout.
+    """
+
+    def check(self, model: str) -> None:
+        """
+        Call before calling the model.
+
+        :raises CircuitOpenError: If the model should not be called right now.
+        """
+        ...
+
+    def record_success(self, model: str, latency_seconds: float) -> None:
+        """
+        :param latency_seconds: Time to the first response from the model.
+        """
+        ...
+
+    def record_failure(self, model: str) -> None:
+        ...
+
+    async def get_statuses(self) -> list[CircuitStatus]:
+        ...
@@ -0,0 +1,14 @@
+import pytest
+
+from src.modules.ai.circuit_breaker.RollingWindowCircuitBreaker import RollingWindowCircuitBreaker
+from src.modules.ai.circuit_breaker.test_circuit_breaker import BaseCircuitBreakerTestClass
+
+
+@pytest.fixture
+def service():
+    return RollingWindowCircuitBreaker(window_seconds=60, min_calls=4, error_rate_threshold=0.5,
+                                       slow_call_seconds=1, slow_rate_threshold=1, open_seconds=0.05)
+
+
+class TestRollingWindowCircuitBreakerClass(BaseCircuitBreakerTestClass):
+    ...
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from src.modules.ai.circuit_breaker.models.CircuitOpenError import CircuitOpenError
+from src.modules.ai.circuit_breaker.protocols.ICircuitBreaker import ICircuitBreaker
+
+
+async def _statuses(service: ICircuitBreaker) -> dict:
+    return {s.model: s for s in await service.get_statuses()}
+
+
+class BaseCircuitBreakerTestClass:
+    """
+    Expects a circuit breaker opening after at least 4 calls with an error rate of 0.5,
+    or with all calls taking 1 second or more, and staying open for 0.05 seconds.
+    """
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_closed(service: ICircuitBreaker):
+        for _ in range(10):
+            service.check('openai/gpt-4o')
+            service.record_success('openai/gpt-4o', 0.1)
+        service.record_failure('openai/gpt-4o')
+
+        service.check('openai/gpt-4o')
+        status = (await _statuses(service))['openai/gpt-4o']
+        assert status.state == 'closed'
+        assert status.calls == 11
+        assert status.retry_after_seconds is None
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_opens_on_errors(service: ICircuitBreaker):
+        for _ in range(2):
+            service.record_success('openai/gpt-4o', 0.1)
+            service.record_failure('openai/gpt-4o')
+
+        with pytest.raises(CircuitOpenError):
+            service.check('openai/gpt-4o')
+
+        service.check('anthropic/claude-sonnet-4-5')
+
+        status = (await _statuses(service))['openai/gpt-4o']
+        assert status.state == 'open'
+        assert status.error_rate == 0.5
+        assert 0 < status.retry_after_seconds <= 0.05
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_opens_on_latency(service: ICircuitBreaker):
+        for _ in range(4):
+            service.record_success('openai/gpt-4o', 2)
+
+        with pytest.raises(CircuitOpenError):
+            service.check('openai/gpt-4o')
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_half_open_success(service: ICircuitBreaker):
+        for _ in range(4):
+            service.record_failure('openai/gpt-4o')
+        await asyncio.sleep(0.06)
+
+        service.check('openai/gpt-4o')
+
+        # only a single trial call at a time
+        with pytest.raises(CircuitOpenError):
+            service.check('openai/gpt-4o')
+        assert (await _statuses(service))['openai/gpt-4o'].state == 'half_open'
+
+        service.record_success('openai/gpt-4o', 0.1)
+
+        service.check('openai/gpt-4o')
+        assert (await _statuses(service))['openai/gpt-4o'].state == 'closed'
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_half_open_failure(service: ICircuitBreaker):
+        for _ in range(4):
+            service.record_failure('openai/gpt-4o')
+        await asyncio.sleep(0.06)
+
+        service.check('openai/gpt-4o')
+        service.record_failure('openai/gpt-4o')
+
+        with pytest.raises(CircuitOpenError):
+            service.check('openai/gpt-4o')
+        assert (await _statuses(service))['openai/gpt-4o'].state == 'open'
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_lost_trial(service: ICircuitBreaker):
+        for _ in range(4):
+            service.record_failure('openai/gpt-4o')
+        await asyncio.sleep(0.06)
+        service.check('openai/gpt-4o')
+
+        # the trial call never reported back
+        await asyncio.sleep(0.06)
+        service.check('openai/gpt-4o')
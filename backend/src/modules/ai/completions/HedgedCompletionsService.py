@@ -0,0 +1,101 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+from src.modules.ai.completions.models.Delta import Delta
+from src.modules.ai.completions.models.Feature import Feature
+from src.modules.ai.completions.models.Message import Message
+from src.modules.ai.completions.protocols.ICompletionsService import ICompletionsService
+from src.modules.ai.completions.protocols.IHedgeStatsService import IHedgeStatsService
+
+
+class HedgedCompletionsService(ICompletionsService):
+    """
+    Runs a chain of completions services, primary first. Whenever none of the started services
+    has produced a first delta within `ttft_deadline_seconds`, or all of them have failed,
+    the next one in the chain is started. The first service to produce a delta is streamed
+    and the others are cancelled.
+    """
+
+    def __init__(self, chain: list[tuple[str, ICompletionsService]], ttft_deadline_seconds: float | None,
+                 hedge_stats_service: IHedgeStatsService):
+        """
+        :param chain: Model name and service for the primary model followed by its fallbacks.
+        :param ttft_deadline_seconds: None to only start fallbacks when the services before them fail.
+        """
+        self._chain = chain
+        self._ttft_deadline_seconds = ttft_deadline_seconds
+        self._hedge_stats_service = hedge_stats_service
+
+    async def run_completions(
+            self,
+            messages: list[Message],
+            enabled_features: list[Feature],
+            extra_params: dict | None = None
+    ) -> AsyncGenerator[Delta, None]:
+        remaining = list(self._chain)
+        primary_model = remaining[0][0]
+        started: dict[asyncio.Task, tuple[str, AsyncGenerator[Delta, None]]] = {}
+        first_error: BaseException | None = None
+        deadline_passed = False
+
+        winner: AsyncGenerator[Delta, None] | None = None
+        first_delta: Delta | None = None
+
+        try:
+            while winner is None:
+                if len(remaining) > 0 and (len(started) == 0 or deadline_passed):
+                    if deadline_passed and len(remaining) == len(self._chain) - 1:
+                        self._hedge_stats_service.record_hedged(primary_model)
+
+                    model, service = remaining.pop(0)
+                    self._hedge_stats_service.record_started(model, fallback=model != primary_model)
+
+                    stream = service.run_completions(messages, enabled_features, extra_params)
+                    started[asyncio.create_task(self._first_delta(stream))] = (model, stream)
+
+                if len(started) == 0:
+                    raise first_error
+
+                done, _ = await asyncio.wait(
+                    started,
+                    timeout=self._ttft_deadline_seconds if len(remaining) > 0 else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                deadline_passed = len(done) == 0
+
+                # prefer the earliest started if several finished at the same time
+                for task in [t for t in started if t in done]:
+                    model, stream = started.pop(task)
+
+                    if task.exception() is not None:
+                        print(f'WARNING: Completions with {model} failed before the first delta: {task.exception()}')
+                        first_error = first_error or task.exception()
+                        await stream.aclose()
+                    elif winner is None:
+                        self._hedge_stats_service.record_won(model)
+                        winner, first_delta = stream, task.result()
+                    else:
+                        await stream.aclose()
+
+            if first_delta is not None:
+                yield first_delta
+                async for delta in winner:
+                    yield delta
+        finally:
+            for task in started:
+                task.cancel()
+            await asyncio.gather(*started, return_exceptions=True)
+
+            for _, stream in started.values():
+                await stream.aclose()
+            if winner is not None:
+                await winner.aclose()
+
+    @staticmethod
+    async def _first_delta(stream: AsyncGenerator[Delta, None]) -> Delta | None:
+        """
+        :return: None if the stream ended without any delta.
+        """
+        async for delta in stream:
+            return delta
+        return None
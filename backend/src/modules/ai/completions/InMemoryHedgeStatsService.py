@@ -0,0 +1,41 @@
+from collections import Counter
+
+from src.modules.ai.completions.models.ModelHedgeStats import ModelHedgeStats
+from src.modules.ai.completions.protocols.IHedgeStatsService import IHedgeStatsService
+
+
+class InMemoryHedgeStatsService(IHedgeStatsService):
+    """
+    Counts since startup, for this process only.
+    """
+
+    def __init__(self):
+        self._primary_requests: Counter[str] = Counter()
+        self._hedged_requests: Counter[str] = Counter()
+        self._fallback_requests: Counter[str] = Counter()
+        self._wins: Counter[str] = Counter()
+
+    def record_started(self, model: str, fallback: bool) -> None:
+        if fallback:
+            self._fallback_requests[model] += 1
+        else:
+            self._primary_requests[model] += 1
+
+    def record_hedged(self, model: str) -> None:
+        self._hedged_requests[model] += 1
+
+    def record_won(self, model: str) -> None:
+        self._wins[model] += 1
+
+    async def get_stats(self) -> list[ModelHedgeStats]:
+        models = sorted(set(self._primary_requests) | set(self._fallback_requests))
+
+        return [ModelHedgeStats(
+            model=model,
+            primary_requests=self._primary_requests[model],
+            hedged_requests=self._hedged_requests[model],
+            fallback_requests=self._fallback_requests[model],
+            wins=self._wins[model],
+            hedge_rate=self._hedged_requests[model] / max(1, self._primary_requests[model]),
+            win_rate=self._wins[model] / max(1, self._primary_requests[model] + self._fallback_requests[model]),
+        ) for model in models]
@@ -1,6 +1,5 @@
-import json
-import os
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
 
 import litellm
 from litellm import acompletion
@@ -8,32 +7,104 @@ from litellm.types.llms.openai import OpenAIWebSearchOptions, OpenAIWebSearchUse
     OpenAIWebSearchUserLocationApproximate
 from litellm.types.utils import ChatCompletionDeltaToolCall
 
+from src.modules.ai.circuit_breaker.helpers.is_provider_failure import is_provider_failure
+from src.modules.ai.circuit_breaker.protocols.ICircuitBreaker import ICircuitBreaker
+from src.modules.ai.completions.helpers.run_tool_calls import run_tool_calls
 from src.modules.ai.completions.models.Delta import Delta
 from src.modules.ai.completions.models.Feature import Feature
 from src.modules.ai.completions.models.Message import Message
 from src.modules.ai.completions.protocols.ICompletionsService import ICompletionsService
 from src.modules.ai.completions.tools.CompletionsToolsFactory import CompletionsToolsFactory
+from src.modules.ai.helpers.get_provider_api_key import get_provider_api_key
+from src.modules.ai.rate_limit.helpers.get_retry_delay import get_retry_delay
+from src.modules.ai.rate_limit.helpers.parse_retry_after import parse_retry_after
+from src.modules.ai.rate_limit.protocols.IRateLimiter import IRateLimiter
+from src.modules.models.protocols.IModelCapabilityService import IModelCapabilityService
 from src.modules.settings.protocols.ISettingsService import ISettingsService
 from src.modules.settings.settings import SettingKey
 
 
 class LiteLLMCompletionsService(ICompletionsService):
-    def __init__(self, settings_service: ISettingsService, tool_factory: CompletionsToolsFactory, model: str,
-                 api_key: str = ''):
+    def __init__(self, settings_service: ISettingsService, tool_factory: CompletionsToolsFactory,
+                 rate_limiter: IRateLimiter, circuit_breaker: ICircuitBreaker,
+                 model_capability_service: IModelCapabilityService, model: str, api_key: str = '',
+                 cache_tool_results: bool = True):
         self._settings_service = settings_service
         self._tool_factory = tool_factory
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._model_capability_service = model_capability_service
         self._model = model
         self._api_key = api_key
+        self._cache_tool_results = cache_tool_results
 
-    async def _set_api_keys(self):
-        os.environ['OPENAI_API_KEY'] = await self._settings_service.get_setting(SettingKey.OPENAI_API_KEY.key)
-        os.environ['MISTRAL_API_KEY'] = await self._settings_service.get_setting(SettingKey.MISTRAL_API_KEY.key)
-        os.environ['ANTHROPIC_API_KEY'] = await self._settings_service.get_setting(SettingKey.ANTHROPIC_API_KEY.key)
+    async def _start_completion(self, model: str, messages: list[dict], **kwargs):
+        """
+        Start a streaming completion once the rate limiter allows it. If the provider still
+        responds 429, retry after its Retry-After (or an exponential backoff) with jitter.
+        Nothing has been streamed at that point, so retrying is invisible to the caller.
 
-    async def _clear_api_keys(self):
-        os.environ.pop('OPENAI_API_KEY', None)
-        os.environ.pop('MISTRAL_API_KEY', None)
-        os.environ.pop('ANTHROPIC_API_KEY', None)
+        The outcome up to the first chunk is reported to the circuit breaker, client errors
+        (such as a bad request or an invalid key) are not held against the model.
+        """
+        max_retries = int(await self._settings_service.get_setting(
+            SettingKey.LLM_RATE_LIMIT_MAX_RETRIES.key, SettingKey.LLM_RATE_LIMIT_MAX_RETRIES.default))
+        max_retry_seconds = float(await self._settings_service.get_setting(
+            SettingKey.LLM_RATE_LIMIT_MAX_RETRY_SECONDS.key, SettingKey.LLM_RATE_LIMIT_MAX_RETRY_SECONDS.default))
+
+        # Counting tokens takes a while for long conversations, so it is only done once a tokens limit is known
+        estimated_tokens = 0
+        if self._rate_limiter.has_token_limit(model):
+            try:
+                estimated_tokens = litellm.token_counter(model=model, messages=messages)
+            except Exception:
+                estimated_tokens = sum(len(str(m.get('content') or '')) for m in messages) // 4
+
+            # providers count the requested output tokens against the limit as well
+            estimated_tokens += int(kwargs.get('max_tokens') or kwargs.get('max_completion_tokens') or 0)
+
+        attempt = 0
+        while True:
+            await self._rate_limiter.acquire(model, estimated_tokens)
+            started_at = time.monotonic()
+
+            try:
+                response = await acompletion(model=model, messages=messages, **kwargs)
+                break
+            except litellm.RateLimitError as e:
+                if attempt >= max_retries:
+                    self._circuit_breaker.record_failure(model)
+                    raise
+
+                headers = e.response.headers if e.response is not None else None
+                delay = get_retry_delay(attempt, parse_retry_after(headers), max_seconds=max_retry_seconds)
+                self._rate_limiter.back_off(model, delay)
+                attempt += 1
+
+                print(f'WARNING: Rate limited by {model}, retry {attempt}/{max_retries} in {delay:.1f}s.')
+            except Exception as e:
+                if is_provider_failure(e):
+                    self._circuit_breaker.record_failure(model)
+                raise
+
+        hidden_params = getattr(response, '_hidden_params', None) or {}
+        self._rate_limiter.observe_headers(model, hidden_params.get('additional_headers') or {})
+
+        return self._report_first_chunk(model, started_at, response)
+
+    async def _report_first_chunk(self, model: str, started_at: float, response: AsyncIterator) -> AsyncIterator:
+        reported = False
+
+        try:
+            async for chunk in response:
+                if not reported:
+                    reported = True
+                    self._circuit_breaker.record_success(model, time.monotonic() - started_at)
+                yield chunk
+        except Exception as e:
+            if not reported and is_provider_failure(e):
+                self._circuit_breaker.record_failure(model)
+            raise
 
     async def run_completions(
             self,
@@ -41,56 +112,75 @@ class LiteLLMCompletionsService(ICompletionsService):
             enabled_features: list[Feature],
             extra_params: dict | None = None
     ) -> AsyncGenerator[Delta, None]:
-        try:
-            await self._set_api_keys()
-            model = self._model.replace(':', '/')  # patch for old model format
-
-            web_search_requested = Feature.WEB_SEARCH in enabled_features
-            web_search_enabled = web_search_requested and litellm.supports_web_search(model)
-            web_search_options = OpenAIWebSearchOptions(
-                search_context_size='medium',
-                user_location=OpenAIWebSearchUserLocation(
-                    type='approximate',
-                    approximate=OpenAIWebSearchUserLocationApproximate(
-                        city='',
-                        country='SE',
-                        region='',
-                        timezone='Europe/Stockholm',
-                    )
+        capabilities = await self._model_capability_service.get_capabilities(self._model)
+        model = capabilities.litellm_model
+
+        # fail fast (or let the hedged service move on to a fallback) while the model is unhealthy
+        self._circuit_breaker.check(model)
+
+        web_search_requested = Feature.WEB_SEARCH in enabled_features
+        web_search_enabled = web_search_requested and capabilities.supports_web_search
+        web_search_options = OpenAIWebSearchOptions(
+            search_context_size='medium',
+            user_location=OpenAIWebSearchUserLocation(
+                type='approximate',
+                approximate=OpenAIWebSearchUserLocationApproximate(
+                    city='',
+                    country='SE',
+                    region='',
+                    timezone='Europe/Stockholm',
                 )
             )
+        )
 
-            if web_search_requested and not web_search_enabled:
-                print(f'WARNING: Web search was requested but is not supported by this model ({model}).')
+        if web_search_requested and not web_search_enabled:
+            print(f'WARNING: Web search was requested but is not supported by this model ({model}).')
 
-            reasoning_requested = Feature.REASONING in enabled_features
-            reasoning_enabled = reasoning_requested and litellm.supports_reasoning(model)
+        reasoning_requested = Feature.REASONING in enabled_features
+        reasoning_enabled = reasoning_requested and capabilities.supports_reasoning
 
-            if reasoning_requested and not reasoning_enabled:
-                print(f'WARNING: Reasoning was requested but is not supported by this model ({model}).')
+        if reasoning_requested and not reasoning_enabled:
+            print(f'WARNING: Reasoning was requested but is not supported by this model ({model}).')
 
-            messages = [
-                m.model_dump(include={'role', 'content', 'tool_calls', 'tool_call_id'}, exclude_none=True)
-                for m in messages
+        messages = [
+            m.model_dump(include={'role', 'content', 'tool_calls', 'tool_call_id'}, exclude_none=True)
+            for m in messages
 
-                # system content has to be non-empty for some models like Claude
-                if m.role != 'system' or (m.content is not None and len(m.content) > 0)
-            ]
+            # system content has to be non-empty for some models like Claude
+            if m.role != 'system' or (m.content is not None and len(m.content) > 0)
+        ]
+
+        tools = self._tool_factory.get_tools(enabled_features=enabled_features)
+
+        max_steps = max(1, int(await self._settings_service.get_setting(
+            SettingKey.LLM_TOOL_MAX_STEPS.key, SettingKey.LLM_TOOL_MAX_STEPS.default)))
+        tool_timeout_seconds = float(await self._settings_service.get_setting(
+            SettingKey.LLM_TOOL_TIMEOUT_SECONDS.key, SettingKey.LLM_TOOL_TIMEOUT_SECONDS.default))
 
-            tools = self._tool_factory.get_tools(enabled_features=enabled_features)
+        api_key = self._api_key or await get_provider_api_key(self._settings_service, model)
+
+        for step in range(max_steps):
+            if len(tools) == 0:
+                tool_params = {}
+            elif step > 0 and step == max_steps - 1:
+                # out of steps, the model has to answer with what it has
+                tool_params = {'tools': tools, 'tool_choice': 'none'}
+            else:
+                tool_params = {
+                    'tools': tools,
+                    'parallel_tool_calls': True,
+                    # the first step has to call a tool, after that the model decides
+                    'tool_choice': 'required' if step == 0 else 'auto'
+                }
 
-            response = await acompletion(
+            response = await self._start_completion(
                 model=model,
                 messages=messages,
                 stream=True,
-                api_key=self._api_key,
+                api_key=api_key,
                 reasoning_effort='medium' if reasoning_enabled else None,
 
-                **{
-                    'tools': tools,
-                    'parallel_tool_calls': False,
-                    'tool_choice': 'required'
-                } if len(tools) > 0 else {},
+                **tool_params,
 
                 # workaround for a bug in tool_call_cost_tracking.py:_get_web_search_options(kwargs) when explicitly setting value to None
                 **{'web_search_options': web_search_options} if web_search_enabled else {},
@@ -98,10 +188,10 @@ class LiteLLMCompletionsService(ICompletionsService):
                 **(extra_params if extra_params else {})
             )
 
-            role: str | None = None
-            tool_call_id: str | None = None
-            tool_call_function_name: str | None = None
-            tool_call_function_arguments: str = ''
+            role: str = 'assistant'
+            content: str = ''
+            # tool calls by their index in the response, arguments are streamed in pieces
+            tool_calls: dict[int, dict] = {}
 
             async for output in response:
                 if not output or len(output.choices) == 0:
@@ -110,22 +200,25 @@ class LiteLLMCompletionsService(ICompletionsService):
                 delta = output.choices[0].delta
                 role = delta.role or role
 
-                # Handle accumulating tool call
-                tool_calls: list[ChatCompletionDeltaToolCall] = delta.tool_calls
-                if tool_calls is not None and len(tool_calls) > 0:
-                    tool_call_delta = tool_calls[0]
+                # Handle accumulating tool calls
+                tool_call_deltas: list[ChatCompletionDeltaToolCall] = delta.tool_calls
+                for tool_call_delta in tool_call_deltas or []:
+                    index = tool_call_delta.index if tool_call_delta.index is not None else len(tool_calls)
+                    tool_call = tool_calls.setdefault(index, {
+                        'id': None,
+                        'type': 'function',
+                        'function': {'name': None, 'arguments': ''}
+                    })
+
                     if tool_call_delta.id is not None:
-                        if tool_call_delta.id != tool_call_id:
-                            tool_call_function_name = None
-                            tool_call_function_arguments = ''
-                        tool_call_id = tool_call_delta.id
+                        tool_call['id'] = tool_call_delta.id
                     if tool_call_delta.function.name is not None:
-                        tool_call_function_name = tool_call_delta.function.name
+                        tool_call['function']['name'] = tool_call_delta.function.name
                         yield Delta(
                             role='assistant',
-                            reasoning_content=f'(calling tool {tool_call_function_name})'
+                            reasoning_content=f'(calling tool {tool_call_delta.function.name})'
                         )
-                    tool_call_function_arguments += tool_call_delta.function.arguments
+                    tool_call['function']['arguments'] += tool_call_delta.function.arguments or ''
 
                 # Handle reasoning
                 if hasattr(delta, 'reasoning_content') and delta.reasoning_content is not None and len(
@@ -137,52 +230,55 @@ class LiteLLMCompletionsService(ICompletionsService):
 
                 # Handle normal content
                 if delta.content is not None and len(delta.content) > 0:
+                    content += delta.content
                     yield Delta(
                         role=role,
                         content=delta.content,
                     )
 
-            # Handle calling tool
-            if tool_call_id is not None:
-                yield Delta(
-                    role=role,
-                    tool_calls=[{
-                        'id': tool_call_id,
-                        'type': 'function',
-                        'function': {
-                            'name': tool_call_function_name,
-                            'arguments': tool_call_function_arguments,
-                        }
-                    }]
-                )
-                tool = self._tool_factory.get_tool_by_name(function_name=tool_call_function_name)
-                if tool is not None:
-                    print(f'Calling tool "{tool_call_function_name}" with args: {tool_call_function_arguments}...')
-                    args = json.loads(tool_call_function_arguments) if len(tool_call_function_arguments) > 0 else {}
-                    tool_result = await tool.call_tool(args=args)
-
-                    if tool.get_should_feedback_into_llm():
-                        yield Delta(
-                            role='tool',
-                            tool_call_id=tool_call_id,
-                            content=tool_result.result,
-                            context_message_override=tool_result.context_message_override
-                        )
-                        # TODO: call run_completions again with tool result as the last message
+            if len(tool_calls) == 0:
+                return
 
-                    else:
-                        yield Delta(
-                            role='tool',
-                            tool_call_id=tool_call_id,
-                            content=tool_result.result,
-                            context_message_override=tool_result.context_message_override
-                        )
+            # Handle calling tools
+            calls = [tool_calls[index] for index in sorted(tool_calls.keys())]
+            yield Delta(
+                role=role,
+                tool_calls=calls
+            )
 
-                else:
+            tools_to_call = [self._tool_factory.get_tool_by_name(function_name=c['function']['name']) for c in calls]
+            for call, tool in zip(calls, tools_to_call):
+                if tool is None:
                     yield Delta(
                         role='error',
-                        content=f'Call to tool "{tool_call_function_name}" requested but not found.'
+                        content=f'Call to tool "{call["function"]["name"]}" requested but not found.'
                     )
+                    return
+
+            tool_results = await run_tool_calls(
+                tool_calls=[(tool, call['function']['arguments']) for call, tool in zip(calls, tools_to_call)],
+                timeout_seconds=tool_timeout_seconds,
+                use_cache=self._cache_tool_results
+            )
+
+            for call, tool_result in zip(calls, tool_results):
+                yield Delta(
+                    role='tool',
+                    tool_call_id=call['id'],
+                    content=tool_result.result,
+                    context_message_override=tool_result.context_message_override
+                )
+
+            # Tools like image generation are meant for the user only, the answer is complete
+            if not any(tool.get_should_feedback_into_llm() for tool in tools_to_call):
+                return
 
-        finally:
-            await self._clear_api_keys()
+            messages = [
+                *messages,
+                {'role': 'assistant', 'content': content or None, 'tool_calls': calls},
+                *[{
+                    'role': 'tool',
+                    'tool_call_id': call['id'],
+                    'content': tool_result.context_message_override or tool_result.result
+                } for call, tool_result in zip(calls, tool_results)]
+            ]
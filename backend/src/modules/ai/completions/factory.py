@@ -1,18 +1,57 @@
+from src.modules.ai.circuit_breaker.protocols.ICircuitBreaker import ICircuitBreaker
+from src.modules.ai.completions.HedgedCompletionsService import HedgedCompletionsService
+from src.modules.ai.completions.InMemoryHedgeStatsService import InMemoryHedgeStatsService
 from src.modules.ai.completions.LiteLLMCompletionsService import LiteLLMCompletionsService
 from src.modules.ai.completions.protocols import ICompletionsService
+from src.modules.ai.completions.protocols.IHedgeStatsService import IHedgeStatsService
 from src.modules.ai.completions.tools.CompletionsToolsFactory import CompletionsToolsFactory
+from src.modules.ai.rate_limit.protocols.IRateLimiter import IRateLimiter
+from src.modules.models.protocols.IModelCapabilityService import IModelCapabilityService
 from src.modules.settings.protocols.ISettingsService import ISettingsService
 
 
 class CompletionsServiceFactory:
-    def __init__(self, setting_service: ISettingsService, completions_tools_factory: CompletionsToolsFactory):
+    def __init__(self, setting_service: ISettingsService, completions_tools_factory: CompletionsToolsFactory,
+                 rate_limiter: IRateLimiter, circuit_breaker: ICircuitBreaker,
+                 model_capability_service: IModelCapabilityService, hedge_stats_service: IHedgeStatsService):
         self._setting_service = setting_service
         self._completions_tools_factory = completions_tools_factory
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._model_capability_service = model_capability_service
+        self._hedge_stats_service = hedge_stats_service
 
-    def get(self, model: str, api_key: str) -> ICompletionsService:
+    def get(self, model: str, api_key: str, fallback_models: list[str] | None = None,
+            ttft_deadline_seconds: float | None = None, cache_tool_results: bool = True) -> ICompletionsService:
+        """
+        :param api_key: Only used for `model`, fallback models use the configured provider keys.
+        :param fallback_models: Models to try, in order, if `model` fails or misses `ttft_deadline_seconds`.
+        :param cache_tool_results: False to never reuse results of earlier identical tool calls.
+        """
+        service = self._get_litellm_service(model, api_key, cache_tool_results)
+
+        if not fallback_models:
+            return service
+
+        return HedgedCompletionsService(
+            chain=[(model, service), *[(m, self._get_litellm_service(m, '', cache_tool_results)) for m in fallback_models]],
+            ttft_deadline_seconds=ttft_deadline_seconds,
+            hedge_stats_service=self._hedge_stats_service
+        )
+
+    def _get_litellm_service(self, model: str, api_key: str, cache_tool_results: bool) -> ICompletionsService:
         return LiteLLMCompletionsService(
             settings_service=self._setting_service,
             tool_factory=self._completions_tools_factory,
+            rate_limiter=self._rate_limiter,
+            circuit_breaker=self._circuit_breaker,
+            model_capability_service=self._model_capability_service,
             model=model,
-            api_key=api_key
+            api_key=api_key,
+            cache_tool_results=cache_tool_results
         )
+
+
+class HedgeStatsServiceFactory:
+    def get(self) -> IHedgeStatsService:
+        return InMemoryHedgeStatsService()
@@ -0,0 +1,35 @@
+import asyncio
+import json
+
+from src.modules.ai.completions.models.ToolCallResult import ToolCallResult
+from src.modules.ai.completions.protocols.ITool import ITool
+
+
+async def run_tool_calls(tool_calls: list[tuple[ITool, str]], timeout_seconds: float,
+                         use_cache: bool = True) -> list[ToolCallResult]:
+    """
+    Run tool calls concurrently, so the total time is that of the slowest one.
+
+    A call that times out, fails or has invalid arguments results in an error message
+    instead, so the model can still answer with the results of the others.
+
+    :param tool_calls: The tools to call and their JSON encoded arguments.
+    :param use_cache: Passed on to the tools, False to not reuse results of earlier identical calls.
+    :return: Results in the same order as `tool_calls`.
+    """
+
+    async def _call(tool: ITool, arguments: str) -> ToolCallResult:
+        name = tool.get_tool_definition()['function']['name']
+        print(f'Calling tool "{name}" with args: {arguments}...')
+
+        try:
+            args = json.loads(arguments) if len(arguments) > 0 else {}
+            return await asyncio.wait_for(tool.call_tool(args=args, use_cache=use_cache), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            print(f'WARNING: tool "{name}" timed out after {timeout_seconds}s')
+            return ToolCallResult(result=f'Error: the tool "{name}" did not respond in time.')
+        except Exception as e:
+            print(f'WARNING: tool "{name}" failed: {e}')
+            return ToolCallResult(result=f'Error: the tool "{name}" failed.')
+
+    return list(await asyncio.gather(*[_call(tool, arguments) for tool, arguments in tool_calls]))
@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+import pytest
+
+from src.modules.ai.completions.helpers.run_tool_calls import run_tool_calls
+from src.modules.ai.completions.models.ToolCallResult import ToolCallResult
+
+
+class _SleepTool:
+    def get_tool_definition(self) -> dict:
+        return {'type': 'function', 'function': {'name': 'sleep'}}
+
+    async def call_tool(self, args: dict, use_cache: bool = True) -> ToolCallResult:
+        await asyncio.sleep(args['seconds'])
+        if args.get('fail'):
+            raise RuntimeError('failed')
+        return ToolCallResult(result=f'slept {args["seconds"]}')
+
+    def get_should_feedback_into_llm(self) -> bool:
+        return True
+
+
+@pytest.mark.asyncio
+async def test_run_tool_calls_concurrently():
+    tool = _SleepTool()
+    started_at = time.monotonic()
+
+    results = await run_tool_calls([(tool, '{"seconds": 0.2}'), (tool, '{"seconds": 0.1}')], timeout_seconds=5)
+
+    assert [r.result for r in results] == ['slept 0.2', 'slept 0.1']
+    assert time.monotonic() - started_at < 0.29
+
+
+@pytest.mark.asyncio
+async def test_run_tool_calls_errors():
+    tool = _SleepTool()
+
+    results = await run_tool_calls([
+        (tool, '{"seconds": 1}'),
+        (tool, '{"seconds": 0, "fail": true}'),
+        (tool, '{"seconds":'),
+        (tool, '{"seconds": 0}'),
+    ], timeout_seconds=0.1)
+
+    assert [r.result for r in results] == [
+        'Error: the tool "sleep" did not respond in time.',
+        'Error: the tool "sleep" failed.',
+        'Error: the tool "sleep" failed.',
+        'slept 0',
+    ]
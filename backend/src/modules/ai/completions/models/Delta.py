@@ -1,7 +1,12 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class Delta(BaseModel):
+@dataclass(slots=True)
+class Delta:
+    """
+    A single streamed piece of a completion. Created once per token, so a plain slotted
+    dataclass instead of a pydantic model.
+    """
     role: str
     content: str | None = None
     reasoning_content: str | None = None
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+
+class ModelHedgeStats(BaseModel):
+    model: str
+    primary_requests: int
+    '''
+    Requests where the model was tried first.
+    '''
+    hedged_requests: int
+    '''
+    Primary requests where the model did not produce a first delta in time, so a fallback was started.
+    '''
+    fallback_requests: int
+    '''
+    Requests where the model was started as a fallback.
+    '''
+    wins: int
+    '''
+    Requests (primary or fallback) that were answered by the model.
+    '''
+    hedge_rate: float
+    win_rate: float
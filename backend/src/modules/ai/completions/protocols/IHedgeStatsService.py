@@ -0,0 +1,24 @@
+from typing import Protocol
+
+from src.modules.ai.completions.models.ModelHedgeStats import ModelHedgeStats
+
+
+class IHedgeStatsService(Protocol):
+    """
+    Counters for hedged completions, per model.
+    """
+
+    def record_started(self, model: str, fallback: bool) -> None:
+        ...
+
+    def record_hedged(self, model: str) -> None:
+        """
+        The primary `model` missed its time to first token deadline.
+        """
+        ...
+
+    def record_won(self, model: str) -> None:
+        ...
+
+    async def get_stats(self) -> list[ModelHedgeStats]:
+        ...
@@ -7,7 +7,10 @@ class ITool(Protocol):
     def get_tool_definition(self) -> dict:
         ...
 
-    async def call_tool(self, args: dict) -> ToolCallResult:
+    async def call_tool(self, args: dict, use_cache: bool = True) -> ToolCallResult:
+        """
+        :param use_cache: False if the result must not be a cached one from an earlier identical call.
+        """
         ...
 
     def get_should_feedback_into_llm(self) -> bool:
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from src.modules.ai.completions.HedgedCompletionsService import HedgedCompletionsService
+from src.modules.ai.completions.InMemoryHedgeStatsService import InMemoryHedgeStatsService
+from src.modules.ai.completions.models.Delta import Delta
+
+
+class _CompletionsService:
+    def __init__(self, name: str, ttft_seconds: float, fail: bool = False):
+        self._name = name
+        self._ttft_seconds = ttft_seconds
+        self._fail = fail
+        self.closed = False
+
+    async def run_completions(self, messages, enabled_features, extra_params=None):
+        try:
+            await asyncio.sleep(self._ttft_seconds)
+            if self._fail:
+                raise RuntimeError(f'{self._name} failed')
+            for i in range(3):
+                yield Delta(role='assistant', content=f'{self._name}{i}')
+        finally:
+            self.closed = True
+
+
+async def _run(chain: list[_CompletionsService], ttft_deadline_seconds: float | None,
+               stats: InMemoryHedgeStatsService | None = None) -> list[str]:
+    service = HedgedCompletionsService(
+        chain=[(s._name, s) for s in chain],
+        ttft_deadline_seconds=ttft_deadline_seconds,
+        hedge_stats_service=stats or InMemoryHedgeStatsService()
+    )
+    return [d.content async for d in service.run_completions(messages=[], enabled_features=[])]
+
+
+@pytest.mark.asyncio
+async def test_hedged_completions_primary_in_time():
+    stats = InMemoryHedgeStatsService()
+    primary, fallback = _CompletionsService('a', 0), _CompletionsService('b', 0)
+
+    assert await _run([primary, fallback], 0.05, stats) == ['a0', 'a1', 'a2']
+
+    result = {s.model: s for s in await stats.get_stats()}
+    assert result['a'].primary_requests == 1
+    assert result['a'].hedged_requests == 0
+    assert result['a'].wins == 1
+    assert 'b' not in result
+
+
+@pytest.mark.asyncio
+async def test_hedged_completions_fallback_wins():
+    stats = InMemoryHedgeStatsService()
+    primary, fallback = _CompletionsService('a', 0.5), _CompletionsService('b', 0)
+
+    assert await _run([primary, fallback], 0.02, stats) == ['b0', 'b1', 'b2']
+    assert primary.closed
+
+    result = {s.model: s for s in await stats.get_stats()}
+    assert result['a'].hedged_requests == 1
+    assert result['a'].wins == 0
+    assert result['b'].fallback_requests == 1
+    assert result['b'].wins == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_completions_slow_primary_still_wins():
+    primary, fallback = _CompletionsService('a', 0.04), _CompletionsService('b', 0.5)
+
+    assert await _run([primary, fallback], 0.02) == ['a0', 'a1', 'a2']
+    assert fallback.closed
+
+
+@pytest.mark.asyncio
+async def test_hedged_completions_fallback_on_failure():
+    primary, fallback = _CompletionsService('a', 0, fail=True), _CompletionsService('b', 0)
+
+    assert await _run([primary, fallback], None) == ['b0', 'b1', 'b2']
+
+
+@pytest.mark.asyncio
+async def test_hedged_completions_all_fail():
+    chain = [_CompletionsService('a', 0, fail=True), _CompletionsService('b', 0, fail=True)]
+
+    with pytest.raises(RuntimeError, match='a failed'):
+        await _run(chain, 0.02)
+
+
+@pytest.mark.asyncio
+async def test_hedged_completions_chain():
+    chain = [_CompletionsService('a', 1), _CompletionsService('b', 1), _CompletionsService('c', 0)]
+
+    assert await _run(chain, 0.01) == ['c0', 'c1', 'c2']
+    assert chain[0].closed and chain[1].closed
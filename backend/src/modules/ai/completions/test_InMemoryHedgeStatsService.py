@@ -0,0 +1,13 @@
+import pytest
+
+from src.modules.ai.completions.InMemoryHedgeStatsService import InMemoryHedgeStatsService
+from src.modules.ai.completions.test_hedge_stats_service import BaseHedgeStatsServiceTestClass
+
+
+@pytest.fixture
+def service():
+    return InMemoryHedgeStatsService()
+
+
+class TestInMemoryHedgeStatsServiceClass(BaseHedgeStatsServiceTestClass):
+    ...
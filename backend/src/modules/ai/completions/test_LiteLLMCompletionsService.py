@@ -0,0 +1,116 @@
+import litellm
+import pytest
+
+from src.modules.ai.circuit_breaker.RollingWindowCircuitBreaker import RollingWindowCircuitBreaker
+from src.modules.ai.circuit_breaker.models.CircuitOpenError import CircuitOpenError
+from src.modules.ai.completions.LiteLLMCompletionsService import LiteLLMCompletionsService
+from src.modules.ai.completions.models.Message import Message
+from src.modules.ai.rate_limit.TokenBucketRateLimiter import TokenBucketRateLimiter
+from src.modules.models.models.ModelCapabilities import ModelCapabilities
+
+
+class _SettingsService:
+    async def get_setting(self, key: str, fallback_value=None):
+        return fallback_value
+
+
+class _ToolFactory:
+    def get_tools(self, enabled_features):
+        return []
+
+
+class _ModelCapabilityService:
+    async def get_capabilities(self, model: str):
+        return ModelCapabilities(key=model, litellm_model=model)
+
+
+class _RecordingRateLimiter(TokenBucketRateLimiter):
+    def __init__(self):
+        super().__init__()
+        self.acquired_tokens: list[int] = []
+
+    async def acquire(self, model: str, tokens: int) -> None:
+        self.acquired_tokens.append(tokens)
+        await super().acquire(model, tokens)
+
+
+def _make_service(rate_limiter: TokenBucketRateLimiter,
+                  circuit_breaker: RollingWindowCircuitBreaker) -> LiteLLMCompletionsService:
+    return LiteLLMCompletionsService(
+        settings_service=_SettingsService(),
+        tool_factory=_ToolFactory(),
+        rate_limiter=rate_limiter,
+        circuit_breaker=circuit_breaker,
+        model_capability_service=_ModelCapabilityService(),
+        model='openai/gpt-4o',
+        api_key='key'
+    )
+
+
+async def _run_failing_completions(monkeypatch, error: Exception, calls: int) -> RollingWindowCircuitBreaker:
+    async def _acompletion(**kwargs):
+        raise error
+
+    monkeypatch.setattr('src.modules.ai.completions.LiteLLMCompletionsService.acompletion', _acompletion)
+
+    circuit_breaker = RollingWindowCircuitBreaker(min_calls=2)
+    service = _make_service(TokenBucketRateLimiter(), circuit_breaker)
+
+    for _ in range(calls):
+        with pytest.raises(type(error)):
+            async for _ in service.run_completions([Message(role='user', content='hi')], []):
+                pass
+
+    return circuit_breaker
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('error', [
+    litellm.BadRequestError('bad request', model='gpt-4o', llm_provider='openai'),
+    litellm.ContextWindowExceededError('too long', model='gpt-4o', llm_provider='openai'),
+    litellm.AuthenticationError('invalid key', llm_provider='openai', model='gpt-4o'),
+])
+async def test_client_errors_do_not_open_circuit(monkeypatch, error):
+    circuit_breaker = await _run_failing_completions(monkeypatch, error, calls=4)
+
+    circuit_breaker.check('openai/gpt-4o')
+    assert await circuit_breaker.get_statuses() == []
+
+
+@pytest.mark.asyncio
+async def test_provider_errors_open_circuit(monkeypatch):
+    error = litellm.ServiceUnavailableError('unavailable', llm_provider='openai', model='gpt-4o')
+    circuit_breaker = await _run_failing_completions(monkeypatch, error, calls=2)
+
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.check('openai/gpt-4o')
+
+
+@pytest.mark.asyncio
+async def test_tokens_counted_once_limit_is_known(monkeypatch):
+    async def _acompletion(**kwargs):
+        raise litellm.BadRequestError('bad request', model='gpt-4o', llm_provider='openai')
+
+    counted: list[str] = []
+
+    def _token_counter(model: str, messages: list[dict]) -> int:
+        counted.append(model)
+        return 42
+
+    monkeypatch.setattr('src.modules.ai.completions.LiteLLMCompletionsService.acompletion', _acompletion)
+    monkeypatch.setattr(litellm, 'token_counter', _token_counter)
+
+    rate_limiter = _RecordingRateLimiter()
+    service = _make_service(rate_limiter, RollingWindowCircuitBreaker())
+
+    async def run():
+        with pytest.raises(litellm.BadRequestError):
+            async for _ in service.run_completions([Message(role='user', content='hi')], []):
+                pass
+
+    await run()
+    rate_limiter.observe_headers('openai/gpt-4o', {'x-ratelimit-limit-tokens': '10000'})
+    await run()
+
+    assert counted == ['openai/gpt-4o']
+    assert rate_limiter.acquired_tokens == [0, 42]
@@ -0,0 +1,31 @@
+import pytest
+
+from src.modules.ai.completions.protocols.IHedgeStatsService import IHedgeStatsService
+
+
+class BaseHedgeStatsServiceTestClass:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_hedge_stats_empty(service: IHedgeStatsService):
+        assert await service.get_stats() == []
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_hedge_stats(service: IHedgeStatsService):
+        for _ in range(4):
+            service.record_started('openai/gpt-4o', fallback=False)
+        service.record_hedged('openai/gpt-4o')
+        service.record_started('anthropic/claude-sonnet-4-5', fallback=True)
+        service.record_won('anthropic/claude-sonnet-4-5')
+        for _ in range(3):
+            service.record_won('openai/gpt-4o')
+
+        stats = {s.model: s for s in await service.get_stats()}
+
+        assert stats['openai/gpt-4o'].primary_requests == 4
+        assert stats['openai/gpt-4o'].hedged_requests == 1
+        assert stats['openai/gpt-4o'].hedge_rate == 0.25
+        assert stats['openai/gpt-4o'].win_rate == 0.75
+        assert stats['anthropic/claude-sonnet-4-5'].fallback_requests == 1
+        assert stats['anthropic/claude-sonnet-4-5'].primary_requests == 0
+        assert stats['anthropic/claude-sonnet-4-5'].win_rate == 1
@@ -2,15 +2,18 @@ from src.modules.ai.completions.models.Feature import Feature
 from src.modules.ai.completions.protocols.ITool import ITool
 from src.modules.ai.completions.tools.ImageGenTool import ImageGenTool
 from src.modules.ai.image_gen.factory import ImageGeneratorServiceFactory
+from src.modules.ai.image_gen.protocols.IImageCacheService import IImageCacheService
+from src.modules.image_store.protocols.IImageStoreService import IImageStoreService
 
 
 class CompletionsToolsFactory:
     _tools: dict[str, ITool]
 
-    def __init__(self, image_generator_factory: ImageGeneratorServiceFactory):
+    def __init__(self, image_generator_factory: ImageGeneratorServiceFactory, image_store_service: IImageStoreService,
+                 image_cache_service: IImageCacheService):
         self._tools = {}
         # Add more tools here
-        self._add_tool('imagegen', ImageGenTool(image_generator_factory))
+        self._add_tool('imagegen', ImageGenTool(image_generator_factory, image_store_service, image_cache_service))
 
     def get_tools(self, enabled_features: list[Feature]) -> list[dict]:
         tools: list[dict] = []
@@ -1,13 +1,22 @@
+import base64
 import json
 
 from src.modules.ai.completions.models.ToolCallResult import ToolCallResult
 from src.modules.ai.completions.protocols.ITool import ITool
 from src.modules.ai.image_gen.factory import ImageGeneratorServiceFactory
+from src.modules.ai.image_gen.helpers.make_image_cache_key import make_image_cache_key
+from src.modules.ai.image_gen.protocols.IImageCacheService import IImageCacheService
+from src.modules.image_store.protocols.IImageStoreService import IImageStoreService
 
 
 class ImageGenTool(ITool):
-    def __init__(self, image_generator_factory: ImageGeneratorServiceFactory):
+    _MODEL = 'openai/dall-e-3'
+
+    def __init__(self, image_generator_factory: ImageGeneratorServiceFactory, image_store_service: IImageStoreService,
+                 image_cache_service: IImageCacheService):
         self.image_generator_factory = image_generator_factory
+        self.image_store_service = image_store_service
+        self.image_cache_service = image_cache_service
 
     def get_tool_definition(self) -> dict:
         return {
@@ -30,13 +39,32 @@ class ImageGenTool(ITool):
             }
         }
 
-    async def call_tool(self, args: dict) -> ToolCallResult:
-        generator = self.image_generator_factory.get(model='openai/dall-e-3')
-        b64 = await generator.generate_by_text(args['prompt'])
+    async def call_tool(self, args: dict, use_cache: bool = True) -> ToolCallResult:
+        size = self._get_size(args['width'], args['height'])
+        key = make_image_cache_key(self._MODEL, args['prompt'], {'size': size})
+        image_id = await self.image_cache_service.get_image_id(key) if use_cache else None
+
+        if image_id is None:
+            generator = self.image_generator_factory.get(model=self._MODEL)
+            b64 = await generator.generate_by_text(args['prompt'], size=size)
+
+            # Only reference the image, so it isn't copied into the conversation
+            image_id = await self.image_store_service.store_image(base64.b64decode(b64), 'image/png')
+            await self.image_cache_service.set_image_id(key, image_id)
+
         return ToolCallResult(
-            result=f'![{args["prompt"][0:15]}](data:image/png;base64,{b64})',
+            result=f'![{args["prompt"][0:15]}](/api/image/{image_id})',
             context_message_override='{"message": "generated an image", "generation_args":' + json.dumps(args) + '}'
         )
 
     def get_should_feedback_into_llm(self) -> bool:
         return False
+
+    @staticmethod
+    def _get_size(width: int, height: int) -> str:
+        # The sizes DALL-E 3 supports, picked by orientation
+        if width > height:
+            return '1792x1024'
+        if height > width:
+            return '1024x1792'
+        return '1024x1024'
@@ -0,0 +1,80 @@
+import base64
+
+import pytest
+
+from src.modules.ai.completions.tools.ImageGenTool import ImageGenTool
+from src.modules.ai.image_gen.InMemoryImageCacheService import InMemoryImageCacheService
+
+
+class _ImageGeneratorService:
+    def __init__(self, calls: list[tuple[str, str | None]]):
+        self._calls = calls
+
+    async def generate_by_text(self, prompt: str, size: str | None = None, quality: str | None = None) -> str:
+        self._calls.append((prompt, size))
+        return base64.b64encode(f'image {len(self._calls)}'.encode()).decode('ascii')
+
+
+class _ImageGeneratorServiceFactory:
+    def __init__(self):
+        self.calls: list[tuple[str, str | None]] = []
+
+    def get(self, model: str) -> _ImageGeneratorService:
+        return _ImageGeneratorService(self.calls)
+
+
+class _ImageStoreService:
+    def __init__(self):
+        self.images: dict[str, bytes] = {}
+
+    async def store_image(self, data: bytes, content_type: str) -> str:
+        image_id = f'id{len(self.images)}'
+        self.images[image_id] = data
+        return image_id
+
+
+def _args(prompt: str, width: int = 512, height: int = 512) -> dict:
+    return {'prompt': prompt, 'width': width, 'height': height}
+
+
+@pytest.mark.asyncio
+async def test_call_tool_cached():
+    generator_factory = _ImageGeneratorServiceFactory()
+    store = _ImageStoreService()
+    tool = ImageGenTool(generator_factory, store, InMemoryImageCacheService())
+
+    first = await tool.call_tool(_args('City logo'))
+    again = await tool.call_tool(_args('city  logo'))
+    other = await tool.call_tool(_args('another logo'))
+
+    assert first.result == '![City logo](/api/image/id0)'
+    assert again.result == '![city  logo](/api/image/id0)'
+    assert other.result == '![another logo](/api/image/id1)'
+    assert generator_factory.calls == [('City logo', '1024x1024'), ('another logo', '1024x1024')]
+    assert store.images == {'id0': b'image 1', 'id1': b'image 2'}
+
+
+@pytest.mark.asyncio
+async def test_call_tool_cached_by_size():
+    generator_factory = _ImageGeneratorServiceFactory()
+    tool = ImageGenTool(generator_factory, _ImageStoreService(), InMemoryImageCacheService())
+
+    await tool.call_tool(_args('City logo', width=1600, height=900))
+    await tool.call_tool(_args('City logo', width=900, height=1600))
+    await tool.call_tool(_args('City logo', width=1920, height=1080))
+
+    assert generator_factory.calls == [('City logo', '1792x1024'), ('City logo', '1024x1792')]
+
+
+@pytest.mark.asyncio
+async def test_call_tool_without_cache():
+    generator_factory = _ImageGeneratorServiceFactory()
+    tool = ImageGenTool(generator_factory, _ImageStoreService(), InMemoryImageCacheService())
+
+    first = await tool.call_tool(_args('City logo'))
+    regenerated = await tool.call_tool(_args('City logo'), use_cache=False)
+    cached = await tool.call_tool(_args('City logo'))
+
+    assert len(generator_factory.calls) == 2
+    assert regenerated.result != first.result
+    assert cached.result == regenerated.result
@@ -0,0 +1,22 @@
+from src.modules.settings.protocols.ISettingsService import ISettingsService
+from src.modules.settings.settings import SettingKey
+
+_PROVIDER_API_KEYS = {
+    'openai': SettingKey.OPENAI_API_KEY,
+    'anthropic': SettingKey.ANTHROPIC_API_KEY,
+    'mistral': SettingKey.MISTRAL_API_KEY,
+}
+
+
+async def get_provider_api_key(settings_service: ISettingsService, model: str) -> str | None:
+    """
+    The configured API key for the provider of a `provider/model` model.
+
+    :return: None if the provider has no configured key, litellm then falls back to its environment variable.
+    """
+    setting = _PROVIDER_API_KEYS.get(model.replace(':', '/').split('/')[0])
+
+    if setting is None:
+        return None
+
+    return await settings_service.get_setting(setting.key, setting.default) or None
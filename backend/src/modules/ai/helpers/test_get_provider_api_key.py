@@ -0,0 +1,24 @@
+import pytest
+
+from src.modules.ai.helpers.get_provider_api_key import get_provider_api_key
+from src.modules.settings.settings import SettingKey
+
+
+class _SettingsService:
+    async def get_setting(self, key: str, fallback_value=None):
+        return {
+            SettingKey.OPENAI_API_KEY.key: 'sk-openai',
+            SettingKey.ANTHROPIC_API_KEY.key: '',
+        }.get(key, fallback_value)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('model, expected', [
+    ('openai/gpt-4o', 'sk-openai'),
+    ('openai:gpt-4o', 'sk-openai'),
+    ('anthropic/claude-sonnet-4-5', None),
+    ('mistral/mistral-large-latest', None),
+    ('ollama/llama3', None),
+])
+async def test_get_provider_api_key(model, expected):
+    assert await get_provider_api_key(_SettingsService(), model) == expected
@@ -0,0 +1,29 @@
+from collections import OrderedDict
+
+from src.modules.ai.image_gen.protocols.IImageCacheService import IImageCacheService
+
+
+class InMemoryImageCacheService(IImageCacheService):
+    """
+    Keeps the ids of the most recently used images, evicting the least recently used ones
+    once there are more than `max_entries`. The images themselves stay in the image store.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self._max_entries = max_entries
+        self._image_ids: OrderedDict[str, str] = OrderedDict()
+
+    async def get_image_id(self, key: str) -> str | None:
+        image_id = self._image_ids.get(key)
+
+        if image_id is not None:
+            self._image_ids.move_to_end(key)
+
+        return image_id
+
+    async def set_image_id(self, key: str, image_id: str) -> None:
+        self._image_ids[key] = image_id
+        self._image_ids.move_to_end(key)
+
+        while len(self._image_ids) > self._max_entries:
+            self._image_ids.popitem(last=False)
@@ -1,16 +1,23 @@
 import litellm
 
+from src.modules.ai.helpers.get_provider_api_key import get_provider_api_key
 from src.modules.ai.image_gen.protocols.IImageGeneratorService import IImageGeneratorService
+from src.modules.settings.protocols.ISettingsService import ISettingsService
 
 
 class LiteLLMImageGeneratorService(IImageGeneratorService):
-    def __init__(self, model: str):
+    def __init__(self, settings_service: ISettingsService, model: str):
+        self._settings_service = settings_service
         self._model = model
 
-    async def generate_by_text(self, prompt: str) -> str:
+    async def generate_by_text(self, prompt: str, size: str | None = None, quality: str | None = None) -> str:
+        optional_params = {k: v for k, v in {'size': size, 'quality': quality}.items() if v is not None}
+
         response = await litellm.aimage_generation(
             model=self._model,
             prompt=prompt,
             response_format="b64_json",
+            api_key=await get_provider_api_key(self._settings_service, self._model),
+            **optional_params,
         )
         return response.data[0].b64_json
@@ -1,10 +1,18 @@
+from src.modules.ai.image_gen.InMemoryImageCacheService import InMemoryImageCacheService
 from src.modules.ai.image_gen.LiteLLMImageGeneratorService import LiteLLMImageGeneratorService
+from src.modules.ai.image_gen.protocols.IImageCacheService import IImageCacheService
 from src.modules.ai.image_gen.protocols.IImageGeneratorService import IImageGeneratorService
+from src.modules.settings.protocols.ISettingsService import ISettingsService
 
 
 class ImageGeneratorServiceFactory:
-    def __init__(self):
-        pass
+    def __init__(self, settings_service: ISettingsService):
+        self._settings_service = settings_service
 
     def get(self, model: str) -> IImageGeneratorService:
-        return LiteLLMImageGeneratorService(model=model)
+        return LiteLLMImageGeneratorService(settings_service=self._settings_service, model=model)
+
+
+class ImageCacheServiceFactory:
+    def get(self) -> IImageCacheService:
+        return InMemoryImageCacheService()
@@ -0,0 +1,17 @@
+import hashlib
+import json
+from typing import Any
+
+
+def make_image_cache_key(model: str, prompt: str, params: dict[str, Any] | None = None) -> str:
+    """
+    Cache key for an image generated from a text prompt.
+
+    The prompt is normalized (case and whitespace) so trivially different prompts share an image.
+
+    :param params: Every other parameter the image is generated with, such as size and quality.
+    """
+    normalized_prompt = ' '.join(prompt.lower().split())
+    normalized_params = json.dumps({k: v for k, v in (params or {}).items() if v is not None}, sort_keys=True)
+
+    return hashlib.sha256('\0'.join([model, normalized_prompt, normalized_params]).encode('utf-8')).hexdigest()
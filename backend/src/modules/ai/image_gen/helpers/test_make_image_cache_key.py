@@ -0,0 +1,31 @@
+from src.modules.ai.image_gen.helpers.make_image_cache_key import make_image_cache_key
+
+
+def test_make_image_cache_key_normalizes_prompt():
+    assert make_image_cache_key('openai/dall-e-3', 'City logo 512x512') == \
+           make_image_cache_key('openai/dall-e-3', '  city   LOGO 512x512\n')
+
+
+def test_make_image_cache_key_depends_on_model_and_prompt():
+    keys = {
+        make_image_cache_key('openai/dall-e-3', 'city logo'),
+        make_image_cache_key('openai/gpt-image-1', 'city logo'),
+        make_image_cache_key('openai/dall-e-3', 'city logo in blue'),
+    }
+
+    assert len(keys) == 3
+
+
+def test_make_image_cache_key_depends_on_params():
+    keys = {
+        make_image_cache_key('openai/dall-e-3', 'city logo'),
+        make_image_cache_key('openai/dall-e-3', 'city logo', {'size': '1024x1024'}),
+        make_image_cache_key('openai/dall-e-3', 'city logo', {'size': '1792x1024'}),
+        make_image_cache_key('openai/dall-e-3', 'city logo', {'size': '1024x1024', 'quality': 'hd'}),
+    }
+
+    assert len(keys) == 4
+    assert make_image_cache_key('openai/dall-e-3', 'city logo', {'size': '1024x1024', 'quality': 'hd'}) == \
+           make_image_cache_key('openai/dall-e-3', 'city logo', {'quality': 'hd', 'size': '1024x1024'})
+    assert make_image_cache_key('openai/dall-e-3', 'city logo', {'quality': None}) == \
+           make_image_cache_key('openai/dall-e-3', 'city logo')
@@ -0,0 +1,14 @@
+from typing import Protocol
+
+
+class IImageCacheService(Protocol):
+    """
+    Cache of generated images, mapping keys from `make_image_cache_key` to the id
+    the image was stored with in the image store.
+    """
+
+    async def get_image_id(self, key: str) -> str | None:
+        ...
+
+    async def set_image_id(self, key: str, image_id: str) -> None:
+        ...
@@ -2,7 +2,11 @@ from typing import Protocol
 
 
 class IImageGeneratorService(Protocol):
-    async def generate_by_text(self, prompt: str) -> str:
+    async def generate_by_text(self, prompt: str, size: str | None = None, quality: str | None = None) -> str:
+        """
+        :param size: Such as "1024x1024", the model's default size if not set.
+        :param quality: Such as "hd", the model's default quality if not set.
+        """
         ...
 
     # async def generate_edit(self, image_src: str, prompt: str) -> str:
@@ -0,0 +1,26 @@
+import pytest
+
+from src.modules.ai.image_gen.InMemoryImageCacheService import InMemoryImageCacheService
+from src.modules.ai.image_gen.test_image_cache_service import BaseImageCacheServiceTestClass
+
+
+@pytest.fixture
+def service():
+    return InMemoryImageCacheService()
+
+
+class TestInMemoryImageCacheServiceClass(BaseImageCacheServiceTestClass):
+    ...
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used():
+    service = InMemoryImageCacheService(max_entries=2)
+    await service.set_image_id('a', 'image a')
+    await service.set_image_id('b', 'image b')
+    await service.get_image_id('a')
+    await service.set_image_id('c', 'image c')
+
+    assert await service.get_image_id('a') == 'image a'
+    assert await service.get_image_id('b') is None
+    assert await service.get_image_id('c') == 'image c'
@@ -0,0 +1,21 @@
+import pytest
+
+from src.modules.ai.image_gen.protocols.IImageCacheService import IImageCacheService
+
+
+class BaseImageCacheServiceTestClass:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_get_set_image_id(service: IImageCacheService):
+        await service.set_image_id('a', 'image a')
+
+        assert await service.get_image_id('a') == 'image a'
+        assert await service.get_image_id('b') is None
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_set_image_id_replaces(service: IImageCacheService):
+        await service.set_image_id('a', 'image a')
+        await service.set_image_id('a', 'new image a')
+
+        assert await service.get_image_id('a') == 'new image a'
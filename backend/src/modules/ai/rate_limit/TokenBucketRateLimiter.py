@@ -0,0 +1,124 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Mapping
+
+from src.modules.ai.rate_limit.protocols.IRateLimiter import IRateLimiter
+
+
+@dataclass
+class _Bucket:
+    capacity: float | None = None
+    '''
+    None until the limit is known, an unknown limit never delays requests.
+    '''
+    level: float = 0
+    updated_at: float = 0
+
+    def refill(self, now: float, window_seconds: float):
+        if self.capacity is not None:
+            self.level = min(self.capacity, self.level + (now - self.updated_at) * self.capacity / window_seconds)
+        self.updated_at = now
+
+    def get_wait_seconds(self, amount: float, window_seconds: float) -> float:
+        if self.capacity is None:
+            return 0
+
+        # a request larger than the whole bucket can only wait for a full bucket
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing * window_seconds / self.capacity)
+
+    def take(self, amount: float):
+        if self.capacity is not None:
+            self.level -= min(amount, self.capacity)
+
+    def observe(self, limit: float | None, remaining: float | None):
+        if limit is not None and limit > 0:
+            if self.capacity is None:
+                self.level = limit
+            self.capacity = limit
+
+        if remaining is not None and self.capacity is not None:
+            # the provider also counts requests from other clients using the same key
+            self.level = min(self.level, remaining)
+
+
+@dataclass
+class _ModelLimits:
+    requests: _Bucket = field(default_factory=_Bucket)
+    tokens: _Bucket = field(default_factory=_Bucket)
+    blocked_until: float = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class TokenBucketRateLimiter(IRateLimiter):
+    """
+    Keeps a requests per minute and a tokens per minute bucket for each model (models are
+    `provider/model`, so limits are per provider and model). The bucket sizes are learned
+    from the `x-ratelimit-*` response headers, which litellm maps to the OpenAI names for
+    all providers that report them. Calls to the same model are queued in arrival order.
+    """
+
+    def __init__(self, window_seconds: float = 60, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep):
+        """
+        :param window_seconds: The period the provider limits are given for.
+        :param clock: Monotonic time in seconds, replaceable along with `sleep` in tests.
+        """
+        self._window_seconds = window_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._limits: dict[str, _ModelLimits] = {}
+
+    def has_token_limit(self, model: str) -> bool:
+        limits = self._limits.get(model)
+        return limits is not None and limits.tokens.capacity is not None
+
+    async def acquire(self, model: str, tokens: int) -> None:
+        limits = self._limits.setdefault(model, _ModelLimits())
+
+        async with limits.lock:
+            while True:
+                now = self._clock()
+                limits.requests.refill(now, self._window_seconds)
+                limits.tokens.refill(now, self._window_seconds)
+
+                wait_seconds = max(
+                    limits.blocked_until - now,
+                    limits.requests.get_wait_seconds(1, self._window_seconds),
+                    limits.tokens.get_wait_seconds(tokens, self._window_seconds),
+                )
+
+                if wait_seconds <= 0:
+                    break
+
+                await self._sleep(wait_seconds)
+
+            limits.requests.take(1)
+            limits.tokens.take(tokens)
+
+    def observe_headers(self, model: str, headers: Mapping[str, str]) -> None:
+        limits = self._limits.setdefault(model, _ModelLimits())
+        headers = {k.lower(): v for k, v in headers.items()}
+
+        now = self._clock()
+        for name, bucket in (('requests', limits.requests), ('tokens', limits.tokens)):
+            bucket.refill(now, self._window_seconds)
+            bucket.observe(
+                limit=self._get_number(headers, f'x-ratelimit-limit-{name}'),
+                remaining=self._get_number(headers, f'x-ratelimit-remaining-{name}'),
+            )
+
+    def back_off(self, model: str, seconds: float) -> None:
+        limits = self._limits.setdefault(model, _ModelLimits())
+        limits.blocked_until = max(limits.blocked_until, self._clock() + seconds)
+
+    @staticmethod
+    def _get_number(headers: dict[str, str], name: str) -> float | None:
+        value = headers.get(name, headers.get(f'llm_provider-{name}'))
+
+        try:
+            return float(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,7 @@
+from src.modules.ai.rate_limit.TokenBucketRateLimiter import TokenBucketRateLimiter
+from src.modules.ai.rate_limit.protocols.IRateLimiter import IRateLimiter
+
+
+class RateLimiterFactory:
+    def get(self) -> IRateLimiter:
+        return TokenBucketRateLimiter()
@@ -0,0 +1,15 @@
+import random
+
+
+def get_retry_delay(attempt: int, retry_after: float | None, base_seconds: float = 1.0,
+                    max_seconds: float = 30.0) -> float:
+    """
+    Delay before retry number `attempt` (0-based).
+
+    Honors `retry_after` if given, otherwise backs off exponentially. Jitter is added either way
+    so that requests limited at the same time do not all retry at the same time.
+    """
+    if retry_after is not None:
+        return min(max_seconds, retry_after) * random.uniform(1.0, 1.2)
+
+    return min(max_seconds, base_seconds * 2 ** attempt) * random.uniform(0.5, 1.0)
@@ -0,0 +1,38 @@
+import datetime
+from email.utils import parsedate_to_datetime
+from typing import Mapping
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """
+    Seconds to wait according to `retry-after-ms` or `retry-after` (seconds or HTTP date).
+
+    :return: None if no valid header is present.
+    """
+    if not headers:
+        return None
+
+    headers = {k.lower(): v for k, v in headers.items()}
+
+    try:
+        if 'retry-after-ms' in headers:
+            return max(0.0, float(headers['retry-after-ms']) / 1000)
+    except ValueError:
+        pass
+
+    value = headers.get('retry-after')
+
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.UTC)).total_seconds())
@@ -0,0 +1,18 @@
+from src.modules.ai.rate_limit.helpers.get_retry_delay import get_retry_delay
+
+
+def test_get_retry_delay_retry_after():
+    delays = [get_retry_delay(attempt=0, retry_after=10) for _ in range(100)]
+
+    assert all(10 <= d <= 12 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_get_retry_delay_exponential():
+    assert all(0.5 <= get_retry_delay(attempt=0, retry_after=None) <= 1 for _ in range(100))
+    assert all(4 <= get_retry_delay(attempt=3, retry_after=None) <= 8 for _ in range(100))
+
+
+def test_get_retry_delay_max():
+    assert get_retry_delay(attempt=20, retry_after=None, max_seconds=30) <= 30
+    assert get_retry_delay(attempt=0, retry_after=3600, max_seconds=30) <= 36
@@ -0,0 +1,27 @@
+import datetime
+from email.utils import format_datetime
+
+import pytest
+
+from src.modules.ai.rate_limit.helpers.parse_retry_after import parse_retry_after
+
+
+@pytest.mark.parametrize('headers, expected', [
+    ({'retry-after': '20'}, 20),
+    ({'Retry-After': '1.5'}, 1.5),
+    ({'retry-after-ms': '250', 'retry-after': '1'}, 0.25),
+    ({'retry-after': '-5'}, 0),
+    ({'retry-after': 'soon'}, None),
+    ({}, None),
+    (None, None),
+])
+def test_parse_retry_after(headers, expected):
+    assert parse_retry_after(headers) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.datetime.now(datetime.UTC) + datetime.timedelta(seconds=30)
+
+    result = parse_retry_after({'retry-after': format_datetime(retry_at, usegmt=True)})
+
+    assert 28 <= result <= 30
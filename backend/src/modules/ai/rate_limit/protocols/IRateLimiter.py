@@ -0,0 +1,32 @@
+from typing import Protocol, Mapping
+
+
+class IRateLimiter(Protocol):
+    """
+    Client side rate limiting of LLM provider calls, per model.
+    """
+
+    async def acquire(self, model: str, tokens: int) -> None:
+        """
+        Wait until a request using about `tokens` tokens can be made without exceeding the known limits.
+        """
+        ...
+
+    def has_token_limit(self, model: str) -> bool:
+        """
+        Get if a tokens limit is known for the model. Until then `acquire` does not use the token count,
+        so callers can skip counting tokens.
+        """
+        ...
+
+    def observe_headers(self, model: str, headers: Mapping[str, str]) -> None:
+        """
+        Learn the current limits from provider response headers (`x-ratelimit-*`).
+        """
+        ...
+
+    def back_off(self, model: str, seconds: float) -> None:
+        """
+        Hold back all requests to the model for `seconds`, e.g. after being rate limited.
+        """
+        ...
@@ -0,0 +1,18 @@
+import pytest
+
+from src.modules.ai.rate_limit.TokenBucketRateLimiter import TokenBucketRateLimiter
+from src.modules.ai.rate_limit.test_rate_limiter import BaseRateLimiterTestClass, FakeClock
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def service(clock: FakeClock):
+    return TokenBucketRateLimiter(clock=clock.monotonic, sleep=clock.sleep)
+
+
+class TestTokenBucketRateLimiterClass(BaseRateLimiterTestClass):
+    ...
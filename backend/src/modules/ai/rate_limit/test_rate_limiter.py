@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from src.modules.ai.rate_limit.protocols.IRateLimiter import IRateLimiter
+
+
+class FakeClock:
+    """
+    Time that only moves when sleeping, so waits can be checked exactly.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float):
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+async def _timed_acquire(service: IRateLimiter, clock: FakeClock, model: str, tokens: int) -> float:
+    start = clock.monotonic()
+    await service.acquire(model, tokens)
+    return clock.monotonic() - start
+
+
+class BaseRateLimiterTestClass:
+    """
+    Expects a limiter with limits given per minute, using `clock` for time.
+    """
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rate_limiter_unknown_limits(service: IRateLimiter, clock: FakeClock):
+        for _ in range(100):
+            assert await _timed_acquire(service, clock, 'openai/gpt-4o', 10_000) == 0
+
+        assert not service.has_token_limit('openai/gpt-4o')
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rate_limiter_requests(service: IRateLimiter, clock: FakeClock):
+        service.observe_headers('openai/gpt-4o', {
+            'x-ratelimit-limit-requests': '2',
+            'x-ratelimit-remaining-requests': '0',
+        })
+
+        assert await _timed_acquire(service, clock, 'openai/gpt-4o', 1) == pytest.approx(30)
+        assert await _timed_acquire(service, clock, 'openai/gpt-4o', 1) == pytest.approx(30)
+        assert not service.has_token_limit('openai/gpt-4o')
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rate_limiter_tokens(service: IRateLimiter, clock: FakeClock):
+        service.observe_headers('openai/gpt-4o', {
+            'x-ratelimit-limit-tokens': '1000',
+            'x-ratelimit-remaining-tokens': '1000',
+        })
+
+        assert service.has_token_limit('openai/gpt-4o')
+        assert await _timed_acquire(service, clock, 'openai/gpt-4o', 1000) == 0
+        assert await _timed_acquire(service, clock, 'openai/gpt-4o', 500) == pytest.approx(30)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rate_limiter_queues_in_order(service: IRateLimiter, clock: FakeClock):
+        service.observe_headers('openai/gpt-4o', {
+            'x-ratelimit-limit-requests': '10',
+            'x-ratelimit-remaining-requests': '0',
+        })
+        acquired: list[int] = []
+
+        async def acquire(i: int):
+            await service.acquire('openai/gpt-4o', 1)
+            acquired.append(i)
+
+        await asyncio.gather(*[acquire(i) for i in range(3)])
+
+        assert acquired == [0, 1, 2]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rate_limiter_back_off(service: IRateLimiter, clock: FakeClock):
+        service.back_off('anthropic/claude-sonnet-4-5', 3)
+
+        assert await _timed_acquire(service, clock, 'openai/gpt-4o', 1) == 0
+        assert await _timed_acquire(service, clock, 'anthropic/claude-sonnet-4-5', 1) == pytest.approx(3)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rate_limiter_per_model(service: IRateLimiter, clock: FakeClock):
+        service.observe_headers('openai/gpt-4o', {
+            'x-ratelimit-limit-requests': '1',
+            'x-ratelimit-remaining-requests': '0',
+        })
+
+        assert await _timed_acquire(service, clock, 'openai/gpt-4o-mini', 1) == 0
+        assert await _timed_acquire(service, clock, 'mistral/gpt-4o', 1) == 0
@@ -0,0 +1,44 @@
+import time
+from collections import OrderedDict
+
+from src.modules.ai.completions.models.Message import Message
+from src.modules.ai.response_cache.models.ResponseCacheStats import ResponseCacheStats
+from src.modules.ai.response_cache.protocols.IResponseCacheService import IResponseCacheService
+
+
+class InMemoryResponseCacheService(IResponseCacheService):
+    """
+    Keeps responses for `expiry_seconds`, evicting the least recently used ones beyond `max_entries`.
+    """
+
+    def __init__(self, expiry_seconds: float = 60 * 60, max_entries: int = 1000):
+        self._expiry_seconds = expiry_seconds
+        self._max_entries = max_entries
+        self._responses: OrderedDict[str, tuple[float, Message]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    async def get_response(self, key: str) -> Message | None:
+        entry = self._responses.get(key)
+
+        if entry is not None and time.monotonic() - entry[0] >= self._expiry_seconds:
+            del self._responses[key]
+            entry = None
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._responses.move_to_end(key)
+        return entry[1]
+
+    async def set_response(self, key: str, message: Message) -> None:
+        self._responses[key] = (time.monotonic(), message)
+        self._responses.move_to_end(key)
+
+        while len(self._responses) > self._max_entries:
+            self._responses.popitem(last=False)
+
+    async def get_stats(self) -> ResponseCacheStats:
+        return ResponseCacheStats(hits=self._hits, misses=self._misses, entries=len(self._responses))
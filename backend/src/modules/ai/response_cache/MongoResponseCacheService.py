@@ -0,0 +1,67 @@
+import datetime
+
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.common.mongo import ensure_expiry_index
+from src.modules.ai.completions.models.Message import Message
+from src.modules.ai.response_cache.models.ResponseCacheStats import ResponseCacheStats
+from src.modules.ai.response_cache.protocols.IResponseCacheService import IResponseCacheService
+
+
+class MongoResponseCacheService(IResponseCacheService):
+    def __init__(self, database: AsyncDatabase):
+        self._database = database
+        self._expiry_seconds = 24 * 60 * 60
+        self._max_entries = 100_000
+        self._hits = 0
+        self._misses = 0
+
+    async def init(self, expiry_seconds: int, max_entries: int):
+        self._expiry_seconds = expiry_seconds
+        self._max_entries = max_entries
+        await ensure_expiry_index(self._database['completions_response_cache'], self._expiry_seconds)
+        await self._database['completions_response_cache'].create_index('lastUsedAt')
+
+    async def get_response(self, key: str) -> Message | None:
+        now = datetime.datetime.utcnow()
+        doc = await self._database['completions_response_cache'].find_one_and_update(
+            {'_id': key},
+            {'$set': {'lastUsedAt': now}},
+            projection=['createdAt', 'message']
+        )
+
+        # We need to check expiry manually as well since Mongo automatic expiry check only runs about every 60 seconds
+        if doc is None or (now - doc['createdAt']).total_seconds() >= self._expiry_seconds:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return Message(**doc['message'])
+
+    async def set_response(self, key: str, message: Message) -> None:
+        now = datetime.datetime.utcnow()
+        await self._database['completions_response_cache'].update_one(
+            {'_id': key},
+            {'$set': {'message': message.model_dump(), 'createdAt': now, 'lastUsedAt': now}},
+            upsert=True
+        )
+
+        await self._evict_least_recently_used()
+
+    async def get_stats(self) -> ResponseCacheStats:
+        return ResponseCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            entries=await self._database['completions_response_cache'].estimated_document_count()
+        )
+
+    async def _evict_least_recently_used(self):
+        excess = await self._database['completions_response_cache'].estimated_document_count() - self._max_entries
+
+        if excess <= 0:
+            return
+
+        cursor = self._database['completions_response_cache'].find({}, projection=['_id']) \
+            .sort('lastUsedAt', 1).limit(excess)
+        evicted = [doc['_id'] async for doc in cursor]
+        await self._database['completions_response_cache'].delete_many({'_id': {'$in': evicted}})
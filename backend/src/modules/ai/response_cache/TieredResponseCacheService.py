@@ -0,0 +1,50 @@
+from src.modules.ai.completions.models.Message import Message
+from src.modules.ai.response_cache.models.ResponseCacheStats import ResponseCacheStats
+from src.modules.ai.response_cache.protocols.IResponseCacheService import IResponseCacheService
+from src.modules.settings.protocols.ISettingsService import ISettingsService
+from src.modules.settings.settings import SettingKey
+
+
+class TieredResponseCacheService(IResponseCacheService):
+    """
+    Looks up responses in the local (per worker) cache first, then in the shared one.
+    The shared cache is only used while the `COMPLETIONS_CACHE_SHARED` setting is on.
+    """
+
+    def __init__(self, local: IResponseCacheService, shared: IResponseCacheService,
+                 settings_service: ISettingsService):
+        self._local = local
+        self._shared = shared
+        self._settings_service = settings_service
+        self._hits = 0
+        self._misses = 0
+
+    async def get_response(self, key: str) -> Message | None:
+        message = await self._local.get_response(key)
+
+        if message is None and await self._is_shared():
+            message = await self._shared.get_response(key)
+
+            if message is not None:
+                await self._local.set_response(key, message)
+
+        if message is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+
+        return message
+
+    async def set_response(self, key: str, message: Message) -> None:
+        await self._local.set_response(key, message)
+
+        if await self._is_shared():
+            await self._shared.set_response(key, message)
+
+    async def get_stats(self) -> ResponseCacheStats:
+        stats = await (self._shared if await self._is_shared() else self._local).get_stats()
+        return ResponseCacheStats(hits=self._hits, misses=self._misses, entries=stats.entries)
+
+    async def _is_shared(self) -> bool:
+        return bool(await self._settings_service.get_setting(SettingKey.COMPLETIONS_CACHE_SHARED.key,
+                                                             SettingKey.COMPLETIONS_CACHE_SHARED.default))
@@ -0,0 +1,23 @@
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.modules.ai.response_cache.InMemoryResponseCacheService import InMemoryResponseCacheService
+from src.modules.ai.response_cache.MongoResponseCacheService import MongoResponseCacheService
+from src.modules.ai.response_cache.TieredResponseCacheService import TieredResponseCacheService
+from src.modules.ai.response_cache.protocols.IResponseCacheService import IResponseCacheService
+from src.modules.settings.protocols.ISettingsService import ISettingsService
+
+
+class ResponseCacheServiceFactory:
+    def __init__(self, mongo_database: AsyncDatabase, settings_service: ISettingsService):
+        self._mongo_database = mongo_database
+        self._settings_service = settings_service
+
+    async def get(self) -> IResponseCacheService:
+        shared = MongoResponseCacheService(self._mongo_database)
+        await shared.init(expiry_seconds=24 * 60 * 60, max_entries=100_000)
+
+        return TieredResponseCacheService(
+            local=InMemoryResponseCacheService(expiry_seconds=60 * 60, max_entries=1000),
+            shared=shared,
+            settings_service=self._settings_service
+        )
@@ -0,0 +1,12 @@
+from src.modules.ai.completions.models.Feature import Feature
+
+
+def is_deterministic_request(enabled_features: list[Feature], extra_params: dict | None) -> bool:
+    """
+    Whether a completions request is expected to always get the same response, and so can be cached:
+    sampling is greedy (temperature 0) and no feature depends on anything outside the request.
+    """
+    if extra_params is None or extra_params.get('temperature') != 0:
+        return False
+
+    return not any(f in enabled_features for f in [Feature.WEB_SEARCH, Feature.IMAGE_GEN])
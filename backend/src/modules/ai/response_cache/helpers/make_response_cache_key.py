@@ -0,0 +1,25 @@
+import hashlib
+import json
+
+from src.modules.ai.completions.models.Feature import Feature
+from src.modules.ai.completions.models.Message import Message
+
+
+def make_response_cache_key(model: str, messages: list[Message], enabled_features: list[Feature],
+                            extra_params: dict | None, api_key: str | None = None) -> str:
+    """
+    Cache key for the response to a completions request, the same for requests that only
+    differ in the order of features or of the keys in `extra_params`.
+
+    Requests with an `api_key` of their own only share responses with requests using the same key,
+    so a request with an invalid key never gets a response that was paid for with another key.
+    """
+    canonical = json.dumps({
+        'api_key': api_key or '',
+        'model': model,
+        'messages': [m.model_dump(exclude_none=True) for m in messages],
+        'enabled_features': sorted(f.value for f in enabled_features),
+        'extra_params': extra_params or {},
+    }, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
@@ -0,0 +1,18 @@
+import pytest
+
+from src.modules.ai.completions.models.Feature import Feature
+from src.modules.ai.response_cache.helpers.is_deterministic_request import is_deterministic_request
+
+
+@pytest.mark.parametrize('features, params, expected', [
+    ([], {'temperature': 0}, True),
+    ([], {'temperature': 0.0, 'max_tokens': 100}, True),
+    ([Feature.REASONING], {'temperature': 0}, True),
+    ([], None, False),
+    ([], {}, False),
+    ([], {'temperature': 0.5}, False),
+    ([Feature.WEB_SEARCH], {'temperature': 0}, False),
+    ([Feature.IMAGE_GEN], {'temperature': 0}, False),
+])
+def test_is_deterministic_request(features, params, expected):
+    assert is_deterministic_request(features, params) == expected
@@ -0,0 +1,35 @@
+from src.modules.ai.completions.models.Feature import Feature
+from src.modules.ai.completions.models.Message import Message
+from src.modules.ai.response_cache.helpers.make_response_cache_key import make_response_cache_key
+
+
+def _key(model='openai/gpt-4o', messages=None, features=None, params=None, api_key=None):
+    return make_response_cache_key(
+        model,
+        messages if messages is not None else [Message(role='user', content='Who is the king of Sweden?')],
+        features if features is not None else [],
+        params,
+        api_key
+    )
+
+
+def test_make_response_cache_key_depends_on_request():
+    keys = {
+        _key(),
+        _key(model='openai/gpt-4o-mini'),
+        _key(messages=[Message(role='user', content='Who is the queen of Sweden?')]),
+        _key(messages=[Message(role='system', content='Who is the king of Sweden?')]),
+        _key(features=[Feature.REASONING]),
+        _key(params={'temperature': 0}),
+        _key(api_key='my-api-key'),
+    }
+
+    assert len(keys) == 7
+
+
+def test_make_response_cache_key_is_canonical():
+    assert _key(params=None) == _key(params={})
+    assert _key(api_key=None) == _key(api_key='')
+    assert _key(params={'a': 1, 'b': 2}) == _key(params={'b': 2, 'a': 1})
+    assert _key(features=[Feature.REASONING, Feature.WEB_SEARCH]) == \
+           _key(features=[Feature.WEB_SEARCH, Feature.REASONING])
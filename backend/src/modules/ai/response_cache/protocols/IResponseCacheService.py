@@ -0,0 +1,22 @@
+from typing import Protocol
+
+from src.modules.ai.completions.models.Message import Message
+from src.modules.ai.response_cache.models.ResponseCacheStats import ResponseCacheStats
+
+
+class IResponseCacheService(Protocol):
+    """
+    Cache of complete (non-streamed) completion responses, keyed by keys from `make_response_cache_key`.
+    """
+
+    async def get_response(self, key: str) -> Message | None:
+        ...
+
+    async def set_response(self, key: str, message: Message) -> None:
+        ...
+
+    async def get_stats(self) -> ResponseCacheStats:
+        """
+        :return: Hit/miss counters since startup and the current number of cached responses.
+        """
+        ...
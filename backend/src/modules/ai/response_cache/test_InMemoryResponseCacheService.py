@@ -0,0 +1,13 @@
+import pytest
+
+from src.modules.ai.response_cache.InMemoryResponseCacheService import InMemoryResponseCacheService
+from src.modules.ai.response_cache.test_response_cache_service import BaseResponseCacheServiceTestClass
+
+
+@pytest.fixture
+def service():
+    return InMemoryResponseCacheService(expiry_seconds=1, max_entries=2)
+
+
+class TestInMemoryResponseCacheServiceClass(BaseResponseCacheServiceTestClass):
+    ...
@@ -0,0 +1,19 @@
+import pytest
+import pytest_asyncio
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.modules.ai.response_cache.MongoResponseCacheService import MongoResponseCacheService
+from src.modules.ai.response_cache.test_response_cache_service import BaseResponseCacheServiceTestClass
+
+pytestmark = pytest.mark.mongo
+
+
+@pytest_asyncio.fixture
+async def service(mongo_test_db: AsyncDatabase):
+    service = MongoResponseCacheService(mongo_test_db)
+    await service.init(expiry_seconds=1, max_entries=2)
+    return service
+
+
+class TestMongoResponseCacheServiceClass(BaseResponseCacheServiceTestClass):
+    ...
@@ -0,0 +1,55 @@
+import pytest
+
+from src.modules.ai.completions.models.Message import Message
+from src.modules.ai.response_cache.InMemoryResponseCacheService import InMemoryResponseCacheService
+from src.modules.ai.response_cache.TieredResponseCacheService import TieredResponseCacheService
+from src.modules.ai.response_cache.test_response_cache_service import BaseResponseCacheServiceTestClass
+from src.modules.settings.settings import SettingKey
+
+
+class _SettingsService:
+    def __init__(self, settings: dict | None = None):
+        self._settings = settings or {}
+
+    async def get_setting(self, key: str, fallback_value=None):
+        return self._settings.get(key, fallback_value)
+
+
+@pytest.fixture
+def service():
+    return TieredResponseCacheService(
+        local=InMemoryResponseCacheService(expiry_seconds=1, max_entries=2),
+        shared=InMemoryResponseCacheService(expiry_seconds=1, max_entries=2),
+        settings_service=_SettingsService()
+    )
+
+
+class TestTieredResponseCacheServiceClass(BaseResponseCacheServiceTestClass):
+    ...
+
+
+@pytest.mark.asyncio
+async def test_tiered_response_cache_service_shares_between_workers():
+    settings_service = _SettingsService({SettingKey.COMPLETIONS_CACHE_SHARED.key: True})
+    shared = InMemoryResponseCacheService()
+    worker_a = TieredResponseCacheService(InMemoryResponseCacheService(), shared, settings_service)
+    worker_b = TieredResponseCacheService(InMemoryResponseCacheService(), shared, settings_service)
+
+    await worker_a.set_response('a', Message(role='assistant', content='a'))
+
+    assert await worker_b.get_response('a') == Message(role='assistant', content='a')
+    assert (await worker_b.get_stats()).hits == 1
+
+
+@pytest.mark.asyncio
+async def test_tiered_response_cache_service_not_shared():
+    settings_service = _SettingsService({SettingKey.COMPLETIONS_CACHE_SHARED.key: False})
+    shared = InMemoryResponseCacheService()
+    worker_a = TieredResponseCacheService(InMemoryResponseCacheService(), shared, settings_service)
+    worker_b = TieredResponseCacheService(InMemoryResponseCacheService(), shared, settings_service)
+
+    await worker_a.set_response('a', Message(role='assistant', content='a'))
+
+    assert await worker_a.get_response('a') is not None
+    assert await worker_b.get_response('a') is None
+    assert (await shared.get_stats()).entries == 0
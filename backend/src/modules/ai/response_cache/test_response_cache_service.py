@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from src.modules.ai.completions.models.Message import Message
+from src.modules.ai.response_cache.protocols.IResponseCacheService import IResponseCacheService
+
+
+# Services under test are configured to expire entries after 1 second and keep at most 2 entries
+
+class BaseResponseCacheServiceTestClass:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_response_cache_service(service: IResponseCacheService):
+        await service.set_response('a', Message(role='assistant', content='first'))
+        await service.set_response('a', Message(role='assistant', content='second'))
+
+        hit = await service.get_response('a')
+        miss = await service.get_response('b')
+        stats = await service.get_stats()
+
+        assert hit == Message(role='assistant', content='second')
+        assert miss is None
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.entries == 1
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_response_cache_service_evicts_least_recently_used(service: IResponseCacheService):
+        await service.set_response('a', Message(role='assistant', content='a'))
+        await service.set_response('b', Message(role='assistant', content='b'))
+        await asyncio.sleep(0.01)
+        await service.get_response('a')
+        await service.set_response('c', Message(role='assistant', content='c'))
+
+        assert await service.get_response('a') is not None
+        assert await service.get_response('b') is None
+        assert await service.get_response('c') is not None
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_response_cache_service_expire(service: IResponseCacheService):
+        await service.set_response('a', Message(role='assistant', content='a'))
+
+        await asyncio.sleep(1.1)
+
+        assert await service.get_response('a') is None
@@ -0,0 +1,139 @@
+import asyncio
+import itertools
+from collections import Counter
+from typing import AsyncGenerator, Self
+
+from src.modules.ai.scheduler.models.GenerationRequest import GenerationRequest
+from src.modules.ai.scheduler.protocols.IGenerationScheduler import IGenerationScheduler, IGenerationTicket
+from src.modules.settings.protocols.ISettingsService import ISettingsService
+from src.modules.settings.settings import SettingKey
+
+_LIMIT_SETTINGS = {
+    'global': SettingKey.GENERATION_MAX_CONCURRENT,
+    'user': SettingKey.GENERATION_MAX_CONCURRENT_PER_USER,
+    'assistant': SettingKey.GENERATION_MAX_CONCURRENT_PER_ASSISTANT,
+    'model': SettingKey.GENERATION_MAX_CONCURRENT_PER_MODEL,
+}
+
+
+class _Ticket(IGenerationTicket):
+    def __init__(self, scheduler: 'FairGenerationScheduler', request: GenerationRequest):
+        self.request = request
+        self.seq = 0
+        self.state = 'new'  # new -> queued -> running -> released
+        self.changed = asyncio.Event()
+        self._scheduler = scheduler
+
+    async def wait(self) -> AsyncGenerator[int, None]:
+        try:
+            await self._scheduler._join(self)
+
+            last_position = None
+            while self.state == 'queued':
+                position = self._scheduler._position(self)
+
+                if position != last_position:
+                    last_position = position
+                    yield position
+
+                self.changed.clear()
+                if self.state == 'queued':
+                    await self.changed.wait()
+        except BaseException:
+            # Gave up waiting (cancelled or stopped iterating)
+            self.release()
+            raise
+
+    def release(self) -> None:
+        self._scheduler._release(self)
+
+    async def __aenter__(self) -> Self:
+        async for _ in self.wait():
+            pass
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+
+
+class FairGenerationScheduler(IGenerationScheduler):
+    """
+    Runs as many generations as the configured global, per-user, per-assistant and per-model
+    limits allow. Queued generations are started by priority, then by how few generations their
+    user already has running (so a single user can not crowd out everyone else), then in arrival order.
+    """
+
+    def __init__(self, settings_service: ISettingsService):
+        self._settings_service = settings_service
+        self._limits: dict[str, int] = {dimension: 0 for dimension in _LIMIT_SETTINGS}
+        self._waiting: list[_Ticket] = []
+        self._running: Counter[tuple[str, str]] = Counter()
+        self._seq = itertools.count()
+
+    def enqueue(self, request: GenerationRequest) -> IGenerationTicket:
+        return _Ticket(self, request)
+
+    async def _join(self, ticket: _Ticket):
+        for dimension, setting in _LIMIT_SETTINGS.items():
+            self._limits[dimension] = int(await self._settings_service.get_setting(setting.key, setting.default) or 0)
+
+        if ticket.state != 'new':
+            return
+
+        ticket.seq = next(self._seq)
+        ticket.state = 'queued'
+        self._waiting.append(ticket)
+        self._dispatch()
+
+    def _release(self, ticket: _Ticket):
+        if ticket.state == 'queued':
+            self._waiting.remove(ticket)
+        elif ticket.state == 'running':
+            self._running.subtract(self._keys(ticket.request))
+
+        ticket.state = 'released'
+        self._dispatch()
+
+    def _position(self, ticket: _Ticket) -> int:
+        return self._queue_order().index(ticket) + 1
+
+    def _dispatch(self):
+        while True:
+            startable = next((t for t in self._queue_order() if self._has_room(t.request)), None)
+
+            if startable is None:
+                break
+
+            self._waiting.remove(startable)
+            self._running.update(self._keys(startable.request))
+            startable.state = 'running'
+            startable.changed.set()
+
+        # Let the remaining tickets know their queue position may have changed
+        for ticket in self._waiting:
+            ticket.changed.set()
+
+    def _queue_order(self) -> list[_Ticket]:
+        return sorted(self._waiting, key=lambda t: (
+            t.request.priority,
+            self._running[('user', t.request.uid)] if t.request.uid is not None else 0,
+            t.seq
+        ))
+
+    def _has_room(self, request: GenerationRequest) -> bool:
+        return all(
+            self._limits[dimension] <= 0 or self._running[(dimension, value)] < self._limits[dimension]
+            for dimension, value in self._keys(request)
+        )
+
+    @staticmethod
+    def _keys(request: GenerationRequest) -> list[tuple[str, str]]:
+        keys = [('global', ''), ('model', request.model)]
+
+        if request.uid is not None:
+            keys.append(('user', request.uid))
+
+        if request.assistant_id is not None:
+            keys.append(('assistant', request.assistant_id))
+
+        return keys
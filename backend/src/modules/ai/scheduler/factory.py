@@ -0,0 +1,11 @@
+from src.modules.ai.scheduler.FairGenerationScheduler import FairGenerationScheduler
+from src.modules.ai.scheduler.protocols.IGenerationScheduler import IGenerationScheduler
+from src.modules.settings.protocols.ISettingsService import ISettingsService
+
+
+class GenerationSchedulerFactory:
+    def __init__(self, settings_service: ISettingsService):
+        self._settings_service = settings_service
+
+    def get(self) -> IGenerationScheduler:
+        return FairGenerationScheduler(settings_service=self._settings_service)
@@ -0,0 +1,19 @@
+from enum import IntEnum
+
+
+class GenerationPriority(IntEnum):
+    """
+    Lower values are scheduled first.
+    """
+    INTERACTIVE = 0
+    '''
+    Streamed to a waiting user (SSE).
+    '''
+    BUFFERED = 1
+    '''
+    Returned in full once completed.
+    '''
+    BACKGROUND = 2
+    '''
+    Batch and RAG scoring work.
+    '''
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from src.modules.ai.scheduler.models.GenerationPriority import GenerationPriority
+
+
+@dataclass(frozen=True)
+class GenerationRequest:
+    """
+    What a generation is about to run as. Dimensions left as None are not limited.
+    """
+    priority: GenerationPriority
+    model: str
+    uid: str | None = None
+    assistant_id: str | None = None
@@ -0,0 +1,36 @@
+from typing import Protocol, AsyncGenerator, Self
+
+from src.modules.ai.scheduler.models.GenerationRequest import GenerationRequest
+
+
+class IGenerationTicket(Protocol):
+    def wait(self) -> AsyncGenerator[int, None]:
+        """
+        Wait until the generation may run.
+        Yields the (1-based) queue position whenever it changes while queued.
+        """
+        ...
+
+    def release(self) -> None:
+        """
+        Give back the slot, or leave the queue if still waiting. Safe to call more than once.
+        """
+        ...
+
+    async def __aenter__(self) -> Self:
+        """
+        Wait (ignoring queue positions) and release on exit.
+        """
+        ...
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        ...
+
+
+class IGenerationScheduler(Protocol):
+    """
+    Limits how many LLM generations run concurrently, queueing the rest.
+    """
+
+    def enqueue(self, request: GenerationRequest) -> IGenerationTicket:
+        ...
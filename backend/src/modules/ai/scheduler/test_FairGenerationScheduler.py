@@ -0,0 +1,27 @@
+import pytest
+
+from src.modules.ai.scheduler.FairGenerationScheduler import FairGenerationScheduler
+from src.modules.ai.scheduler.test_generation_scheduler import BaseGenerationSchedulerTestClass
+from src.modules.settings.settings import SettingKey
+
+
+class _SettingsService:
+    def __init__(self, settings: dict):
+        self._settings = settings
+
+    async def get_setting(self, key: str, fallback_value=None):
+        return self._settings.get(key, fallback_value)
+
+
+@pytest.fixture
+def service():
+    return FairGenerationScheduler(settings_service=_SettingsService({
+        SettingKey.GENERATION_MAX_CONCURRENT.key: 2,
+        SettingKey.GENERATION_MAX_CONCURRENT_PER_USER.key: 1,
+        SettingKey.GENERATION_MAX_CONCURRENT_PER_ASSISTANT.key: 0,
+        SettingKey.GENERATION_MAX_CONCURRENT_PER_MODEL.key: 0,
+    }))
+
+
+class TestFairGenerationSchedulerClass(BaseGenerationSchedulerTestClass):
+    ...
@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from src.modules.ai.scheduler.models.GenerationPriority import GenerationPriority
+from src.modules.ai.scheduler.models.GenerationRequest import GenerationRequest
+from src.modules.ai.scheduler.protocols.IGenerationScheduler import IGenerationScheduler
+
+
+def _request(uid: str | None = 'user', priority: GenerationPriority = GenerationPriority.INTERACTIVE,
+             model: str = 'openai/gpt-4o', assistant_id: str | None = None) -> GenerationRequest:
+    return GenerationRequest(priority=priority, model=model, uid=uid, assistant_id=assistant_id)
+
+
+async def _positions(ticket) -> list[int]:
+    return [p async for p in ticket.wait()]
+
+
+class BaseGenerationSchedulerTestClass:
+    """
+    Expects a scheduler allowing 2 concurrent generations in total and 1 per user.
+    """
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_generation_scheduler_runs_immediately(service: IGenerationScheduler):
+        ticket = service.enqueue(_request())
+
+        assert await _positions(ticket) == []
+
+        ticket.release()
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_generation_scheduler_per_user_limit(service: IGenerationScheduler):
+        first = service.enqueue(_request(uid='a'))
+        await _positions(first)
+
+        second = service.enqueue(_request(uid='a'))
+        second_waiting = asyncio.create_task(_positions(second))
+        other_user = service.enqueue(_request(uid='b'))
+
+        assert await _positions(other_user) == []
+        await asyncio.sleep(0.01)
+        assert not second_waiting.done()
+
+        first.release()
+
+        assert await second_waiting == [1]
+
+        other_user.release()
+        second.release()
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_generation_scheduler_priority(service: IGenerationScheduler):
+        running = [service.enqueue(_request(uid=uid)) for uid in ['a', 'b']]
+        for ticket in running:
+            await _positions(ticket)
+
+        started: list[str] = []
+
+        async def run(name: str, request: GenerationRequest):
+            async with service.enqueue(request):
+                started.append(name)
+                await asyncio.sleep(0.01)
+
+        background = asyncio.create_task(run('background', _request(uid=None, priority=GenerationPriority.BACKGROUND)))
+        await asyncio.sleep(0.01)
+        interactive = asyncio.create_task(run('interactive', _request(uid='c')))
+        await asyncio.sleep(0.01)
+
+        running[0].release()
+        await asyncio.sleep(0)
+        running[1].release()
+        await asyncio.gather(background, interactive)
+
+        assert started == ['interactive', 'background']
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_generation_scheduler_fair_between_users(service: IGenerationScheduler):
+        running = [service.enqueue(_request(uid=uid)) for uid in ['a', 'b']]
+        for ticket in running:
+            await _positions(ticket)
+
+        queued_a = service.enqueue(_request(uid='a'))
+        queued_a_waiting = asyncio.create_task(_positions(queued_a))
+        await asyncio.sleep(0.01)
+        queued_c = service.enqueue(_request(uid='c'))
+        queued_c_waiting = asyncio.create_task(_positions(queued_c))
+        await asyncio.sleep(0.01)
+
+        # 'c' has nothing running yet, so it is ahead of 'a' even though 'a' queued first
+        running[1].release()
+
+        assert await queued_c_waiting == [1]
+        assert not queued_a_waiting.done()
+
+        running[0].release()
+        await queued_a_waiting
+
+        queued_a.release()
+        queued_c.release()
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_generation_scheduler_cancel_while_queued(service: IGenerationScheduler):
+        running = [service.enqueue(_request(uid=uid)) for uid in ['a', 'b']]
+        for ticket in running:
+            await _positions(ticket)
+
+        cancelled = asyncio.create_task(_positions(service.enqueue(_request(uid='c'))))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        await asyncio.sleep(0.01)
+
+        waiting = service.enqueue(_request(uid='d'))
+        waiting_task = asyncio.create_task(_positions(waiting))
+        await asyncio.sleep(0.01)
+        running[0].release()
+
+        assert await waiting_task == [1]
+
+        running[1].release()
+        waiting.release()
@@ -6,7 +6,7 @@ from bson import ObjectId
 from pymongo.asynchronous.database import AsyncDatabase
 
 from src.common.mongo import is_valid_mongo_id
-from src.modules.assistants.models.Assistant import Assistant
+from src.modules.assistants.models.Assistant import Assistant, RagScoringMode
 from src.modules.assistants.models.AssistantInfo import AssistantInfo
 from src.modules.assistants.protocols.IAssistantService import IAssistantService
 from src.modules.resources.protocols.IResourceService import IResourceService
@@ -30,7 +30,12 @@ class MongoAssistantService(IAssistantService):
             instructions='',
             collection_id=None,
             max_collection_results=10,
-            extra_llm_params=None
+            extra_llm_params=None,
+            rag_scoring_mode='individual',
+            fallback_models=[],
+            ttft_deadline_seconds=None,
+            cache_tool_results=True,
+            semantic_cache=False
         )
         result = await self._database['assistants'].insert_one({
             **assistant.model_dump(exclude={'id'}),
@@ -66,7 +71,12 @@ class MongoAssistantService(IAssistantService):
                 'allow_files',
                 'collection_id',
                 'max_collection_results',
-                'extra_llm_params'
+                'extra_llm_params',
+                'rag_scoring_mode',
+                'fallback_models',
+                'ttft_deadline_seconds',
+                'cache_tool_results',
+                'semantic_cache'
             ]
         )
         if doc is None:
@@ -89,7 +99,12 @@ class MongoAssistantService(IAssistantService):
                 'allow_files',
                 'collection_id',
                 'max_collection_results',
-                'extra_llm_params'
+                'extra_llm_params',
+                'rag_scoring_mode',
+                'fallback_models',
+                'ttft_deadline_seconds',
+                'cache_tool_results',
+                'semantic_cache'
             ]
         )
         return [await self._doc_to_assistant(doc, True) async for doc in cursor]
@@ -142,6 +157,11 @@ class MongoAssistantService(IAssistantService):
             collection_id: str | None = None,
             max_collection_results: int | None = None,
             extra_llm_params: dict | None = None,
+            rag_scoring_mode: RagScoringMode | None = None,
+            fallback_models: list[str] | None = None,
+            ttft_deadline_seconds: float | None = None,
+            cache_tool_results: bool | None = None,
+            semantic_cache: bool | None = None,
     ) -> bool:
         if not is_valid_mongo_id(assistant_id):
             return False
@@ -179,6 +199,11 @@ class MongoAssistantService(IAssistantService):
         self._add_to_dict_unless_none(update_dict, 'extra_llm_params', extra_llm_params)
         self._add_to_dict_unless_none(update_dict, 'collection_id', collection_id)
         self._add_to_dict_unless_none(update_dict, 'max_collection_results', max_collection_results)
+        self._add_to_dict_unless_none(update_dict, 'rag_scoring_mode', rag_scoring_mode)
+        self._add_to_dict_unless_none(update_dict, 'fallback_models', fallback_models)
+        self._add_to_dict_unless_none(update_dict, 'ttft_deadline_seconds', ttft_deadline_seconds)
+        self._add_to_dict_unless_none(update_dict, 'cache_tool_results', cache_tool_results)
+        self._add_to_dict_unless_none(update_dict, 'semantic_cache', semantic_cache)
 
         result = await self._database['assistants'].update_one(
             {'_id': ObjectId(assistant_id), 'owner': as_uid},
@@ -280,6 +305,11 @@ class MongoAssistantService(IAssistantService):
             collection_id=doc['collection_id'],
             max_collection_results=doc['max_collection_results'] if 'max_collection_results' in doc else 10,
             extra_llm_params=doc['extra_llm_params'] if 'extra_llm_params' in doc else None,
+            rag_scoring_mode=doc['rag_scoring_mode'] if 'rag_scoring_mode' in doc else 'individual',
+            fallback_models=doc['fallback_models'] if 'fallback_models' in doc else [],
+            ttft_deadline_seconds=doc['ttft_deadline_seconds'] if 'ttft_deadline_seconds' in doc else None,
+            cache_tool_results=doc['cache_tool_results'] if 'cache_tool_results' in doc else True,
+            semantic_cache=doc['semantic_cache'] if 'semantic_cache' in doc else False,
         )
 
     async def _doc_to_assistant_info(self, doc: Mapping[str, Any]) -> AssistantInfo:
@@ -1,7 +1,15 @@
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel
 
+RagScoringMode = Literal['individual', 'batched', 'rerank']
+'''
+How retrieved collection results are scored for relevance:
+- `individual`: one call to the RAG scoring assistant per result.
+- `batched`: all results are scored by the RAG scoring assistant in a single call.
+- `rerank`: results are scored locally by the rerank service, without any LLM calls.
+'''
+
 
 class Assistant(BaseModel):
     id: str
@@ -13,3 +21,23 @@ class Assistant(BaseModel):
     collection_id: str | None
     max_collection_results: int
     extra_llm_params: dict | None
+    rag_scoring_mode: RagScoringMode = 'individual'
+    fallback_models: list[str] = []
+    '''
+    Models to use, in order, if `model` fails or misses the time to first token deadline.
+    '''
+    ttft_deadline_seconds: float | None = None
+    '''
+    How long to wait for the first delta before also starting the next fallback model.
+    None (or 0) to only fall back when the model fails.
+    '''
+    cache_tool_results: bool = True
+    '''
+    Reuse results of identical tool calls, such as an image generated from the same prompt.
+    Disable for assistants that should produce a new result every time.
+    '''
+    semantic_cache: bool = False
+    '''
+    Answer the first message of a new chat with the stored answer to a similar earlier first message.
+    Meant for public assistants that get the same questions over and over in different wording.
+    '''
@@ -1,6 +1,6 @@
 from typing import Protocol, Any
 
-from src.modules.assistants.models.Assistant import Assistant
+from src.modules.assistants.models.Assistant import Assistant, RagScoringMode
 from src.modules.assistants.models.AssistantInfo import AssistantInfo
 
 
@@ -32,6 +32,11 @@ class IAssistantService(Protocol):
             collection_id: str | None = None,
             max_collection_results: int | None = None,
             extra_llm_params: dict | None = None,
+            rag_scoring_mode: RagScoringMode | None = None,
+            fallback_models: list[str] | None = None,
+            ttft_deadline_seconds: float | None = None,
+            cache_tool_results: bool | None = None,
+            semantic_cache: bool | None = None,
     ) -> bool:
         ...
 
@@ -46,6 +46,11 @@ class BaseAssistantServiceTestClass:
 
         assert isinstance(result.meta, dict)
         assert 'is_public' not in result.meta
+        assert result.rag_scoring_mode == 'individual'
+        assert result.fallback_models == []
+        assert result.ttft_deadline_seconds is None
+        assert result.cache_tool_results is True
+        assert result.semantic_cache is False
 
 
     @staticmethod
@@ -436,6 +441,11 @@ class BaseAssistantServiceTestClass:
             instructions='h',
             collection_id='i',
             max_collection_results=5,
+            rag_scoring_mode='batched',
+            fallback_models=['anthropic/claude-sonnet-4-5'],
+            ttft_deadline_seconds=2.5,
+            cache_tool_results=False,
+            semantic_cache=True,
             extra_llm_params={
                 'some_float': 3.1415,
                 'some_int': 1337,
@@ -491,6 +501,11 @@ class BaseAssistantServiceTestClass:
         }
         assert result.collection_id == 'i'
         assert result.max_collection_results == 5
+        assert result.rag_scoring_mode == 'batched'
+        assert result.fallback_models == ['anthropic/claude-sonnet-4-5']
+        assert result.ttft_deadline_seconds == 2.5
+        assert result.cache_tool_results is False
+        assert result.semantic_cache is True
         assert result.meta['is_public'] is True
         assert result.meta['name'] == 'a'
         assert result.meta['description'] == 'b'
@@ -0,0 +1,154 @@
+import asyncio
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncGenerator
+
+from src.common.get_timestamp import get_timestamp
+from src.modules.chat.models.ChatEvent import ChatEvent, ChatConversationIdEvent, ChatErrorEvent
+from src.modules.chat.models.ChatStreamEvent import ChatStreamEvent
+from src.modules.chat.protocols.IChatStreamService import IChatStreamService
+
+
+@dataclass
+class _ChatStream:
+    id: str
+    owner: str
+    conversation_id: str | None
+    events: deque[ChatStreamEvent]
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+    next_index: int = 0
+    done: bool = False
+    subscribers: int = 0
+    task: asyncio.Task | None = None
+    cancel_handle: asyncio.TimerHandle | None = None
+
+
+class InMemoryChatStreamService(IChatStreamService):
+    def __init__(self, buffer_size: int = 5000, orphan_timeout_seconds: float = 30, retention_seconds: float = 60):
+        """
+        :param buffer_size: Max number of events kept per stream for replay.
+        :param orphan_timeout_seconds: How long a generation keeps running without any subscriber.
+        :param retention_seconds: How long a finished stream can still be replayed.
+        """
+        self._buffer_size = buffer_size
+        self._orphan_timeout_seconds = orphan_timeout_seconds
+        self._retention_seconds = retention_seconds
+        self._streams: dict[str, _ChatStream] = {}
+        self._conversation_streams: dict[tuple[str, str], str] = {}
+
+    async def start_stream(self, as_uid: str, chat_events: AsyncGenerator[ChatEvent, None],
+                           conversation_id: str | None = None) -> str:
+        stream = _ChatStream(
+            id=uuid.uuid4().hex,
+            owner=as_uid,
+            conversation_id=conversation_id,
+            events=deque(maxlen=self._buffer_size)
+        )
+        self._streams[stream.id] = stream
+
+        if conversation_id is not None:
+            self._conversation_streams[(as_uid, conversation_id)] = stream.id
+
+        stream.task = asyncio.create_task(self._run(stream, chat_events))
+        self._schedule_orphan_cancel(stream)
+
+        return stream.id
+
+    async def subscribe(self, as_uid: str, stream_id: str, after_index: int = -1) -> \
+            AsyncGenerator[ChatStreamEvent, None] | None:
+        stream = self._streams.get(stream_id)
+
+        if stream is None or stream.owner != as_uid or not self._is_buffered(stream, after_index):
+            return None
+
+        return self._follow(stream, after_index)
+
+    async def get_conversation_stream_id(self, as_uid: str, conversation_id: str) -> str | None:
+        return self._conversation_streams.get((as_uid, conversation_id))
+
+    async def _run(self, stream: _ChatStream, chat_events: AsyncGenerator[ChatEvent, None]):
+        try:
+            async for chat_event in chat_events:
+                if isinstance(chat_event, ChatConversationIdEvent):
+                    stream.conversation_id = chat_event.conversation_id
+                    self._conversation_streams[(stream.owner, chat_event.conversation_id)] = stream.id
+
+                await self._publish(stream, chat_event)
+        except asyncio.CancelledError:
+            # no one listened for a while, stop generating
+            pass
+        except Exception as e:
+            print(f'error generating chat: {e}')
+            await self._publish(stream, ChatErrorEvent(message='Error:eslg'))
+        finally:
+            async with stream.changed:
+                stream.done = True
+                stream.changed.notify_all()
+
+            if stream.cancel_handle is not None:
+                stream.cancel_handle.cancel()
+
+            asyncio.get_running_loop().call_later(self._retention_seconds, self._remove, stream)
+
+    async def _publish(self, stream: _ChatStream, chat_event: ChatEvent):
+        async with stream.changed:
+            stream.events.append(ChatStreamEvent(index=stream.next_index, timestamp=get_timestamp(),
+                                                 chat_event=chat_event))
+            stream.next_index += 1
+            stream.changed.notify_all()
+
+    async def _follow(self, stream: _ChatStream, after_index: int) -> AsyncGenerator[ChatStreamEvent, None]:
+        self._add_subscriber(stream)
+
+        try:
+            while True:
+                async with stream.changed:
+                    await stream.changed.wait_for(lambda: stream.next_index - 1 > after_index or stream.done)
+
+                    if not self._is_buffered(stream, after_index):
+                        # The subscriber fell too far behind, continuing would silently skip events
+                        new_events = [ChatStreamEvent(index=after_index, timestamp=get_timestamp(),
+                                                      chat_event=ChatErrorEvent(message='stream buffer overrun'))]
+                        done = True
+                    else:
+                        new_events = [e for e in stream.events if e.index > after_index]
+                        done = stream.done
+
+                for event in new_events:
+                    yield event
+                    after_index = event.index
+
+                if done:
+                    return
+        finally:
+            self._remove_subscriber(stream)
+
+    def _add_subscriber(self, stream: _ChatStream):
+        stream.subscribers += 1
+
+        if stream.cancel_handle is not None:
+            stream.cancel_handle.cancel()
+            stream.cancel_handle = None
+
+    def _remove_subscriber(self, stream: _ChatStream):
+        stream.subscribers -= 1
+        self._schedule_orphan_cancel(stream)
+
+    def _schedule_orphan_cancel(self, stream: _ChatStream):
+        if stream.subscribers > 0 or stream.done or stream.cancel_handle is not None:
+            return
+
+        stream.cancel_handle = asyncio.get_running_loop().call_later(self._orphan_timeout_seconds, stream.task.cancel)
+
+    def _remove(self, stream: _ChatStream):
+        self._streams.pop(stream.id, None)
+
+        key = (stream.owner, stream.conversation_id)
+        if self._conversation_streams.get(key) == stream.id:
+            self._conversation_streams.pop(key)
+
+    @staticmethod
+    def _is_buffered(stream: _ChatStream, after_index: int) -> bool:
+        oldest_index = stream.next_index - len(stream.events)
+        return oldest_index <= after_index + 1 <= stream.next_index
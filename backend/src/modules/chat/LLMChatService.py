@@ -1,20 +1,77 @@
+import asyncio
 import json
 import os
+from collections import OrderedDict
 from typing import AsyncGenerator
 
+from litellm import token_counter
+
 from src.common.get_timestamp import get_timestamp
+from src.modules.assistants.models.Assistant import Assistant, RagScoringMode
 from src.modules.assistants.protocols.IAssistantService import IAssistantService
 from src.modules.assistants.reserved_ids import RAG_SCORING_ID
-from src.modules.chat.models.ChatEvent import ChatEvent, ChatErrorEvent, ChatConversationIdEvent, ChatMessageEvent
+from src.modules.chat.helpers.decide_retrieval import decide_retrieval
+from src.modules.chat.helpers.drop_near_duplicates import drop_near_duplicates
+from src.modules.chat.helpers.make_answer_cache_version import make_answer_cache_version
+from src.modules.chat.helpers.make_score_cache_key import make_score_cache_key
+from src.modules.chat.helpers.pack_context import pack_context
+from src.modules.chat.helpers.parse_batch_scores import parse_batch_scores
+from src.modules.chat.helpers.score_concurrently import score_concurrently
+from src.modules.chat.models.ChatEvent import ChatEvent, ChatErrorEvent, ChatConversationIdEvent, ChatMessageEvent, \
+    ChatQueuePositionEvent
 from src.modules.chat.protocols.IChatService import IChatService
+from src.modules.chat.protocols.IScoreCacheService import IScoreCacheService
+from src.modules.chat.protocols.ISemanticAnswerCacheService import ISemanticAnswerCacheService
 from src.modules.collections.protocols.ICollectionService import ICollectionService
+from src.modules.conversations.models.Conversation import Conversation
 from src.modules.conversations.models.Message import Message as ConversationMessage
+from src.modules.conversations.protocols.IConversationJournalService import IConversationJournalService
 from src.modules.conversations.protocols.IConversationService import IConversationService
+from src.modules.ai.circuit_breaker.models.CircuitOpenError import CircuitOpenError
 from src.modules.ai.completions.factory import CompletionsServiceFactory
 from src.modules.ai.completions.helpers.collect_streamed import collect_streamed
 from src.modules.ai.completions.models.Feature import Feature
 from src.modules.ai.completions.models.Message import Message as CompletionMessage
 from src.modules.ai.completions.protocols.ICompletionsService import ICompletionsService
+from src.modules.ai.scheduler.models.GenerationPriority import GenerationPriority
+from src.modules.ai.scheduler.models.GenerationRequest import GenerationRequest
+from src.modules.ai.scheduler.protocols.IGenerationScheduler import IGenerationScheduler
+from src.modules.models.protocols.IModelCapabilityService import IModelCapabilityService
+from src.modules.rerank.protocols.IRerankService import IRerankService
+from src.modules.settings.protocols.ISettingsService import ISettingsService
+from src.modules.settings.settings import SettingKey
+
+SCORE_THRESHOLD = 70
+DEFAULT_RESERVED_OUTPUT_TOKENS = 4096
+MAX_PREVIOUS_RAG_RESULTS = 1000
+RAG_RESULTS_OVERFETCH_FACTOR = 2
+
+BATCH_SCORING_INSTRUCTIONS = '''Score every document below from 0-100 based on how well it answers the query.
+Answer with a score for each document, identified by the id given in its header.'''
+
+BATCH_SCORING_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'batch_score_schema',
+        'strict': True,
+        'schema': {
+            'type': 'object',
+            'properties': {
+                'scores': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'object',
+                        'properties': {'id': {'type': 'string'}, 'score': {'type': 'number'}},
+                        'required': ['id', 'score'],
+                        'additionalProperties': False
+                    }
+                }
+            },
+            'required': ['scores'],
+            'additionalProperties': False
+        },
+    }
+}
 
 
 class LLMChatService(IChatService):
@@ -23,14 +80,31 @@ class LLMChatService(IChatService):
             completions_factory: CompletionsServiceFactory,
             assistant_service: IAssistantService,
             conversation_service: IConversationService,
-            collection_service: ICollectionService
+            conversation_journal_service: IConversationJournalService,
+            collection_service: ICollectionService,
+            settings_service: ISettingsService,
+            score_cache_service: IScoreCacheService,
+            rerank_service: IRerankService,
+            model_capability_service: IModelCapabilityService,
+            generation_scheduler: IGenerationScheduler,
+            semantic_answer_cache_service: ISemanticAnswerCacheService
     ):
         self._completions_factory = completions_factory
         self._assistant_service = assistant_service
         self._conversation_service = conversation_service
+        self._conversation_journal_service = conversation_journal_service
         self._collection_service = collection_service
-
-    async def start_new_chat(self, as_uid: str, assistant_id: str, message: str, enabled_features: list[Feature]) -> \
+        self._settings_service = settings_service
+        self._score_cache_service = score_cache_service
+        self._rerank_service = rerank_service
+        self._model_capability_service = model_capability_service
+        self._generation_scheduler = generation_scheduler
+        self._semantic_answer_cache_service = semantic_answer_cache_service
+        # Accepted results of the latest retrieval per conversation, reused for follow-up questions
+        self._previous_rag_results: OrderedDict[tuple[str, str], list[tuple[str, int]]] = OrderedDict()
+
+    async def start_new_chat(self, as_uid: str, assistant_id: str, message: str, enabled_features: list[Feature],
+                             priority: GenerationPriority = GenerationPriority.INTERACTIVE) -> \
             AsyncGenerator[ChatEvent, None]:
         assistant = await self._assistant_service.get_assistant(
             as_uid=as_uid,
@@ -56,11 +130,55 @@ class LLMChatService(IChatService):
             )
         )
 
+        answer_cache_version = None
+        answer = None
+
+        # The cache only saves work, when it fails the chat is answered without it
+        try:
+            answer_cache_version = await self._get_answer_cache_version(assistant, enabled_features)
+
+            if answer_cache_version is not None:
+                answer = await self._semantic_answer_cache_service.get_answer(assistant.id, answer_cache_version,
+                                                                              message)
+        except Exception as e:
+            print(f'WARNING: semantic answer cache lookup failed, answering without it: {e}')
+            answer_cache_version = None
+
+        if answer is not None:
+            print(f'semantic answer cache hit ({conversation_id=})')
+
+            for role, content in [('user', message), ('assistant', answer)]:
+                await self._conversation_service.add_message_to_conversation(
+                    as_uid=as_uid,
+                    conversation_id=conversation_id,
+                    message=ConversationMessage(timestamp=get_timestamp(), role=role, content=content)
+                )
+
+            yield ChatMessageEvent(source='assistant', message=answer)
+            return
+
+        # Only plain answers are cached, not ones that needed tools or ended in an error
+        answer_parts: list[str] = []
+        is_cacheable = answer_cache_version is not None
+
         async for m in self.continue_chat(as_uid=as_uid, conversation_id=conversation_id, message=message,
-                                          enabled_features=enabled_features):
+                                          enabled_features=enabled_features, priority=priority):
+            if isinstance(m, ChatMessageEvent) and m.source == 'assistant':
+                answer_parts.append(m.message or '')
+            elif isinstance(m, (ChatMessageEvent, ChatErrorEvent)):
+                is_cacheable = False
+
             yield m
 
-    async def continue_chat(self, as_uid: str, conversation_id: str, message: str, enabled_features: list[Feature]) -> \
+        if is_cacheable and len(''.join(answer_parts)) > 0:
+            try:
+                await self._semantic_answer_cache_service.set_answer(assistant.id, answer_cache_version, message,
+                                                                     ''.join(answer_parts))
+            except Exception as e:
+                print(f'WARNING: storing the answer in the semantic answer cache failed: {e}')
+
+    async def continue_chat(self, as_uid: str, conversation_id: str, message: str, enabled_features: list[Feature],
+                            priority: GenerationPriority = GenerationPriority.INTERACTIVE) -> \
             AsyncGenerator[ChatEvent, None]:
         conversation = await self._conversation_service.get_conversation(as_uid=as_uid, conversation_id=conversation_id)
 
@@ -78,56 +196,37 @@ class LLMChatService(IChatService):
             yield ChatErrorEvent(message='invalid assistant')
             return
 
-        await self._conversation_service.add_message_to_conversation(
-            as_uid=as_uid,
-            conversation_id=conversation_id,
-            message=ConversationMessage(
-                timestamp=get_timestamp(),
-                role='user',
-                content=message
-            )
+        # Storing the user message and preparing the RAG context are independent of each other,
+        # the messages sent to the LLM are built from the conversation as fetched above
+        add_message_result, rag_message = await asyncio.gather(
+            self._conversation_service.add_message_to_conversation(
+                as_uid=as_uid,
+                conversation_id=conversation_id,
+                message=ConversationMessage(
+                    timestamp=get_timestamp(),
+                    role='user',
+                    content=message
+                )
+            ),
+            self._get_rag_message(as_uid, conversation_id, assistant, conversation, message),
+            return_exceptions=True
         )
 
-        rag_message: str | None = None
-
-        if assistant.collection_id is not None:
-            rag_scoring_assistant = await self._assistant_service.get_assistant(
-                as_uid=os.environ['SETUP_ADMIN'],
-                assistant_id=RAG_SCORING_ID)
-
-            if rag_scoring_assistant is None:
-                yield ChatErrorEvent(message='rag scoring assistant not found')
+        for result in [add_message_result, rag_message]:
+            if isinstance(result, ValueError):
+                yield ChatErrorEvent(message=str(result))
                 return
-
-            rag_service: ICompletionsService = self._completions_factory.get(model=rag_scoring_assistant.model,
-                                                                             api_key=rag_scoring_assistant.llm_api_key)
-
-            rag_results = await self._collection_service.query_collection(assistant.collection_id, message,
-                                                                          max_results=assistant.max_collection_results)
-
-            formatted_results = [f"(source:{r.source}, page: {r.page_number})\n{r.content}" for r in rag_results]
-
-            async def _score_result(result: str) -> int:
-                response = await collect_streamed(rag_service.run_completions(
-                    messages=[
-                        CompletionMessage(role='system', content=rag_scoring_assistant.instructions),
-                        CompletionMessage(role='user', content=result)
-                    ],
-                    enabled_features=[],
-                    extra_params=rag_scoring_assistant.extra_llm_params
-                ))
-                return int(json.loads(response.content)['score'])
-
-            scored_results = [(fr, await _score_result(fr)) for fr in formatted_results]
-            scored_results.sort(key=lambda x: x[1], reverse=True)
-
-            SCORE_THRESHOLD = 70
-            accurate_results = [r for r in scored_results if r[1] >= SCORE_THRESHOLD]
-
-            rag_message = "Here are the results of the search:\n\n" + "\n\n".join([r[0] for r in accurate_results])
+            if isinstance(result, BaseException):
+                raise result
 
         try:
-            completions_service = self._completions_factory.get(model=assistant.model, api_key=assistant.llm_api_key)
+            completions_service = self._completions_factory.get(
+                model=assistant.model,
+                api_key=assistant.llm_api_key,
+                fallback_models=assistant.fallback_models,
+                ttft_deadline_seconds=assistant.ttft_deadline_seconds or None,
+                cache_tool_results=assistant.cache_tool_results
+            )
         except ValueError as e:
             yield ChatErrorEvent(message=str(e))
             return
@@ -146,53 +245,315 @@ class LLMChatService(IChatService):
 
         last_role = ''
 
-        async for delta in completions_service.run_completions(
-                messages=[m for m in messages if m],
-                enabled_features=enabled_features,
-                extra_params=assistant.extra_llm_params
-        ):
-            if delta.role != last_role:
-                last_role = delta.role
-                await self._conversation_service.add_message_to_conversation(
-                    as_uid=as_uid,
-                    conversation_id=conversation_id,
-                    message=ConversationMessage(
-                        timestamp=get_timestamp(),
-                        role=delta.role,
+        generation_ticket = self._generation_scheduler.enqueue(GenerationRequest(
+            priority=priority,
+            model=assistant.model,
+            uid=as_uid,
+            assistant_id=assistant.id
+        ))
+
+        try:
+            async for queue_position in generation_ticket.wait():
+                yield ChatQueuePositionEvent(position=queue_position)
+
+            async for delta in completions_service.run_completions(
+                    messages=[m for m in messages if m],
+                    enabled_features=enabled_features,
+                    extra_params=assistant.extra_llm_params
+            ):
+                # every tool result is a message of its own
+                if delta.role != last_role or delta.tool_call_id is not None:
+                    last_role = delta.role
+                    await self._conversation_journal_service.begin_message(
+                        as_uid=as_uid,
+                        conversation_id=conversation_id,
+                        message=ConversationMessage(
+                            timestamp=get_timestamp(),
+                            role=delta.role,
+                            content=delta.content,
+                            reasoning_content=delta.reasoning_content,
+                            tool_call_id=delta.tool_call_id,
+                            tool_calls=delta.tool_calls,
+                            context_message_override=delta.context_message_override
+                        )
+                    )
+                else:
+                    await self._conversation_journal_service.extend_message(
+                        as_uid=as_uid,
+                        conversation_id=conversation_id,
                         content=delta.content,
                         reasoning_content=delta.reasoning_content,
                         tool_call_id=delta.tool_call_id,
                         tool_calls=delta.tool_calls,
                         context_message_override=delta.context_message_override
                     )
-                )
-            else:
-                conversation = await self._conversation_service.get_conversation(as_uid=as_uid,
-                                                                                 conversation_id=conversation_id)
-                last_message = conversation.messages[-1]
-                if delta.content is not None:
-                    last_message.content = last_message.content + delta.content if last_message.content is not None else delta.content
 
-                if delta.reasoning_content is not None:
-                    last_message.reasoning_content = last_message.reasoning_content + delta.reasoning_content if last_message.reasoning_content is not None else delta.reasoning_content
+                if delta.role == 'error':
+                    yield ChatErrorEvent(message=delta.content)
+                    return
 
-                if delta.context_message_override is not None:
-                    last_message.context_message_override = delta.context_message_override
+                yield ChatMessageEvent(source=delta.role, message=delta.content, reasoning=delta.reasoning_content)
+        except CircuitOpenError as e:
+            yield ChatErrorEvent(message=str(e))
+        finally:
+            generation_ticket.release()
+            # Persist whatever was generated, also when the stream is cancelled by the client
+            await self._conversation_journal_service.close(as_uid=as_uid, conversation_id=conversation_id)
+
+    async def _get_answer_cache_version(self, assistant: Assistant, enabled_features: list[Feature]) -> str | None:
+        """
+        :return: The version to cache the first answer of a new chat by,
+        or None if the assistant doesn't use the semantic answer cache or the answer may depend on features.
+        """
+        if not assistant.semantic_cache or len(enabled_features) > 0:
+            return None
+
+        collection = await self._collection_service.get_collection(assistant.collection_id) \
+            if assistant.collection_id is not None else None
+
+        return make_answer_cache_version(assistant, collection)
+
+    async def _get_rag_message(self, as_uid: str, conversation_id: str, assistant: Assistant,
+                               conversation: Conversation, message: str) -> str | None:
+        """
+        :return: A message with the relevant collection results for the user message,
+        or None if the assistant has no collection or retrieval was skipped.
+        :raises ValueError: If the results could not be scored.
+        """
+        if assistant.collection_id is None:
+            return None
+
+        rag_results_key = (as_uid, conversation_id)
+        previous_results = self._previous_rag_results.get(rag_results_key)
+
+        if await self._settings_service.get_setting(SettingKey.RAG_RETRIEVAL_GATING.key,
+                                                    SettingKey.RAG_RETRIEVAL_GATING.default):
+            retrieval_decision = decide_retrieval(message, has_previous_results=previous_results is not None)
+
+            if await self._settings_service.get_setting(SettingKey.RAG_RETRIEVAL_GATING_LOG.key,
+                                                        SettingKey.RAG_RETRIEVAL_GATING_LOG.default):
+                print(f'rag retrieval gate: {retrieval_decision} ({conversation_id=})')
+        else:
+            retrieval_decision = 'retrieve'
+
+        if retrieval_decision == 'skip':
+            return None
+
+        if retrieval_decision == 'reuse':
+            accurate_results = previous_results
+            budget_tokens = await self._get_rag_token_budget(assistant, conversation, message)
+            self._previous_rag_results.move_to_end(rag_results_key)
+        else:
+            accurate_results, budget_tokens = await asyncio.gather(
+                self._retrieve_rag_results(assistant, message),
+                self._get_rag_token_budget(assistant, conversation, message)
+            )
+            self._previous_rag_results[rag_results_key] = accurate_results
+            self._previous_rag_results.move_to_end(rag_results_key)
+            if len(self._previous_rag_results) > MAX_PREVIOUS_RAG_RESULTS:
+                self._previous_rag_results.popitem(last=False)
+
+        # Count with the same tokenizer as the budget
+        capabilities = await self._model_capability_service.get_capabilities(assistant.model)
+
+        packed_results = pack_context(
+            results=accurate_results,
+            budget_tokens=budget_tokens,
+            count_tokens=lambda text: token_counter(model=capabilities.litellm_model, text=text)
+        )
 
-                if delta.tool_calls is not None:
-                    last_message.tool_calls = delta.tool_calls
+        return "Here are the results of the search:\n\n" + "\n\n".join(packed_results)
 
-                if delta.tool_call_id is not None:
-                    last_message.tool_call_id = delta.tool_call_id
+    async def _retrieve_rag_results(self, assistant: Assistant, message: str) -> list[tuple[str, int]]:
+        async def _get_rag_scoring_assistant() -> Assistant | None:
+            if assistant.rag_scoring_mode == 'rerank':
+                return None
 
-                await self._conversation_service.replace_conversation_last_message(
-                    as_uid=as_uid,
-                    conversation_id=conversation_id,
-                    message=last_message
-                )
+            rag_scoring_assistant = await self._assistant_service.get_assistant(
+                as_uid=os.environ['SETUP_ADMIN'],
+                assistant_id=RAG_SCORING_ID)
 
-            if delta.role == 'error':
-                yield ChatErrorEvent(message=delta.content)
-                return
+            if rag_scoring_assistant is None:
+                raise ValueError('rag scoring assistant not found')
+
+            return rag_scoring_assistant
+
+        # Fetch extra results so there are still enough left after dropping near-duplicates
+        rag_results, rag_scoring_assistant, duplicate_similarity = await asyncio.gather(
+            self._collection_service.query_collection(
+                assistant.collection_id,
+                message,
+                max_results=assistant.max_collection_results * RAG_RESULTS_OVERFETCH_FACTOR
+            ),
+            _get_rag_scoring_assistant(),
+            self._settings_service.get_setting(
+                SettingKey.RAG_DUPLICATE_SIMILARITY.key, SettingKey.RAG_DUPLICATE_SIMILARITY.default),
+        )
+
+        rag_results = drop_near_duplicates(
+            rag_results,
+            get_text=lambda r: r.content,
+            max_similarity=duplicate_similarity
+        )[:assistant.max_collection_results]
+
+        formatted_results = [f"(source:{r.source}, page: {r.page_number})\n{r.content}" for r in rag_results]
+
+        if rag_scoring_assistant is None:
+            scores = await self._rerank_service.score(query=message, documents=formatted_results)
+            scored_results = list(zip(formatted_results, scores))
+            score_threshold = await self._settings_service.get_setting(
+                SettingKey.RAG_RERANK_SCORE_THRESHOLD.key, SettingKey.RAG_RERANK_SCORE_THRESHOLD.default)
+        else:
+            rag_service: ICompletionsService = self._completions_factory.get(
+                model=rag_scoring_assistant.model,
+                api_key=rag_scoring_assistant.llm_api_key,
+                fallback_models=rag_scoring_assistant.fallback_models,
+                ttft_deadline_seconds=rag_scoring_assistant.ttft_deadline_seconds or None
+            )
+
+            scored_results = await self._score_rag_results(
+                rag_scoring_assistant=rag_scoring_assistant,
+                rag_service=rag_service,
+                query=message,
+                results=formatted_results,
+                scoring_mode=assistant.rag_scoring_mode
+            )
+            score_threshold = SCORE_THRESHOLD
+
+        scored_results.sort(key=lambda x: x[1], reverse=True)
+
+        return [r for r in scored_results if r[1] >= score_threshold]
+
+    async def _get_rag_token_budget(self, assistant: Assistant, conversation: Conversation, message: str) -> int:
+        max_tokens = await self._settings_service.get_setting(
+            SettingKey.RAG_CONTEXT_MAX_TOKENS.key, SettingKey.RAG_CONTEXT_MAX_TOKENS.default)
+
+        capabilities = await self._model_capability_service.get_capabilities(assistant.model)
+        context_window = capabilities.context_window
+
+        if context_window is None:
+            return max_tokens
+
+        used_tokens = token_counter(model=capabilities.litellm_model, messages=[
+            *[{'role': m.role, 'content': m.context_message_override or m.content or ''} for m in conversation.messages],
+            {'role': 'user', 'content': message}
+        ])
+        reserved_tokens = capabilities.max_output_tokens or DEFAULT_RESERVED_OUTPUT_TOKENS
+
+        return max(0, min(max_tokens, context_window - used_tokens - reserved_tokens))
+
+    async def _score_rag_results(
+            self,
+            rag_scoring_assistant: Assistant,
+            rag_service: ICompletionsService,
+            query: str,
+            results: list[str],
+            scoring_mode: RagScoringMode
+    ) -> list[tuple[str, int]]:
+        keys = {result: make_score_cache_key(
+            query=query,
+            chunk=result,
+            scoring_model=rag_scoring_assistant.model,
+            scoring_instructions=rag_scoring_assistant.instructions,
+            scoring_params=rag_scoring_assistant.extra_llm_params,
+            scoring_mode=scoring_mode
+        ) for result in results}
+
+        cached = await self._score_cache_service.get_scores(list(set(keys.values())))
+
+        cached_results = [(result, cached[keys[result]]) for result in results if keys[result] in cached]
+        uncached_results = [result for result in results if keys[result] not in cached]
+
+        if len(uncached_results) == 0:
+            return cached_results
+
+        scored_results = await self._score_uncached_rag_results(
+            rag_scoring_assistant=rag_scoring_assistant,
+            rag_service=rag_service,
+            query=query,
+            results=uncached_results,
+            scoring_mode=scoring_mode
+        )
+
+        await self._score_cache_service.set_scores({keys[result]: score for result, score in scored_results})
+
+        return cached_results + scored_results
+
+    async def _score_uncached_rag_results(
+            self,
+            rag_scoring_assistant: Assistant,
+            rag_service: ICompletionsService,
+            query: str,
+            results: list[str],
+            scoring_mode: RagScoringMode
+    ) -> list[tuple[str, int]]:
+        timeout_seconds = await self._settings_service.get_setting(
+            SettingKey.RAG_SCORING_TIMEOUT_SECONDS.key, SettingKey.RAG_SCORING_TIMEOUT_SECONDS.default)
+
+        async def _score_result(result: str) -> int:
+            response = await self._run_scoring_completions(
+                rag_service=rag_service,
+                model=rag_scoring_assistant.model,
+                messages=[
+                    CompletionMessage(role='system', content=rag_scoring_assistant.instructions),
+                    CompletionMessage(role='user', content=result)
+                ],
+                extra_params=rag_scoring_assistant.extra_llm_params
+            )
+            return int(json.loads(response.content)['score'])
+
+        async def _score_individually(items: list[str]) -> list[tuple[str, int]]:
+            return await score_concurrently(
+                items=items,
+                score=_score_result,
+                max_concurrency=await self._settings_service.get_setting(
+                    SettingKey.RAG_SCORING_MAX_CONCURRENCY.key, SettingKey.RAG_SCORING_MAX_CONCURRENCY.default),
+                timeout_seconds=timeout_seconds,
+                accept_threshold=SCORE_THRESHOLD,
+                stop_after_accepted=await self._settings_service.get_setting(
+                    SettingKey.RAG_SCORING_EARLY_STOP_COUNT.key, SettingKey.RAG_SCORING_EARLY_STOP_COUNT.default),
+            )
+
+        if scoring_mode != 'batched' or len(results) < 2:
+            return await _score_individually(results)
 
-            yield ChatMessageEvent(source=delta.role, message=delta.content, reasoning=delta.reasoning_content)
+        ids = [f'chunk_{i}' for i in range(len(results))]
+        documents = '\n\n'.join([f'[id: {chunk_id}]\n{result}' for chunk_id, result in zip(ids, results)])
+
+        try:
+            response = await asyncio.wait_for(self._run_scoring_completions(
+                rag_service=rag_service,
+                model=rag_scoring_assistant.model,
+                messages=[
+                    CompletionMessage(role='system', content=f'{rag_scoring_assistant.instructions}\n\n{BATCH_SCORING_INSTRUCTIONS}'),
+                    CompletionMessage(role='user', content=f'Query: {query}\n\n{documents}')
+                ],
+                extra_params={**(rag_scoring_assistant.extra_llm_params or {}), 'response_format': BATCH_SCORING_RESPONSE_FORMAT}
+            ), timeout=timeout_seconds)
+            scores = parse_batch_scores(response.content, ids)
+        except Exception as e:
+            print(f'WARNING: batched rag scoring failed, falling back to individual scoring: {e}')
+            scores = None
+
+        if scores is None:
+            return await _score_individually(results)
+
+        scored_results = [(result, scores[chunk_id]) for chunk_id, result in zip(ids, results) if chunk_id in scores]
+        missing = [result for chunk_id, result in zip(ids, results) if chunk_id not in scores]
+
+        if len(missing) > 0:
+            scored_results += await _score_individually(missing)
+
+        return scored_results
+
+    async def _run_scoring_completions(self, rag_service: ICompletionsService, model: str,
+                                       messages: list[CompletionMessage], extra_params: dict | None) -> CompletionMessage:
+        async with self._generation_scheduler.enqueue(GenerationRequest(
+                priority=GenerationPriority.BACKGROUND,
+                model=model
+        )):
+            return await collect_streamed(rag_service.run_completions(
+                messages=messages,
+                enabled_features=[],
+                extra_params=extra_params
+            ))
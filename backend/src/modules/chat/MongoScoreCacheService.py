@@ -0,0 +1,82 @@
+import datetime
+
+from pymongo import UpdateOne
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.common.mongo import ensure_expiry_index
+from src.modules.chat.models.ScoreCacheStats import ScoreCacheStats
+from src.modules.chat.protocols.IScoreCacheService import IScoreCacheService
+
+
+class MongoScoreCacheService(IScoreCacheService):
+    def __init__(self, database: AsyncDatabase):
+        self._database = database
+        self._expiry_seconds = 7 * 24 * 60 * 60
+        self._max_entries = 100_000
+        self._hits = 0
+        self._misses = 0
+
+    async def init(self, expiry_seconds: int, max_entries: int):
+        self._expiry_seconds = expiry_seconds
+        self._max_entries = max_entries
+        await ensure_expiry_index(self._database['rag_score_cache'], self._expiry_seconds)
+        await self._database['rag_score_cache'].create_index('lastUsedAt')
+
+    async def get_scores(self, keys: list[str]) -> dict[str, int]:
+        if len(keys) == 0:
+            return {}
+
+        now = datetime.datetime.utcnow()
+        cursor = self._database['rag_score_cache'].find(
+            {'_id': {'$in': keys}},
+            projection=['createdAt', 'score']
+        )
+
+        # We need to check expiry manually as well since Mongo automatic expiry check only runs about every 60 seconds
+        scores = {
+            doc['_id']: doc['score'] async for doc in cursor
+            if (now - doc['createdAt']).total_seconds() < self._expiry_seconds
+        }
+
+        self._hits += len(scores)
+        self._misses += len(keys) - len(scores)
+
+        if len(scores) > 0:
+            await self._database['rag_score_cache'].update_many(
+                {'_id': {'$in': list(scores.keys())}},
+                {'$set': {'lastUsedAt': now}}
+            )
+
+        return scores
+
+    async def set_scores(self, scores: dict[str, int]) -> None:
+        if len(scores) == 0:
+            return
+
+        now = datetime.datetime.utcnow()
+        await self._database['rag_score_cache'].bulk_write([
+            UpdateOne(
+                {'_id': key},
+                {'$set': {'score': score, 'createdAt': now, 'lastUsedAt': now}},
+                upsert=True
+            ) for key, score in scores.items()
+        ], ordered=False)
+
+        await self._evict_least_recently_used()
+
+    async def get_stats(self) -> ScoreCacheStats:
+        return ScoreCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            entries=await self._database['rag_score_cache'].estimated_document_count()
+        )
+
+    async def _evict_least_recently_used(self):
+        excess = await self._database['rag_score_cache'].estimated_document_count() - self._max_entries
+
+        if excess <= 0:
+            return
+
+        cursor = self._database['rag_score_cache'].find({}, projection=['_id']).sort('lastUsedAt', 1).limit(excess)
+        evicted = [doc['_id'] async for doc in cursor]
+        await self._database['rag_score_cache'].delete_many({'_id': {'$in': evicted}})
@@ -0,0 +1,68 @@
+import hashlib
+import uuid
+
+from src.modules.chat.protocols.ISemanticAnswerCacheService import ISemanticAnswerCacheService
+from src.modules.settings.protocols.ISettingsService import ISettingsService
+from src.modules.settings.settings import SettingKey
+from src.modules.vector.models.VectorDocument import VectorDocument
+from src.modules.vector.protocols.IVectorService import IVectorService
+
+
+class VectorSemanticAnswerCacheService(ISemanticAnswerCacheService):
+    """
+    Keeps the questions of every assistant version in a vector space of its own, with the answers as metadata.
+    """
+
+    def __init__(self, vector_service: IVectorService, settings_service: ISettingsService):
+        self._vector_service = vector_service
+        self._settings_service = settings_service
+
+    async def get_answer(self, assistant_id: str, version: str, question: str) -> str | None:
+        embedding_model, min_similarity = await self._get_settings()
+
+        results = await self._vector_service.query_vector_space(
+            space=self._space(assistant_id, version, embedding_model),
+            embedding_model=embedding_model,
+            query=question,
+            max_results=1
+        )
+
+        if len(results) == 0 or results[0].distance is None:
+            return None
+
+        # Embeddings are normalized, so the squared L2 distance is 2 - 2 * cosine similarity
+        similarity = 1 - results[0].distance / 2
+
+        if similarity < min_similarity:
+            return None
+
+        return results[0].metadata['answer']
+
+    async def set_answer(self, assistant_id: str, version: str, question: str, answer: str) -> None:
+        embedding_model, _ = await self._get_settings()
+        space = self._space(assistant_id, version, embedding_model)
+
+        for vector_space in await self._vector_service.get_vector_spaces():
+            if vector_space.name.startswith(f'answers_{assistant_id}_') and vector_space.name != space:
+                await self._vector_service.delete_vector_space(vector_space.name)
+
+        await self._vector_service.create_vector_space(space, embedding_model)
+        await self._vector_service.add_documents_to_vector_space(
+            space=space,
+            embedding_model=embedding_model,
+            documents=[VectorDocument(id=uuid.uuid4().hex, content=question, metadata={'answer': answer})]
+        )
+
+    async def _get_settings(self) -> tuple[str, float]:
+        embedding_model = await self._settings_service.get_setting(
+            SettingKey.SEMANTIC_CACHE_EMBEDDING_MODEL.key, SettingKey.SEMANTIC_CACHE_EMBEDDING_MODEL.default)
+        min_similarity = await self._settings_service.get_setting(
+            SettingKey.SEMANTIC_CACHE_MIN_SIMILARITY.key, SettingKey.SEMANTIC_CACHE_MIN_SIMILARITY.default)
+
+        return embedding_model, float(min_similarity)
+
+    @staticmethod
+    def _space(assistant_id: str, version: str, embedding_model: str) -> str:
+        # Questions embedded by another model can't be compared, so they are another version as well
+        space_version = hashlib.sha256(f'{version}\0{embedding_model}'.encode('utf-8')).hexdigest()[:16]
+        return f'answers_{assistant_id}_{space_version}'
@@ -1,11 +1,15 @@
-import asyncio
 import json
 
 from sse_starlette import ServerSentEvent, EventSourceResponse
 
 from src.common.get_timestamp import get_timestamp
+from src.modules.chat.helpers.coalesce_chat_stream import coalesce_chat_stream
+from src.modules.chat.helpers.serialize_chat_event import serialize_chat_event
 from src.modules.chat.protocols.IChatService import IChatService
 from src.modules.ai.completions.models.Feature import Feature
+from src.modules.chat.protocols.IChatStreamService import IChatStreamService
+from src.modules.settings.protocols.ISettingsService import ISettingsService
+from src.modules.settings.settings import SettingKey
 
 
 async def event_source_llm_generator(
@@ -14,54 +18,90 @@ async def event_source_llm_generator(
         start_new_conversation: bool,
         user_message: str,
         chat_service: IChatService,
+        chat_stream_service: IChatStreamService,
+        settings_service: ISettingsService,
         features: list[Feature],
 ):
-    async def sse_generator():
-        try:
-            if start_new_conversation:
-                chat_generator = chat_service.start_new_chat(
-                    as_uid=calling_uid,
-                    assistant_id=assistant_or_conversation_id,
-                    message=user_message,
-                    enabled_features=features
-                )
-            else:
-                chat_generator = chat_service.continue_chat(
-                    as_uid=calling_uid,
-                    conversation_id=assistant_or_conversation_id,
-                    message=user_message,
-                    enabled_features=features
-                )
+    if start_new_conversation:
+        chat_generator = chat_service.start_new_chat(
+            as_uid=calling_uid,
+            assistant_id=assistant_or_conversation_id,
+            message=user_message,
+            enabled_features=features
+        )
+    else:
+        chat_generator = chat_service.continue_chat(
+            as_uid=calling_uid,
+            conversation_id=assistant_or_conversation_id,
+            message=user_message,
+            enabled_features=features
+        )
 
-            async for chat_event in chat_generator:
-                yield ServerSentEvent(
-                    event=f'chat.{chat_event.event}',
-                    data=json.dumps({
-                        'timestamp': get_timestamp(),
-                        **chat_event.model_dump()
-                    })
-                )
-        except asyncio.CancelledError as e:
-            # likely user cancelled generating
-            raise e
-        except Exception as e:
-            print(f'error generating chat: {e}')
-            yield ServerSentEvent(
-                event='chat.error',
-                data=json.dumps({
-                    'timestamp': get_timestamp(),
-                    'source': 'error',
-                    'message': 'Error:eslg'
-                })
-            )
-            raise e
+    # The generation runs in the background so it survives dropped connections, see `event_source_chat_stream`
+    stream_id = await chat_stream_service.start_stream(
+        as_uid=calling_uid,
+        chat_events=chat_generator,
+        conversation_id=None if start_new_conversation else assistant_or_conversation_id
+    )
+
+    return await event_source_chat_stream(
+        calling_uid=calling_uid,
+        stream_id=stream_id,
+        chat_stream_service=chat_stream_service,
+        settings_service=settings_service
+    )
+
+
+async def event_source_chat_stream(
+        calling_uid: str,
+        stream_id: str,
+        chat_stream_service: IChatStreamService,
+        settings_service: ISettingsService,
+        after_index: int = -1,
+) -> EventSourceResponse | None:
+    """
+    Stream (or resume streaming) a chat generation. Event ids are `<stream id>:<event index>`,
+    so a reconnecting client's `Last-Event-ID` tells where to resume.
 
-        finally:
+    Message deltas arriving in quick succession are sent as a single frame, see `coalesce_chat_stream`.
+
+    :return: None if the stream can not be (re)subscribed to.
+    """
+    chat_stream_events = await chat_stream_service.subscribe(
+        as_uid=calling_uid,
+        stream_id=stream_id,
+        after_index=after_index
+    )
+
+    if chat_stream_events is None:
+        return None
+
+    flush_interval_seconds, flush_max_chars, ping_interval_seconds = [
+        await settings_service.get_setting(setting.key, setting.default) for setting in (
+            SettingKey.SSE_FLUSH_INTERVAL_SECONDS,
+            SettingKey.SSE_FLUSH_MAX_CHARS,
+            SettingKey.SSE_PING_INTERVAL_SECONDS,
+        )
+    ]
+
+    async def sse_generator():
+        async for stream_event in coalesce_chat_stream(chat_stream_events, float(flush_interval_seconds or 0),
+                                                       int(flush_max_chars or 0)):
             yield ServerSentEvent(
-                event='chat.message_end',
-                data=json.dumps({
-                    'timestamp': get_timestamp()
-                })
+                id=f'{stream_id}:{stream_event.index}',
+                event=f'chat.{stream_event.chat_event.event}',
+                data=serialize_chat_event(stream_event.timestamp, stream_event.chat_event)
             )
 
-    return EventSourceResponse(sse_generator())
+        yield ServerSentEvent(
+            event='chat.message_end',
+            data=json.dumps({
+                'timestamp': get_timestamp()
+            })
+        )
+
+    return EventSourceResponse(
+        sse_generator(),
+        ping=max(1.0, float(ping_interval_seconds or SettingKey.SSE_PING_INTERVAL_SECONDS.default)),
+        ping_message_factory=lambda: ServerSentEvent(comment='ping')
+    )
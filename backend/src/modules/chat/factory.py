@@ -1,13 +1,25 @@
 from pymongo.asynchronous.database import AsyncDatabase
 
 from src.modules.assistants.protocols.IAssistantService import IAssistantService
+from src.modules.chat.InMemoryChatStreamService import InMemoryChatStreamService
 from src.modules.chat.LLMChatService import LLMChatService
 from src.modules.chat.MongoMessageStoreService import MongoMessageStoreService
+from src.modules.chat.MongoScoreCacheService import MongoScoreCacheService
+from src.modules.chat.VectorSemanticAnswerCacheService import VectorSemanticAnswerCacheService
 from src.modules.chat.protocols.IChatService import IChatService
+from src.modules.chat.protocols.IChatStreamService import IChatStreamService
 from src.modules.chat.protocols.IMessageStoreService import IMessageStoreService
+from src.modules.chat.protocols.IScoreCacheService import IScoreCacheService
+from src.modules.chat.protocols.ISemanticAnswerCacheService import ISemanticAnswerCacheService
 from src.modules.collections.protocols.ICollectionService import ICollectionService
+from src.modules.conversations.protocols.IConversationJournalService import IConversationJournalService
 from src.modules.conversations.protocols.IConversationService import IConversationService
 from src.modules.ai.completions.factory import CompletionsServiceFactory
+from src.modules.ai.scheduler.protocols.IGenerationScheduler import IGenerationScheduler
+from src.modules.models.protocols.IModelCapabilityService import IModelCapabilityService
+from src.modules.rerank.protocols.IRerankService import IRerankService
+from src.modules.settings.protocols.ISettingsService import ISettingsService
+from src.modules.vector.protocols.IVectorService import IVectorService
 
 
 class ChatServiceFactory:
@@ -16,19 +28,40 @@ class ChatServiceFactory:
             completions_factory: CompletionsServiceFactory,
             assistant_service: IAssistantService,
             conversation_service: IConversationService,
+            conversation_journal_service: IConversationJournalService,
             collection_service: ICollectionService,
+            settings_service: ISettingsService,
+            score_cache_service: IScoreCacheService,
+            rerank_service: IRerankService,
+            model_capability_service: IModelCapabilityService,
+            generation_scheduler: IGenerationScheduler,
+            semantic_answer_cache_service: ISemanticAnswerCacheService,
     ):
         self._completions_factory = completions_factory
         self._assistant_service = assistant_service
         self._conversation_service = conversation_service
+        self._conversation_journal_service = conversation_journal_service
         self._collection_service = collection_service
+        self._settings_service = settings_service
+        self._score_cache_service = score_cache_service
+        self._rerank_service = rerank_service
+        self._model_capability_service = model_capability_service
+        self._generation_scheduler = generation_scheduler
+        self._semantic_answer_cache_service = semantic_answer_cache_service
 
     def get(self) -> IChatService:
         return LLMChatService(
             completions_factory=self._completions_factory,
             assistant_service=self._assistant_service,
             conversation_service=self._conversation_service,
-            collection_service=self._collection_service
+            conversation_journal_service=self._conversation_journal_service,
+            collection_service=self._collection_service,
+            settings_service=self._settings_service,
+            score_cache_service=self._score_cache_service,
+            rerank_service=self._rerank_service,
+            model_capability_service=self._model_capability_service,
+            generation_scheduler=self._generation_scheduler,
+            semantic_answer_cache_service=self._semantic_answer_cache_service
         )
 
 
@@ -40,3 +73,28 @@ class MessageStoreServiceFactory:
         service = MongoMessageStoreService(self._mongo_database)
         await service.init(expiry_seconds=30)
         return service
+
+
+class ScoreCacheServiceFactory:
+    def __init__(self, mongo_database: AsyncDatabase):
+        self._mongo_database = mongo_database
+
+    async def get(self) -> IScoreCacheService:
+        service = MongoScoreCacheService(self._mongo_database)
+        await service.init(expiry_seconds=7 * 24 * 60 * 60, max_entries=100_000)
+        return service
+
+
+class SemanticAnswerCacheServiceFactory:
+    def __init__(self, vector_service: IVectorService, settings_service: ISettingsService):
+        self._vector_service = vector_service
+        self._settings_service = settings_service
+
+    def get(self) -> ISemanticAnswerCacheService:
+        return VectorSemanticAnswerCacheService(vector_service=self._vector_service,
+                                                settings_service=self._settings_service)
+
+
+class ChatStreamServiceFactory:
+    def get(self) -> IChatStreamService:
+        return InMemoryChatStreamService()
@@ -0,0 +1,96 @@
+import asyncio
+from typing import AsyncGenerator
+
+from src.modules.chat.models.ChatEvent import ChatMessageEvent
+from src.modules.chat.models.ChatStreamEvent import ChatStreamEvent
+
+
+async def coalesce_chat_stream(
+        events: AsyncGenerator[ChatStreamEvent, None],
+        flush_interval_seconds: float,
+        flush_max_chars: int = 0,
+) -> AsyncGenerator[ChatStreamEvent, None]:
+    """
+    Merge consecutive message events from the same source, so fast streams are sent as fewer, larger frames.
+
+    The first message event is passed on immediately. After that message events are held for up to
+    `flush_interval_seconds` (or until they hold `flush_max_chars` characters, if above 0) while later
+    ones are appended to them. All other events flush what is held and are passed on as they are.
+
+    A merged event has the index of the last event merged into it, so resuming after it skips all of them.
+
+    :param flush_interval_seconds: 0 passes every event on as it is.
+    """
+    if flush_interval_seconds <= 0:
+        async for event in events:
+            yield event
+        return
+
+    loop = asyncio.get_running_loop()
+    held: ChatStreamEvent | None = None
+    held_chars = 0
+    flush_at = 0.0
+    sent_first_message = False
+    next_event: asyncio.Future | None = None
+
+    try:
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(anext(events, None))
+
+            timeout = None if held is None else max(0.0, flush_at - loop.time())
+            done, _ = await asyncio.wait({next_event}, timeout=timeout)
+
+            if len(done) == 0:
+                yield held
+                held = None
+                continue
+
+            event = next_event.result()
+            next_event = None
+
+            if event is None:
+                break
+
+            chat_event = event.chat_event
+
+            if not isinstance(chat_event, ChatMessageEvent) or not sent_first_message:
+                if held is not None:
+                    yield held
+                    held = None
+
+                sent_first_message = sent_first_message or isinstance(chat_event, ChatMessageEvent)
+                yield event
+                continue
+
+            if held is not None and held.chat_event.source == chat_event.source:
+                held = ChatStreamEvent(index=event.index, timestamp=held.timestamp, chat_event=ChatMessageEvent(
+                    source=chat_event.source,
+                    message=_concat(held.chat_event.message, chat_event.message),
+                    reasoning=_concat(held.chat_event.reasoning, chat_event.reasoning),
+                ))
+            else:
+                if held is not None:
+                    yield held
+
+                held = event
+                held_chars = 0
+                flush_at = loop.time() + flush_interval_seconds
+
+            held_chars += len(chat_event.message or '') + len(chat_event.reasoning or '')
+
+            if 0 < flush_max_chars <= held_chars:
+                yield held
+                held = None
+
+        if held is not None:
+            yield held
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+            await asyncio.gather(next_event, return_exceptions=True)
+        await events.aclose()
+
+
+def _concat(a: str | None, b: str | None) -> str | None:
+    return b if a is None else a if b is None else a + b
@@ -0,0 +1,49 @@
+import re
+from typing import Literal
+
+RetrievalDecision = Literal['retrieve', 'reuse', 'skip']
+
+_ACKNOWLEDGEMENT_WORDS = {
+    'thanks', 'thank', 'you', 'thx', 'ty', 'ok', 'okay', 'great', 'nice', 'cool', 'perfect', 'good', 'awesome',
+    'got', 'it', 'hi', 'hello', 'hey', 'bye', 'yes', 'no', 'sure',
+    'tack', 'så', 'mycket', 'bra', 'perfekt', 'toppen', 'super', 'hej', 'hejdå', 'ja', 'nej', 'okej', 'snyggt',
+}
+
+_FOLLOW_UP_WORDS = {
+    'more', 'elaborate', 'explain', 'why', 'example', 'examples', 'continue', 'shorter', 'longer', 'summarize',
+    'simpler', 'detail', 'details',
+    'mer', 'mera', 'utveckla', 'förklara', 'varför', 'exempel', 'fortsätt', 'kortare', 'längre', 'sammanfatta',
+    'enklare', 'detaljer', 'detaljerat',
+}
+
+# Words a follow-up may contain besides follow-up words, anything else is new content that needs a new search
+_FILLER_WORDS = {
+    'it', 'that', 'this', 'those', 'these', 'them', 'can', 'could', 'would', 'you', 'please', 'me', 'tell', 'give',
+    'a', 'an', 'the', 'of', 'in', 'on', 'about', 'with', 'and', 'so', 'some', 'bit', 'little', 'is', 'do', 'does',
+    'what', 'how', 'i', 'make', 'go',
+    'det', 'den', 'detta', 'dessa', 'dem', 'dom', 'kan', 'kunde', 'skulle', 'du', 'ni', 'snälla', 'gärna', 'mig',
+    'berätta', 'ge', 'om', 'i', 'på', 'med', 'och', 'så', 'lite', 'en', 'ett', 'är', 'vad', 'hur', 'då', 'jag', 'göra',
+}
+
+
+def decide_retrieval(message: str, has_previous_results: bool, max_follow_up_words: int = 8) -> RetrievalDecision:
+    """
+    Cheap heuristic deciding if a user message needs a new collection search.
+
+    - `skip`: the message is an acknowledgement or greeting that cannot use any evidence.
+    - `reuse`: the message is a short follow-up to the previous turn (such as "explain that in more detail"),
+      whose results can be used again. It must not add any words besides follow-up and filler words,
+      so a short question about a new topic is still searched for.
+    - `retrieve`: anything else.
+    """
+    words = re.findall(r'\w+', message.lower())
+
+    if len(words) == 0 or (len(words) <= 5 and all(w in _ACKNOWLEDGEMENT_WORDS for w in words)):
+        return 'skip'
+
+    if has_previous_results and len(words) <= max_follow_up_words \
+            and any(w in _FOLLOW_UP_WORDS for w in words) \
+            and all(w in _FOLLOW_UP_WORDS or w in _FILLER_WORDS for w in words):
+        return 'reuse'
+
+    return 'retrieve'
@@ -0,0 +1,37 @@
+from typing import Callable, TypeVar
+
+from src.modules.chat.helpers.word_shingles import word_shingles
+
+T = TypeVar('T')
+
+
+def drop_near_duplicates(
+        items: list[T],
+        get_text: Callable[[T], str],
+        max_similarity: float = 0.8,
+        shingle_size: int = 5,
+) -> list[T]:
+    """
+    Drop items whose text is a near-duplicate (word shingle Jaccard similarity of at least `max_similarity`)
+    of an earlier item. Items are expected to be ordered best first, so the best of each group of duplicates is kept.
+    """
+    kept: list[T] = []
+    kept_shingles: list[set[tuple[str, ...]]] = []
+
+    for item in items:
+        shingles = word_shingles(get_text(item), shingle_size)
+
+        if any(_jaccard(shingles, other) >= max_similarity for other in kept_shingles):
+            continue
+
+        kept.append(item)
+        kept_shingles.append(shingles)
+
+    return kept
+
+
+def _jaccard(a: set, b: set) -> float:
+    if len(a) == 0 and len(b) == 0:
+        return 1.0
+
+    return len(a & b) / len(a | b)
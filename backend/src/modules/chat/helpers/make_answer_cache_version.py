@@ -0,0 +1,23 @@
+import hashlib
+import json
+
+from src.modules.assistants.models.Assistant import Assistant
+from src.modules.collections.models.CollectionMetadata import CollectionMetadata
+
+
+def make_answer_cache_version(assistant: Assistant, collection: CollectionMetadata | None) -> str:
+    """
+    Version of the answers an assistant gives, cached answers are only reused for the same version.
+
+    Changes when the instructions, model or LLM params change, or the assistant is given another
+    collection or the documents of its collection are set again.
+    """
+    version = json.dumps([
+        assistant.model,
+        assistant.instructions,
+        assistant.extra_llm_params,
+        assistant.collection_id,
+        collection.documents_updated_at if collection is not None else None,
+    ], sort_keys=True)
+
+    return hashlib.sha256(version.encode('utf-8')).hexdigest()[:16]
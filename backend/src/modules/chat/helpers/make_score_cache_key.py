@@ -0,0 +1,22 @@
+import hashlib
+import json
+
+
+def make_score_cache_key(
+        query: str,
+        chunk: str,
+        scoring_model: str,
+        scoring_instructions: str,
+        scoring_params: dict | None,
+        scoring_mode: str
+) -> str:
+    """
+    Cache key for the relevance score of a chunk for a query.
+
+    The query is normalized (case and whitespace) so near-identical questions share scores,
+    and anything about the scoring assistant that could change the score is part of the key.
+    """
+    normalized_query = ' '.join(query.lower().split())
+    scorer = json.dumps([scoring_model, scoring_instructions, scoring_params, scoring_mode], sort_keys=True)
+
+    return hashlib.sha256('\0'.join([normalized_query, chunk, scorer]).encode('utf-8')).hexdigest()
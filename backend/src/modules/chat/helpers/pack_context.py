@@ -0,0 +1,42 @@
+from typing import Callable
+
+from src.modules.chat.helpers.word_shingles import word_shingles
+
+
+def pack_context(
+        results: list[tuple[str, int]],
+        budget_tokens: int,
+        count_tokens: Callable[[str], int],
+        max_overlap: float = 0.8,
+        shingle_size: int = 8,
+) -> list[str]:
+    """
+    Greedily pick results, best score first, until the token budget is used up.
+
+    Results that don't fit are skipped so smaller, lower scoring ones can still use the rest of the budget.
+    Results whose word shingles are mostly (`max_overlap`) covered by already picked results are skipped as well,
+    since overlapping chunks would only repeat the same evidence.
+
+    :return: The picked results in score order.
+    """
+    packed: list[str] = []
+    packed_shingles: set[tuple[str, ...]] = set()
+    used_tokens = 0
+
+    for result, _ in sorted(results, key=lambda r: r[1], reverse=True):
+        shingles = word_shingles(result, shingle_size)
+
+        if len(shingles) > 0 and len(shingles & packed_shingles) / len(shingles) >= max_overlap:
+            continue
+
+        tokens = count_tokens(result)
+
+        if used_tokens + tokens > budget_tokens:
+            continue
+
+        packed.append(result)
+        packed_shingles |= shingles
+        used_tokens += tokens
+
+    return packed
+
@@ -0,0 +1,39 @@
+import json
+
+
+def parse_batch_scores(response: str | None, ids: list[str]) -> dict[str, int] | None:
+    """
+    Parse a batched relevance scoring response.
+
+    Accepts either a JSON array of `{"id": ..., "score": ...}` objects or an
+    object with such an array in `scores`. Entries with unknown ids or
+    non-numeric scores are ignored.
+
+    :return: Scores by id, or None if the response could not be parsed at all.
+    """
+    try:
+        parsed = json.loads(response)
+    except (TypeError, ValueError):
+        return None
+
+    entries = parsed.get('scores') if isinstance(parsed, dict) else parsed
+
+    if not isinstance(entries, list):
+        return None
+
+    valid_ids = set(ids)
+    scores: dict[str, int] = {}
+
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+
+        entry_id = entry.get('id')
+        score = entry.get('score')
+
+        if entry_id not in valid_ids or isinstance(score, bool) or not isinstance(score, (int, float)):
+            continue
+
+        scores[entry_id] = int(score)
+
+    return scores
@@ -0,0 +1,15 @@
+def parse_last_event_id(last_event_id: str | None) -> tuple[str, int] | None:
+    """
+    Parse an SSE event id of the form `<stream id>:<event index>`.
+
+    :return: The stream id and event index, or None if the id is missing or malformed.
+    """
+    if last_event_id is None:
+        return None
+
+    stream_id, separator, index = last_event_id.strip().rpartition(':')
+
+    if separator == '' or len(stream_id) == 0 or not index.isdigit():
+        return None
+
+    return stream_id, int(index)
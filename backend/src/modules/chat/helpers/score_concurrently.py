@@ -0,0 +1,60 @@
+import asyncio
+from typing import TypeVar, Callable, Awaitable
+
+T = TypeVar('T')
+
+
+async def score_concurrently(
+        items: list[T],
+        score: Callable[[T], Awaitable[int]],
+        max_concurrency: int,
+        timeout_seconds: float,
+        accept_threshold: int,
+        stop_after_accepted: int = 0,
+) -> list[tuple[T, int]]:
+    """
+    Score items concurrently with at most `max_concurrency` calls in flight.
+
+    Items whose scoring times out or fails are left out of the result.
+
+    :param stop_after_accepted: If above 0, stop scoring (and cancel pending calls) as soon as
+        this many items have scored at or above `accept_threshold`.
+    :return: Scored items in their original order.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _score(index: int, item: T) -> tuple[int, int | None]:
+        async with semaphore:
+            try:
+                return index, await asyncio.wait_for(score(item), timeout=timeout_seconds)
+            except asyncio.TimeoutError:
+                print(f'WARNING: scoring timed out after {timeout_seconds}s')
+                return index, None
+            except Exception as e:
+                print(f'WARNING: scoring failed: {e}')
+                return index, None
+
+    tasks = [asyncio.create_task(_score(i, item)) for i, item in enumerate(items)]
+    scores: dict[int, int] = {}
+    accepted = 0
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, item_score = await next_done
+
+            if item_score is None:
+                continue
+
+            scores[index] = item_score
+
+            if item_score >= accept_threshold:
+                accepted += 1
+
+            if 0 < stop_after_accepted <= accepted:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return [(items[i], scores[i]) for i in sorted(scores.keys())]
@@ -0,0 +1,26 @@
+import json
+from dataclasses import fields
+from operator import attrgetter
+from typing import get_args
+
+from src.modules.chat.models.ChatEvent import ChatEvent
+
+_encode = json.JSONEncoder().encode
+
+# Field names and a getter for their values per event type (all of them have at least two fields), worked out once instead of on every token
+_SERIALIZERS = {
+    event_type: ((names := tuple(f.name for f in fields(event_type))), attrgetter(*names))
+    for event_type in get_args(ChatEvent)
+}
+
+
+def serialize_chat_event(timestamp: str, chat_event: ChatEvent) -> str:
+    """
+    :return: The JSON sent as SSE data for a chat event: its timestamp followed by all its fields.
+    """
+    names, get_values = _SERIALIZERS[type(chat_event)]
+
+    data = {'timestamp': timestamp}
+    data.update(zip(names, get_values(chat_event)))
+
+    return _encode(data)
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from src.modules.chat.helpers.coalesce_chat_stream import coalesce_chat_stream
+from src.modules.chat.models.ChatEvent import ChatMessageEvent, ChatConversationIdEvent, ChatEvent
+from src.modules.chat.models.ChatStreamEvent import ChatStreamEvent
+
+
+async def _events(*items: ChatEvent | float):
+    """
+    Yield the chat events as stream events, numbers are pauses in seconds.
+    """
+    index = 0
+    for item in items:
+        if isinstance(item, float):
+            await asyncio.sleep(item)
+            continue
+
+        yield ChatStreamEvent(index=index, timestamp=str(index), chat_event=item)
+        index += 1
+
+
+async def _collect(events) -> list[tuple[int, ChatEvent]]:
+    return [(e.index, e.chat_event) for e in [e async for e in events]]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_chat_stream_merges_after_first_message():
+    events = _events(
+        ChatConversationIdEvent(conversation_id='c'),
+        ChatMessageEvent(source='assistant', message='a'),
+        ChatMessageEvent(source='assistant', reasoning='b'),
+        ChatMessageEvent(source='assistant', message='c'),
+        ChatMessageEvent(source='tool', message='d'),
+    )
+
+    assert await _collect(coalesce_chat_stream(events, flush_interval_seconds=10)) == [
+        (0, ChatConversationIdEvent(conversation_id='c')),
+        (1, ChatMessageEvent(source='assistant', message='a')),
+        (3, ChatMessageEvent(source='assistant', message='c', reasoning='b')),
+        (4, ChatMessageEvent(source='tool', message='d')),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_chat_stream_flushes_after_interval():
+    events = _events(
+        ChatMessageEvent(source='assistant', message='a'),
+        ChatMessageEvent(source='assistant', message='b'),
+        ChatMessageEvent(source='assistant', message='c'),
+        0.2,
+        ChatMessageEvent(source='assistant', message='d'),
+    )
+
+    assert await _collect(coalesce_chat_stream(events, flush_interval_seconds=0.05)) == [
+        (0, ChatMessageEvent(source='assistant', message='a')),
+        (2, ChatMessageEvent(source='assistant', message='bc')),
+        (3, ChatMessageEvent(source='assistant', message='d')),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_chat_stream_flushes_at_max_chars():
+    events = _events(*[ChatMessageEvent(source='assistant', message='ab') for _ in range(6)])
+
+    assert await _collect(coalesce_chat_stream(events, flush_interval_seconds=10, flush_max_chars=4)) == [
+        (0, ChatMessageEvent(source='assistant', message='ab')),
+        (2, ChatMessageEvent(source='assistant', message='abab')),
+        (4, ChatMessageEvent(source='assistant', message='abab')),
+        (5, ChatMessageEvent(source='assistant', message='ab')),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_chat_stream_disabled():
+    events = _events(*[ChatMessageEvent(source='assistant', message=str(i)) for i in range(3)])
+
+    assert await _collect(coalesce_chat_stream(events, flush_interval_seconds=0)) == [
+        (i, ChatMessageEvent(source='assistant', message=str(i))) for i in range(3)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_chat_stream_close_closes_source():
+    closed = asyncio.Event()
+
+    async def events():
+        try:
+            yield ChatStreamEvent(index=0, timestamp='0', chat_event=ChatMessageEvent(source='assistant', message='a'))
+            await asyncio.sleep(10)
+        finally:
+            closed.set()
+
+    coalesced = coalesce_chat_stream(events(), flush_interval_seconds=0.05)
+    await anext(coalesced)
+    await coalesced.aclose()
+
+    assert closed.is_set()
@@ -0,0 +1,25 @@
+import pytest
+
+from src.modules.chat.helpers.decide_retrieval import decide_retrieval
+
+
+@pytest.mark.parametrize('message, has_previous_results, expected', [
+    ('Thanks!', True, 'skip'),
+    ('ok, thank you', False, 'skip'),
+    ('Tack så mycket!', True, 'skip'),
+    ('👍', True, 'skip'),
+    ('Can you explain that in more detail?', True, 'reuse'),
+    ('Varför då?', True, 'reuse'),
+    ('Kan du förklara det lite mer?', True, 'reuse'),
+    ('Why is that?', True, 'reuse'),
+    ('Can you explain that in more detail?', False, 'retrieve'),
+    ('What are the opening hours of the library?', True, 'retrieve'),
+    # Short questions about a new topic, pronouns alone don't make a follow-up
+    ('Vad kostar det att parkera vid Knutpunkten?', True, 'retrieve'),
+    ('Hur söker jag bygglov för den?', True, 'retrieve'),
+    ('Tell me more about the swimming pool', True, 'retrieve'),
+    ('Is it open on sundays?', True, 'retrieve'),
+    ('Why does the library close early on fridays during the summer holidays and christmas?', True, 'retrieve'),
+])
+def test_decide_retrieval(message, has_previous_results, expected):
+    assert decide_retrieval(message, has_previous_results) == expected
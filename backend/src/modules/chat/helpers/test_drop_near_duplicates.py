@@ -0,0 +1,29 @@
+from src.modules.chat.helpers.drop_near_duplicates import drop_near_duplicates
+
+FOOTER = 'Helsingborgs stad, Stortorget 17, 251 89 Helsingborg. Telefon 042-10 50 00. www.helsingborg.se'
+
+
+def test_drop_near_duplicates():
+    items = [
+        'The library is open from ten to six on weekdays.',
+        FOOTER,
+        'The swimming pool is closed during the summer holidays.',
+        FOOTER + ' Page 2',
+        'the library is OPEN from ten to six on weekdays!',
+    ]
+
+    result = drop_near_duplicates(items, get_text=lambda x: x)
+
+    assert result == [items[0], items[1], items[2]]
+
+
+def test_drop_near_duplicates_keeps_order_and_objects():
+    items = [{'text': 'a b c d e f'}, {'text': 'g h i j k l'}, {'text': 'a b c d e f'}]
+
+    result = drop_near_duplicates(items, get_text=lambda x: x['text'])
+
+    assert result == [items[0], items[1]]
+
+
+def test_drop_near_duplicates_empty():
+    assert drop_near_duplicates([], get_text=lambda x: x) == []
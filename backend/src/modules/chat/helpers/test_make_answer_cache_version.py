@@ -0,0 +1,42 @@
+from src.modules.assistants.models.Assistant import Assistant
+from src.modules.chat.helpers.make_answer_cache_version import make_answer_cache_version
+from src.modules.collections.models.CollectionMetadata import CollectionMetadata
+
+
+def _assistant(**kwargs) -> Assistant:
+    return Assistant(**{
+        'id': 'assistant',
+        'owner': 'admin',
+        'meta': {},
+        'instructions': 'instructions',
+        'model': 'openai/gpt-4o',
+        'llm_api_key': None,
+        'collection_id': 'collection',
+        'max_collection_results': 5,
+        'extra_llm_params': {'temperature': 0},
+        **kwargs
+    })
+
+
+def _collection(documents_updated_at: str | None = '1') -> CollectionMetadata:
+    return CollectionMetadata(id='collection', label='', embedding_model='default', files=[], urls=[],
+                              documents_updated_at=documents_updated_at)
+
+
+def test_make_answer_cache_version_changes():
+    versions = {
+        make_answer_cache_version(_assistant(), _collection()),
+        make_answer_cache_version(_assistant(instructions='other instructions'), _collection()),
+        make_answer_cache_version(_assistant(model='openai/gpt-4o-mini'), _collection()),
+        make_answer_cache_version(_assistant(extra_llm_params={'temperature': 1}), _collection()),
+        make_answer_cache_version(_assistant(collection_id='other collection'), _collection()),
+        make_answer_cache_version(_assistant(), _collection(documents_updated_at='2')),
+        make_answer_cache_version(_assistant(collection_id=None), None),
+    }
+
+    assert len(versions) == 7
+
+
+def test_make_answer_cache_version_ignores_unrelated_changes():
+    assert make_answer_cache_version(_assistant(), _collection()) == make_answer_cache_version(
+        _assistant(meta={'name': 'renamed'}, max_collection_results=10, llm_api_key='key'), _collection())
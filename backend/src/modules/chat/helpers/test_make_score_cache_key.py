@@ -0,0 +1,27 @@
+from src.modules.chat.helpers.make_score_cache_key import make_score_cache_key
+
+
+def _key(query='What is RAG?', chunk='chunk', model='openai/gpt-4o', instructions='score', params=None,
+         mode='individual'):
+    return make_score_cache_key(query, chunk, model, instructions, params, mode)
+
+
+def test_make_score_cache_key_normalizes_query():
+    assert _key(query='What is RAG?') == _key(query='  what   IS rag?\n')
+
+
+def test_make_score_cache_key_depends_on_chunk_and_scorer():
+    keys = {
+        _key(),
+        _key(chunk='another chunk'),
+        _key(model='openai/gpt-4o-mini'),
+        _key(instructions='score differently'),
+        _key(params={'temperature': 0}),
+        _key(mode='batched'),
+    }
+
+    assert len(keys) == 6
+
+
+def test_make_score_cache_key_ignores_param_order():
+    assert _key(params={'a': 1, 'b': 2}) == _key(params={'b': 2, 'a': 1})
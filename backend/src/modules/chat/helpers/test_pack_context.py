@@ -0,0 +1,39 @@
+from src.modules.chat.helpers.pack_context import pack_context
+
+
+def _count_words(text: str) -> int:
+    return len(text.split())
+
+
+def test_pack_context_score_order():
+    results = [('low score result', 10), ('high score result', 90), ('mid score result', 50)]
+
+    packed = pack_context(results, budget_tokens=100, count_tokens=_count_words)
+
+    assert packed == ['high score result', 'mid score result', 'low score result']
+
+
+def test_pack_context_budget():
+    results = [('one two three four', 90), ('one two three four five six', 80), ('seven eight', 70)]
+
+    packed = pack_context(results, budget_tokens=7, count_tokens=_count_words)
+
+    assert packed == ['one two three four', 'seven eight']
+
+
+def test_pack_context_skips_overlapping():
+    text = 'the library is open from ten to six on weekdays and from ten to four on saturdays'
+    results = [
+        (text, 90),
+        (text + ' except holidays', 80),
+        ('the swimming pool is closed during the summer holidays because of maintenance work', 70),
+    ]
+
+    packed = pack_context(results, budget_tokens=1000, count_tokens=_count_words)
+
+    assert packed == [text, results[2][0]]
+
+
+def test_pack_context_empty():
+    assert pack_context([], budget_tokens=100, count_tokens=_count_words) == []
+    assert pack_context([('too long for budget', 90)], budget_tokens=0, count_tokens=_count_words) == []
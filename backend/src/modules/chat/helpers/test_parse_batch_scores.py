@@ -0,0 +1,18 @@
+import pytest
+
+from src.modules.chat.helpers.parse_batch_scores import parse_batch_scores
+
+
+@pytest.mark.parametrize('response, expected', [
+    ('{"scores": [{"id": "0", "score": 80}, {"id": "1", "score": 20.5}]}', {'0': 80, '1': 20}),
+    ('[{"id": "0", "score": 80}, {"id": "1", "score": 20}]', {'0': 80, '1': 20}),
+    ('{"scores": [{"id": "0", "score": 80}, {"id": "unknown", "score": 100}]}', {'0': 80}),
+    ('{"scores": [{"id": "0", "score": "high"}, {"id": "1", "score": true}, "2"]}', {}),
+    ('{"scores": []}', {}),
+    ('{"score": 80}', None),
+    ('not json', None),
+    ('', None),
+    (None, None),
+])
+def test_parse_batch_scores(response, expected):
+    assert parse_batch_scores(response, ['0', '1']) == expected
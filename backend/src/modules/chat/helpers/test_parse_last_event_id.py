@@ -0,0 +1,18 @@
+import pytest
+
+from src.modules.chat.helpers.parse_last_event_id import parse_last_event_id
+
+
+@pytest.mark.parametrize('last_event_id, expected', [
+    ('abc123:0', ('abc123', 0)),
+    (' abc123:42 ', ('abc123', 42)),
+    ('abc123', None),
+    ('abc123:', None),
+    (':5', None),
+    ('abc123:-1', None),
+    ('abc123:x', None),
+    ('', None),
+    (None, None),
+])
+def test_parse_last_event_id(last_event_id, expected):
+    assert parse_last_event_id(last_event_id) == expected
@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+import pytest
+
+from src.modules.chat.helpers.score_concurrently import score_concurrently
+
+
+@pytest.mark.asyncio
+async def test_scores_in_original_order():
+    async def score(item: int) -> int:
+        await asyncio.sleep(0.01 * (5 - item))
+        return item * 10
+
+    result = await score_concurrently([1, 2, 3, 4], score, max_concurrency=4, timeout_seconds=1, accept_threshold=0)
+
+    assert result == [(1, 10), (2, 20), (3, 30), (4, 40)]
+
+
+@pytest.mark.asyncio
+async def test_runs_concurrently():
+    async def score(_: int) -> int:
+        await asyncio.sleep(0.1)
+        return 100
+
+    start = time.perf_counter()
+    result = await score_concurrently(list(range(10)), score, max_concurrency=10, timeout_seconds=1,
+                                      accept_threshold=0)
+    elapsed = time.perf_counter() - start
+
+    assert len(result) == 10
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def score(_: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 100
+
+    await score_concurrently(list(range(10)), score, max_concurrency=3, timeout_seconds=1, accept_threshold=0)
+
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_timeout_and_errors_are_skipped():
+    async def score(item: int) -> int:
+        if item == 1:
+            await asyncio.sleep(1)
+        if item == 2:
+            raise ValueError('invalid score')
+        return 50
+
+    result = await score_concurrently([0, 1, 2, 3], score, max_concurrency=4, timeout_seconds=0.05,
+                                      accept_threshold=0)
+
+    assert result == [(0, 50), (3, 50)]
+
+
+@pytest.mark.asyncio
+async def test_stop_after_accepted():
+    scored = []
+
+    async def score(item: int) -> int:
+        await asyncio.sleep(0.01 * item)
+        scored.append(item)
+        return 100 if item < 2 else 0
+
+    result = await score_concurrently(list(range(10)), score, max_concurrency=10, timeout_seconds=1,
+                                      accept_threshold=70, stop_after_accepted=2)
+
+    assert result == [(0, 100), (1, 100)]
+    assert len(scored) < 10
@@ -0,0 +1,21 @@
+import json
+
+import pytest
+
+from src.modules.chat.helpers.serialize_chat_event import serialize_chat_event
+from src.modules.chat.models.ChatEvent import ChatMessageEvent, ChatErrorEvent, ChatQueuePositionEvent, \
+    ChatConversationIdEvent
+
+
+@pytest.mark.parametrize('chat_event, expected', [
+    (ChatMessageEvent(source='assistant', message='Hej "där"'),
+     {'event': 'message', 'source': 'assistant', 'message': 'Hej "där"', 'reasoning': None}),
+    (ChatErrorEvent(message='invalid assistant'), {'event': 'error', 'message': 'invalid assistant'}),
+    (ChatQueuePositionEvent(position=3), {'event': 'queue_position', 'position': 3}),
+    (ChatConversationIdEvent(conversation_id='abc'), {'event': 'conversation_id', 'conversation_id': 'abc'}),
+])
+def test_serialize_chat_event(chat_event, expected):
+    data = serialize_chat_event('2025-01-01T00:00:00+00:00', chat_event)
+
+    assert json.loads(data) == {'timestamp': '2025-01-01T00:00:00+00:00', **expected}
+    assert list(json.loads(data).keys()) == ['timestamp', *expected.keys()]
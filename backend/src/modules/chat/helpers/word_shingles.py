@@ -0,0 +1,14 @@
+import re
+
+
+def word_shingles(text: str, size: int) -> set[tuple[str, ...]]:
+    """
+    All runs of `size` consecutive words in the text, ignoring case and punctuation.
+    Texts shorter than `size` words give a single shingle of all words.
+    """
+    words = re.findall(r'\w+', text.lower())
+
+    if len(words) < size:
+        return {tuple(words)} if len(words) > 0 else set()
+
+    return {tuple(words[i:i + size]) for i in range(len(words) - size + 1)}
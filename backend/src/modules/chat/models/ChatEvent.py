@@ -1,23 +1,34 @@
+from dataclasses import dataclass, field
 from typing import Literal, Union
 
-from pydantic import BaseModel
 
+# Chat events are created for every streamed token, so they are slotted dataclasses
+# instead of pydantic models. See `serialize_chat_event` for how they are sent to clients.
 
-class ChatErrorEvent(BaseModel):
-    event: Literal['error'] = 'error'
+@dataclass(slots=True)
+class ChatErrorEvent:
+    event: Literal['error'] = field(default='error', init=False)
     message: str
 
 
-class ChatConversationIdEvent(BaseModel):
-    event: Literal['conversation_id'] = 'conversation_id'
+@dataclass(slots=True)
+class ChatConversationIdEvent:
+    event: Literal['conversation_id'] = field(default='conversation_id', init=False)
     conversation_id: str
 
 
-class ChatMessageEvent(BaseModel):
-    event: Literal['message'] = 'message'
+@dataclass(slots=True)
+class ChatMessageEvent:
+    event: Literal['message'] = field(default='message', init=False)
     source: str
     message: str | None = None
     reasoning: str | None = None
 
 
-ChatEvent = Union[ChatErrorEvent, ChatConversationIdEvent, ChatMessageEvent]
+@dataclass(slots=True)
+class ChatQueuePositionEvent:
+    event: Literal['queue_position'] = field(default='queue_position', init=False)
+    position: int
+
+
+ChatEvent = Union[ChatErrorEvent, ChatConversationIdEvent, ChatMessageEvent, ChatQueuePositionEvent]
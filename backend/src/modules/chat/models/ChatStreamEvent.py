@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from src.modules.chat.models.ChatEvent import ChatEvent
+
+
+@dataclass(slots=True)
+class ChatStreamEvent:
+    index: int
+    timestamp: str
+    chat_event: ChatEvent
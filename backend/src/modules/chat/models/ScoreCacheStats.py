@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class ScoreCacheStats(BaseModel):
+    hits: int
+    misses: int
+    entries: int
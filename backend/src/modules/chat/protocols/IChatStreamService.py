@@ -0,0 +1,38 @@
+from typing import Protocol, AsyncGenerator
+
+from src.modules.chat.models.ChatEvent import ChatEvent
+from src.modules.chat.models.ChatStreamEvent import ChatStreamEvent
+
+
+class IChatStreamService(Protocol):
+    """
+    Runs chat generations independently of the connections streaming them,
+    so clients can reconnect to (or several clients follow) the same generation.
+    """
+
+    async def start_stream(self, as_uid: str, chat_events: AsyncGenerator[ChatEvent, None],
+                           conversation_id: str | None = None) -> str:
+        """
+        Start consuming `chat_events` in the background.
+
+        :param conversation_id: The conversation being generated, if already known.
+        For new conversations it is picked up from the generated `conversation_id` event.
+        :return: The stream id.
+        """
+        ...
+
+    async def subscribe(self, as_uid: str, stream_id: str, after_index: int = -1) -> \
+            AsyncGenerator[ChatStreamEvent, None] | None:
+        """
+        Follow a stream, starting after the event with index `after_index` (-1 to start from the beginning).
+
+        :return: The events of the stream until it ends,
+        or None if the stream is unknown or the requested events are no longer buffered.
+        """
+        ...
+
+    async def get_conversation_stream_id(self, as_uid: str, conversation_id: str) -> str | None:
+        """
+        :return: Id of the latest stream generating the conversation, or None if there is none.
+        """
+        ...
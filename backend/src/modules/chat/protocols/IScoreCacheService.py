@@ -0,0 +1,24 @@
+from typing import Protocol
+
+from src.modules.chat.models.ScoreCacheStats import ScoreCacheStats
+
+
+class IScoreCacheService(Protocol):
+    """
+    Cache of RAG relevance scores, keyed by keys from `make_score_cache_key`.
+    """
+
+    async def get_scores(self, keys: list[str]) -> dict[str, int]:
+        """
+        :return: Cached scores by key, keys without a (non-expired) score are left out.
+        """
+        ...
+
+    async def set_scores(self, scores: dict[str, int]) -> None:
+        ...
+
+    async def get_stats(self) -> ScoreCacheStats:
+        """
+        :return: Hit/miss counters since startup and the current number of cached scores.
+        """
+        ...
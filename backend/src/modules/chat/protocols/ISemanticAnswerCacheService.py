@@ -0,0 +1,20 @@
+from typing import Protocol
+
+
+class ISemanticAnswerCacheService(Protocol):
+    """
+    Cache of answers to the first message of a chat, looked up by similarity of the message
+    for the same assistant and version (see `make_answer_cache_version`).
+    """
+
+    async def get_answer(self, assistant_id: str, version: str, question: str) -> str | None:
+        """
+        :return: The answer to the most similar cached question, None if no question is similar enough.
+        """
+        ...
+
+    async def set_answer(self, assistant_id: str, version: str, question: str, answer: str) -> None:
+        """
+        Cache an answer, dropping answers cached for other versions of the assistant.
+        """
+        ...
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from src.modules.chat.InMemoryChatStreamService import InMemoryChatStreamService
+from src.modules.chat.models.ChatEvent import ChatMessageEvent, ChatErrorEvent
+from src.modules.chat.test_chat_stream_service import BaseChatStreamServiceTestClass, _chat_events, _collect
+
+
+@pytest.fixture
+def service():
+    return InMemoryChatStreamService(buffer_size=10, orphan_timeout_seconds=0.05, retention_seconds=0.05)
+
+
+class TestInMemoryChatStreamServiceClass(BaseChatStreamServiceTestClass):
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_in_memory_chat_stream_service_buffer_overrun(service: InMemoryChatStreamService):
+        stream_id = await service.start_stream('user', _chat_events(20))
+        subscription = await service.subscribe('user', stream_id)
+        await asyncio.sleep(0.01)
+
+        events = await _collect(subscription)
+
+        assert len(events) == 1
+        assert isinstance(events[0].chat_event, ChatErrorEvent)
+        assert await service.subscribe('user', stream_id) is None
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_in_memory_chat_stream_service_cancels_orphans(service: InMemoryChatStreamService):
+        finished = False
+
+        async def endless_events():
+            nonlocal finished
+            try:
+                while True:
+                    await asyncio.sleep(0.01)
+                    yield ChatMessageEvent(source='assistant', message='.')
+            finally:
+                finished = True
+
+        stream_id = await service.start_stream('user', endless_events())
+        subscription = await service.subscribe('user', stream_id)
+        await anext(subscription)
+        await subscription.aclose()
+
+        await asyncio.sleep(0.2)
+
+        assert finished
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_in_memory_chat_stream_service_retention(service: InMemoryChatStreamService):
+        stream_id = await service.start_stream('user', _chat_events(1, conversation_id='conversation'))
+        await _collect(await service.subscribe('user', stream_id))
+
+        await asyncio.sleep(0.1)
+
+        assert await service.subscribe('user', stream_id) is None
+        assert await service.get_conversation_stream_id('user', 'conversation') is None
@@ -0,0 +1,448 @@
+import asyncio
+import json
+
+import pytest
+
+from src.modules.ai.completions.models.Delta import Delta
+from src.modules.ai.scheduler.FairGenerationScheduler import FairGenerationScheduler
+from src.modules.assistants.models.Assistant import Assistant, RagScoringMode
+from src.modules.assistants.reserved_ids import RAG_SCORING_ID
+from src.modules.chat.LLMChatService import LLMChatService, BATCH_SCORING_RESPONSE_FORMAT
+from src.modules.ai.scheduler.models.GenerationPriority import GenerationPriority
+from src.modules.ai.scheduler.models.GenerationRequest import GenerationRequest
+from src.modules.ai.completions.models.Feature import Feature
+from src.modules.chat.models.ChatEvent import ChatErrorEvent, ChatMessageEvent, ChatQueuePositionEvent, \
+    ChatConversationIdEvent
+from src.modules.collections.models.CollectionMetadata import CollectionMetadata
+from src.modules.collections.models.CollectionQueryResult import CollectionQueryResult
+from src.modules.conversations.models.Conversation import Conversation
+from src.modules.conversations.models.Message import Message
+from src.modules.models.models.ModelCapabilities import ModelCapabilities
+from src.modules.rerank.LexicalRerankService import LexicalRerankService
+from src.modules.settings.settings import SettingKey
+
+
+class _StepLog:
+    """
+    Records when each (fake) service call starts and ends, every call takes the same amount of time.
+    """
+
+    def __init__(self):
+        self.events: list[tuple[str, str]] = []
+
+    async def step(self, name: str):
+        self.events.append(('start', name))
+        await asyncio.sleep(0.01)
+        self.events.append(('end', name))
+
+    def index(self, kind: str, name: str) -> int:
+        return self.events.index((kind, name))
+
+    def overlaps(self, a: str, b: str) -> bool:
+        return self.index('start', a) < self.index('end', b) and self.index('start', b) < self.index('end', a)
+
+    def after(self, a: str, b: str) -> bool:
+        return self.index('start', a) > self.index('end', b)
+
+
+def _assistant(assistant_id: str, semantic_cache: bool = False, rag_scoring_mode: RagScoringMode = 'individual') \
+        -> Assistant:
+    return Assistant(id=assistant_id, owner='admin', meta={}, allow_files=False, instructions='instructions',
+                     model='openai/gpt-4o', llm_api_key=None, collection_id='collection', max_collection_results=5,
+                     extra_llm_params=None, semantic_cache=semantic_cache, rag_scoring_mode=rag_scoring_mode)
+
+
+class _AssistantService:
+    def __init__(self, log: _StepLog, has_rag_scoring_assistant: bool = True, semantic_cache: bool = False,
+                 rag_scoring_mode: RagScoringMode = 'individual'):
+        self._log = log
+        self._has_rag_scoring_assistant = has_rag_scoring_assistant
+        self._semantic_cache = semantic_cache
+        self._rag_scoring_mode = rag_scoring_mode
+
+    async def get_assistant(self, as_uid: str, assistant_id: str, redact_key: bool = True):
+        await self._log.step(f'get_assistant:{assistant_id}')
+        if assistant_id == RAG_SCORING_ID and not self._has_rag_scoring_assistant:
+            return None
+        return _assistant(assistant_id, self._semantic_cache, self._rag_scoring_mode)
+
+
+class _ConversationService:
+    def __init__(self, log: _StepLog):
+        self._log = log
+        self.added: list[Message] = []
+
+    async def create_conversation(self, as_uid: str, assistant_id: str):
+        return 'conversation'
+
+    async def get_conversation(self, as_uid: str, conversation_id: str):
+        await self._log.step('get_conversation')
+        return Conversation(id=conversation_id, assistant_id='assistant', title='', messages=[
+            Message(timestamp='0', role='system', content='instructions')
+        ])
+
+    async def add_message_to_conversation(self, as_uid: str, conversation_id: str, message: Message):
+        await self._log.step('add_message')
+        self.added.append(message)
+        return True
+
+
+class _JournalService:
+    async def begin_message(self, **kwargs):
+        pass
+
+    async def extend_message(self, **kwargs):
+        pass
+
+    async def close(self, **kwargs):
+        pass
+
+
+class _CollectionService:
+    def __init__(self, log: _StepLog, results: list[CollectionQueryResult] | None = None):
+        self._log = log
+        self._results = results or [
+            CollectionQueryResult(content='the library opens at ten', source='library.pdf', page_number=1)
+        ]
+
+    async def query_collection(self, collection_id: str, query: str, max_results: int):
+        await self._log.step('query_collection')
+        return self._results
+
+    async def get_collection(self, collection_id: str):
+        return CollectionMetadata(id=collection_id, label='', embedding_model='default', files=[], urls=[],
+                                  documents_updated_at='0')
+
+
+class _SettingsService:
+    def __init__(self, settings: dict | None = None):
+        self._settings = settings or {}
+
+    async def get_setting(self, key: str, fallback_value=None):
+        return self._settings.get(key, fallback_value)
+
+
+class _ScoreCacheService:
+    async def get_scores(self, keys: list[str]):
+        return {}
+
+    async def set_scores(self, scores: dict[str, int]):
+        pass
+
+
+class _SemanticAnswerCacheService:
+    """
+    Only finds answers to the exact same question.
+    """
+
+    def __init__(self):
+        self.answers: dict[tuple[str, str, str], str] = {}
+
+    async def get_answer(self, assistant_id: str, version: str, question: str):
+        return self.answers.get((assistant_id, version, question))
+
+    async def set_answer(self, assistant_id: str, version: str, question: str, answer: str):
+        self.answers[(assistant_id, version, question)] = answer
+
+
+class _FailingSemanticAnswerCacheService(_SemanticAnswerCacheService):
+    def __init__(self, fail_get_answer: bool):
+        super().__init__()
+        self._fail_get_answer = fail_get_answer
+        self.calls: list[str] = []
+
+    async def get_answer(self, assistant_id: str, version: str, question: str):
+        self.calls.append('get_answer')
+        if self._fail_get_answer:
+            raise RuntimeError('embedding failed')
+        return None
+
+    async def set_answer(self, assistant_id: str, version: str, question: str, answer: str):
+        self.calls.append('set_answer')
+        raise RuntimeError('embedding failed')
+
+
+class _ModelCapabilityService:
+    def __init__(self, log: _StepLog):
+        self._log = log
+
+    async def get_capabilities(self, model: str):
+        await self._log.step('get_capabilities')
+        return ModelCapabilities(key=model, litellm_model=model)
+
+
+class _CompletionsService:
+    def __init__(self, log: _StepLog):
+        self._log = log
+
+    async def run_completions(self, messages, enabled_features, extra_params=None):
+        if messages[0].content == 'instructions' and len(messages) == 2:
+            await self._log.step('score')
+            yield Delta(role='assistant', content=json.dumps({'score': 100}))
+            return
+
+        await self._log.step('run_completions')
+        yield Delta(role='assistant', content='answer')
+
+
+class _CompletionsFactory:
+    def __init__(self, log: _StepLog):
+        self._log = log
+
+    def get(self, model: str, api_key: str | None, fallback_models: list[str] | None = None,
+            ttft_deadline_seconds: float | None = None, cache_tool_results: bool = True):
+        return _CompletionsService(self._log)
+
+
+class _BatchScoringCompletionsService:
+    """
+    Answers batched scoring requests with `batch_response` and individual ones with 90 for results
+    about the library (10 otherwise), recording every request.
+    """
+
+    def __init__(self, batch_response: str):
+        self._batch_response = batch_response
+        self.batch_requests: list[tuple[list, dict]] = []
+        self.individual_requests: list[str] = []
+        self.chat_messages: list | None = None
+
+    async def run_completions(self, messages, enabled_features, extra_params=None):
+        if extra_params is not None and 'response_format' in extra_params:
+            self.batch_requests.append((messages, extra_params))
+            yield Delta(role='assistant', content=self._batch_response)
+        elif messages[0].content == 'instructions' and len(messages) == 2:
+            self.individual_requests.append(messages[1].content)
+            yield Delta(role='assistant', content=json.dumps({'score': 90 if 'library' in messages[1].content else 10}))
+        else:
+            self.chat_messages = messages
+            yield Delta(role='assistant', content='answer')
+
+
+class _StubCompletionsFactory:
+    def __init__(self, service):
+        self._service = service
+
+    def get(self, model: str, api_key: str | None, fallback_models: list[str] | None = None,
+            ttft_deadline_seconds: float | None = None, cache_tool_results: bool = True):
+        return self._service
+
+
+def _service(log: _StepLog, conversation_service: _ConversationService, has_rag_scoring_assistant: bool = True,
+             generation_scheduler: FairGenerationScheduler | None = None, semantic_cache: bool = False,
+             semantic_answer_cache_service: _SemanticAnswerCacheService | None = None,
+             completions_factory: _StubCompletionsFactory | None = None,
+             rag_scoring_mode: RagScoringMode = 'individual',
+             collection_results: list[CollectionQueryResult] | None = None):
+    return LLMChatService(
+        completions_factory=completions_factory or _CompletionsFactory(log),
+        assistant_service=_AssistantService(log, has_rag_scoring_assistant, semantic_cache, rag_scoring_mode),
+        conversation_service=conversation_service,
+        conversation_journal_service=_JournalService(),
+        collection_service=_CollectionService(log, collection_results),
+        settings_service=_SettingsService(),
+        score_cache_service=_ScoreCacheService(),
+        rerank_service=LexicalRerankService(),
+        model_capability_service=_ModelCapabilityService(log),
+        generation_scheduler=generation_scheduler or FairGenerationScheduler(settings_service=_SettingsService()),
+        semantic_answer_cache_service=semantic_answer_cache_service or _SemanticAnswerCacheService(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def setup_admin(monkeypatch):
+    monkeypatch.setenv('SETUP_ADMIN', 'admin')
+
+
+@pytest.mark.asyncio
+async def test_continue_chat_critical_path():
+    log = _StepLog()
+    service = _service(log, _ConversationService(log))
+
+    events = [e async for e in service.continue_chat('user', 'conversation', 'When does the library open?', [])]
+
+    assert events == [ChatMessageEvent(source='assistant', message='answer')]
+
+    # Data dependencies
+    assert log.after('get_assistant:assistant', 'get_conversation')
+    assert log.after('score', 'query_collection')
+    assert log.after('score', f'get_assistant:{RAG_SCORING_ID}')
+    assert all(log.after('run_completions', name) for _, name in log.events if name != 'run_completions')
+
+    # Independent steps run concurrently
+    assert log.overlaps('add_message', 'query_collection')
+    assert log.overlaps(f'get_assistant:{RAG_SCORING_ID}', 'query_collection')
+    assert log.overlaps('get_capabilities', 'query_collection')
+
+
+@pytest.mark.asyncio
+async def test_continue_chat_missing_rag_scoring_assistant():
+    log = _StepLog()
+    conversation_service = _ConversationService(log)
+    service = _service(log, conversation_service, has_rag_scoring_assistant=False)
+
+    events = [e async for e in service.continue_chat('user', 'conversation', 'When does the library open?', [])]
+
+    assert events == [ChatErrorEvent(message='rag scoring assistant not found')]
+    assert [m.content for m in conversation_service.added] == ['When does the library open?']
+    assert ('start', 'run_completions') not in log.events
+
+
+@pytest.mark.asyncio
+async def test_continue_chat_queue_position():
+    log = _StepLog()
+    scheduler = FairGenerationScheduler(settings_service=_SettingsService({
+        SettingKey.GENERATION_MAX_CONCURRENT_PER_USER.key: 1
+    }))
+    service = _service(log, _ConversationService(log), generation_scheduler=scheduler)
+
+    # Another generation of the same user is already running
+    running = scheduler.enqueue(GenerationRequest(priority=GenerationPriority.INTERACTIVE, model='openai/gpt-4o',
+                                                  uid='user'))
+    await running.__aenter__()
+
+    events = []
+
+    async def chat():
+        async for e in service.continue_chat('user', 'conversation', 'When does the library open?', []):
+            events.append(e)
+
+    chatting = asyncio.create_task(chat())
+    await asyncio.sleep(0.2)
+
+    assert events == [ChatQueuePositionEvent(position=1)]
+
+    running.release()
+    await chatting
+
+    assert events == [ChatQueuePositionEvent(position=1), ChatMessageEvent(source='assistant', message='answer')]
+
+
+@pytest.mark.asyncio
+async def test_start_new_chat_semantic_answer_cache():
+    log = _StepLog()
+    conversation_service = _ConversationService(log)
+    service = _service(log, conversation_service, semantic_cache=True)
+
+    first = [e async for e in service.start_new_chat('user', 'assistant', 'When does the library open?', [])]
+    log.events.clear()
+    second = [e async for e in service.start_new_chat('user', 'assistant', 'When does the library open?', [])]
+
+    assert first == second == [
+        ChatConversationIdEvent(conversation_id='conversation'),
+        ChatMessageEvent(source='assistant', message='answer')
+    ]
+    assert ('start', 'run_completions') not in log.events
+    assert ('start', 'query_collection') not in log.events
+    assert [(m.role, m.content) for m in conversation_service.added[-3:]] == [
+        ('system', 'instructions'),
+        ('user', 'When does the library open?'),
+        ('assistant', 'answer')
+    ]
+
+
+@pytest.mark.asyncio
+async def test_start_new_chat_semantic_answer_cache_not_used():
+    log = _StepLog()
+    semantic_answer_cache_service = _SemanticAnswerCacheService()
+    disabled_service = _service(log, _ConversationService(log),
+                                semantic_answer_cache_service=semantic_answer_cache_service)
+    enabled_service = _service(log, _ConversationService(log), semantic_cache=True,
+                               semantic_answer_cache_service=semantic_answer_cache_service)
+
+    _ = [e async for e in disabled_service.start_new_chat('user', 'assistant', 'When does the library open?', [])]
+    _ = [e async for e in enabled_service.start_new_chat('user', 'assistant', 'When does the library open?',
+                                                         [Feature.WEB_SEARCH])]
+
+    assert semantic_answer_cache_service.answers == {}
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('fail_get_answer, expected_calls', [
+    (True, ['get_answer']),
+    (False, ['get_answer', 'set_answer']),
+])
+async def test_start_new_chat_semantic_answer_cache_fails_open(fail_get_answer, expected_calls):
+    log = _StepLog()
+    semantic_answer_cache_service = _FailingSemanticAnswerCacheService(fail_get_answer)
+    service = _service(log, _ConversationService(log), semantic_cache=True,
+                       semantic_answer_cache_service=semantic_answer_cache_service)
+
+    events = [e async for e in service.start_new_chat('user', 'assistant', 'When does the library open?', [])]
+
+    assert events == [
+        ChatConversationIdEvent(conversation_id='conversation'),
+        ChatMessageEvent(source='assistant', message='answer')
+    ]
+    assert semantic_answer_cache_service.calls == expected_calls
+
+
+_BATCH_RESULTS = [
+    CollectionQueryResult(content='the library opens at ten', source='library.pdf', page_number=1),
+    CollectionQueryResult(content='parking at the library is free on sundays', source='parking.pdf', page_number=2),
+    CollectionQueryResult(content='the swimming pool closes for renovation in june', source='pool.pdf', page_number=3),
+]
+
+_FORMATTED_BATCH_RESULTS = [f'(source:{r.source}, page: {r.page_number})\n{r.content}' for r in _BATCH_RESULTS]
+
+
+async def _batched_chat(batch_response: str) -> _BatchScoringCompletionsService:
+    log = _StepLog()
+    completions_service = _BatchScoringCompletionsService(batch_response)
+    service = _service(log, _ConversationService(log), completions_factory=_StubCompletionsFactory(completions_service),
+                       rag_scoring_mode='batched', collection_results=_BATCH_RESULTS)
+
+    events = [e async for e in service.continue_chat('user', 'conversation', 'When does the library open?', [])]
+
+    assert events == [ChatMessageEvent(source='assistant', message='answer')]
+    return completions_service
+
+
+def _rag_message(completions_service: _BatchScoringCompletionsService) -> str:
+    return completions_service.chat_messages[-1].content
+
+
+@pytest.mark.asyncio
+async def test_continue_chat_batched_scoring():
+    completions_service = await _batched_chat(json.dumps({'scores': [
+        {'id': 'chunk_0', 'score': 80},
+        {'id': 'chunk_1', 'score': 95},
+        {'id': 'chunk_2', 'score': 5},
+    ]}))
+
+    assert len(completions_service.batch_requests) == 1
+    messages, extra_params = completions_service.batch_requests[0]
+    assert extra_params['response_format'] == BATCH_SCORING_RESPONSE_FORMAT
+    assert all(f'[id: chunk_{i}]\n{r}' in messages[1].content for i, r in enumerate(_FORMATTED_BATCH_RESULTS))
+    assert completions_service.individual_requests == []
+
+    # Accepted results, best first
+    rag_message = _rag_message(completions_service)
+    assert 'swimming pool' not in rag_message
+    assert rag_message.index('parking') < rag_message.index('opens at ten')
+
+
+@pytest.mark.asyncio
+async def test_continue_chat_batched_scoring_missing_ids():
+    completions_service = await _batched_chat(json.dumps({'scores': [{'id': 'chunk_0', 'score': 80}]}))
+
+    assert len(completions_service.batch_requests) == 1
+    assert completions_service.individual_requests == _FORMATTED_BATCH_RESULTS[1:]
+
+    rag_message = _rag_message(completions_service)
+    assert 'opens at ten' in rag_message
+    assert 'parking' in rag_message
+    assert 'swimming pool' not in rag_message
+
+
+@pytest.mark.asyncio
+async def test_continue_chat_batched_scoring_unparsable():
+    completions_service = await _batched_chat('I can not score these')
+
+    assert len(completions_service.batch_requests) == 1
+    assert sorted(completions_service.individual_requests) == sorted(_FORMATTED_BATCH_RESULTS)
+
+    rag_message = _rag_message(completions_service)
+    assert 'opens at ten' in rag_message
+    assert 'parking' in rag_message
+    assert 'swimming pool' not in rag_message
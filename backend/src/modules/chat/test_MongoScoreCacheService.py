@@ -0,0 +1,16 @@
+import pytest_asyncio
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.modules.chat.MongoScoreCacheService import MongoScoreCacheService
+from src.modules.chat.test_score_cache_service import BaseScoreCacheServiceTestClass
+
+
+@pytest_asyncio.fixture
+async def service(mongo_test_db: AsyncDatabase):
+    service = MongoScoreCacheService(mongo_test_db)
+    await service.init(expiry_seconds=1, max_entries=2)
+    return service
+
+
+class TestMongoScoreCacheServiceClass(BaseScoreCacheServiceTestClass):
+    ...
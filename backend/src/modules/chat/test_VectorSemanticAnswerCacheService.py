@@ -0,0 +1,80 @@
+import pytest
+
+from src.modules.chat.VectorSemanticAnswerCacheService import VectorSemanticAnswerCacheService
+from src.modules.settings.settings import SettingKey
+from src.modules.vector.models.VectorDocument import VectorDocument
+from src.modules.vector.models.VectorSpace import VectorSpace
+
+
+class _VectorService:
+    """
+    Returns the first document of a space, at a fixed distance from any query.
+    """
+
+    def __init__(self, distance: float):
+        self.spaces: dict[str, list[VectorDocument]] = {}
+        self._distance = distance
+
+    async def create_vector_space(self, space: str, embedding_model: str):
+        self.spaces.setdefault(space, [])
+
+    async def add_documents_to_vector_space(self, space: str, embedding_model: str, documents: list[VectorDocument]):
+        self.spaces[space].extend(documents)
+
+    async def delete_vector_space(self, space: str):
+        self.spaces.pop(space, None)
+
+    async def get_vector_spaces(self) -> list[VectorSpace]:
+        return [VectorSpace(name=space) for space in self.spaces]
+
+    async def query_vector_space(self, space: str, embedding_model: str, query: str, max_results: int):
+        return [d.model_copy(update={'distance': self._distance}) for d in self.spaces.get(space, [])[:max_results]]
+
+
+class _SettingsService:
+    def __init__(self, settings: dict | None = None):
+        self._settings = settings or {}
+
+    async def get_setting(self, key: str, fallback_value=None):
+        return self._settings.get(key, fallback_value)
+
+
+@pytest.mark.asyncio
+async def test_semantic_answer_cache_service():
+    vector_service = _VectorService(distance=0.1)
+    service = VectorSemanticAnswerCacheService(vector_service, _SettingsService())
+
+    await service.set_answer('assistant', 'v1', 'When does the library open?', 'At ten.')
+
+    assert await service.get_answer('assistant', 'v1', 'What time does the library open?') == 'At ten.'
+    assert await service.get_answer('assistant', 'v2', 'When does the library open?') is None
+    assert await service.get_answer('other assistant', 'v1', 'When does the library open?') is None
+
+
+@pytest.mark.asyncio
+async def test_semantic_answer_cache_service_min_similarity():
+    vector_service = _VectorService(distance=0.3)
+    service = VectorSemanticAnswerCacheService(vector_service, _SettingsService())
+    lenient_service = VectorSemanticAnswerCacheService(vector_service, _SettingsService({
+        SettingKey.SEMANTIC_CACHE_MIN_SIMILARITY.key: 0.8
+    }))
+
+    await service.set_answer('assistant', 'v1', 'When does the library open?', 'At ten.')
+
+    assert await service.get_answer('assistant', 'v1', 'Is the library open on Sundays?') is None
+    assert await lenient_service.get_answer('assistant', 'v1', 'Is the library open on Sundays?') == 'At ten.'
+
+
+@pytest.mark.asyncio
+async def test_semantic_answer_cache_service_drops_other_versions():
+    vector_service = _VectorService(distance=0)
+    service = VectorSemanticAnswerCacheService(vector_service, _SettingsService())
+
+    await service.set_answer('assistant', 'v1', 'When does the library open?', 'At ten.')
+    await service.set_answer('other assistant', 'v1', 'When does the pool open?', 'At six.')
+    await service.set_answer('assistant', 'v2', 'When does the library open?', 'At nine.')
+
+    assert len(vector_service.spaces) == 2
+    assert await service.get_answer('assistant', 'v1', 'When does the library open?') is None
+    assert await service.get_answer('assistant', 'v2', 'When does the library open?') == 'At nine.'
+    assert await service.get_answer('other assistant', 'v1', 'When does the pool open?') == 'At six.'
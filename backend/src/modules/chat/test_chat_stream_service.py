@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from src.modules.chat.models.ChatEvent import ChatConversationIdEvent, ChatMessageEvent, ChatErrorEvent
+from src.modules.chat.protocols.IChatStreamService import IChatStreamService
+
+
+async def _chat_events(count: int, delay: float = 0.0, conversation_id: str | None = None):
+    if conversation_id is not None:
+        yield ChatConversationIdEvent(conversation_id=conversation_id)
+
+    for i in range(count):
+        await asyncio.sleep(delay)
+        yield ChatMessageEvent(source='assistant', message=str(i))
+
+
+async def _collect(events) -> list:
+    return [e async for e in events]
+
+
+class BaseChatStreamServiceTestClass:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_chat_stream_service(service: IChatStreamService):
+        stream_id = await service.start_stream('user', _chat_events(3))
+        events = await _collect(await service.subscribe('user', stream_id))
+
+        assert [e.index for e in events] == [0, 1, 2]
+        assert [e.chat_event.message for e in events] == ['0', '1', '2']
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_chat_stream_service_resume(service: IChatStreamService):
+        stream_id = await service.start_stream('user', _chat_events(5, delay=0.01))
+
+        first = await service.subscribe('user', stream_id)
+        received = [await anext(first), await anext(first)]
+        await first.aclose()
+
+        resumed = await _collect(await service.subscribe('user', stream_id, after_index=received[-1].index))
+
+        assert [e.chat_event.message for e in received + resumed] == ['0', '1', '2', '3', '4']
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_chat_stream_service_multiple_subscribers(service: IChatStreamService):
+        stream_id = await service.start_stream('user', _chat_events(3, delay=0.01))
+
+        a, b = await asyncio.gather(
+            _collect(await service.subscribe('user', stream_id)),
+            _collect(await service.subscribe('user', stream_id)),
+        )
+
+        assert [e.index for e in a] == [0, 1, 2]
+        assert [e.index for e in b] == [0, 1, 2]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_chat_stream_service_conversation(service: IChatStreamService):
+        stream_id = await service.start_stream('user', _chat_events(2, conversation_id='conversation'))
+        await _collect(await service.subscribe('user', stream_id))
+
+        continued_stream_id = await service.start_stream('user', _chat_events(2), conversation_id='other')
+
+        assert await service.get_conversation_stream_id('user', 'conversation') == stream_id
+        assert await service.get_conversation_stream_id('user', 'other') == continued_stream_id
+        assert await service.get_conversation_stream_id('another user', 'conversation') is None
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_chat_stream_service_invalid(service: IChatStreamService):
+        stream_id = await service.start_stream('user', _chat_events(2))
+
+        assert await service.subscribe('user', 'does not exist') is None
+        assert await service.subscribe('another user', stream_id) is None
+        assert await service.subscribe('user', stream_id, after_index=10) is None
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_chat_stream_service_error(service: IChatStreamService):
+        async def failing_events():
+            yield ChatMessageEvent(source='assistant', message='0')
+            raise RuntimeError('boom')
+
+        stream_id = await service.start_stream('user', failing_events())
+        events = await _collect(await service.subscribe('user', stream_id))
+
+        assert isinstance(events[-1].chat_event, ChatErrorEvent)
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from src.modules.chat.protocols.IScoreCacheService import IScoreCacheService
+
+
+class BaseScoreCacheServiceTestClass:
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_score_cache_service(service: IScoreCacheService):
+        await service.set_scores({'a': 80, 'b': 10})
+        await service.set_scores({'b': 20})
+
+        scores = await service.get_scores(['a', 'b', 'c'])
+        stats = await service.get_stats()
+
+        assert scores == {'a': 80, 'b': 20}
+        assert stats.hits == 2
+        assert stats.misses == 1
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_score_cache_service_empty(service: IScoreCacheService):
+        await service.set_scores({})
+        scores = await service.get_scores([])
+
+        assert scores == {}
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_score_cache_service_evicts_least_recently_used(service: IScoreCacheService):
+        await service.set_scores({'a': 1, 'b': 2})
+        await asyncio.sleep(0.01)
+        await service.get_scores(['a'])
+        await service.set_scores({'c': 3})
+
+        scores = await service.get_scores(['a', 'b', 'c'])
+
+        assert scores == {'a': 1, 'c': 3}
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_score_cache_service_expire(service: IScoreCacheService):
+        await service.set_scores({'a': 80})
+
+        await asyncio.sleep(2)
+
+        scores = await service.get_scores(['a'])
+
+        assert scores == {}
@@ -1,6 +1,7 @@
 from bson import ObjectId
 from pymongo.asynchronous.database import AsyncDatabase
 
+from src.common.get_timestamp import get_timestamp
 from src.common.is_url import is_url
 from src.common.mongo import is_valid_mongo_id
 from src.modules.collections.models.CollectionFile import CollectionFile
@@ -37,7 +38,7 @@ class MongoCollectionService(ICollectionService):
 
         result = await self._database['collections'].find_one({'_id': ObjectId(collection_id)},
                                                               projection=['_id', 'label', 'embedding_model', 'files',
-                                                                          'urls'])
+                                                                          'urls', 'documents_updated_at'])
         if result is None:
             return None
 
@@ -46,17 +47,20 @@ class MongoCollectionService(ICollectionService):
             label=result['label'],
             embedding_model=result['embedding_model'],
             files=result['files'],
-            urls=result['urls']
+            urls=result['urls'],
+            documents_updated_at=result['documents_updated_at'] if 'documents_updated_at' in result else None
         )
 
     async def get_collections(self) -> list[CollectionMetadata]:
-        cursor = self._database['collections'].find(projection=['_id', 'label', 'embedding_model', 'files', 'urls'])
+        cursor = self._database['collections'].find(projection=['_id', 'label', 'embedding_model', 'files', 'urls',
+                                                                'documents_updated_at'])
         return [CollectionMetadata(
             id=str(doc['_id']),
             label=doc['label'],
             embedding_model=doc['embedding_model'],
             files=doc['files'],
-            urls=doc['urls']
+            urls=doc['urls'],
+            documents_updated_at=doc['documents_updated_at'] if 'documents_updated_at' in doc else None
         )
             async for doc in cursor
         ]
@@ -117,7 +121,8 @@ class MongoCollectionService(ICollectionService):
         }, {
             '$set': {
                 'urls': urls,
-                'files': [file.model_dump() for file in files]
+                'files': [file.model_dump() for file in files],
+                'documents_updated_at': get_timestamp()
             }
         })
 
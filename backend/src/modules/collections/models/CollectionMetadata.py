@@ -9,3 +9,7 @@ class CollectionMetadata(BaseModel):
     embedding_model: str
     files: list[CollectionFile]
     urls: list[str]
+    documents_updated_at: str | None = None
+    '''
+    When the documents were last set, None if they never were.
+    '''
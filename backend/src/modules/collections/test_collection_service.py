@@ -26,6 +26,7 @@ class BaseCollectionServiceTestClass:
         assert result.id == collection_id
         assert result.label == 'my label'
         assert result.embedding_model == 'default'
+        assert result.documents_updated_at is None
 
     @staticmethod
     @pytest.mark.asyncio
@@ -71,6 +72,7 @@ class BaseCollectionServiceTestClass:
 
         assert result is True
         assert collection.files[0].name == 'test_file.md'
+        assert collection.documents_updated_at is not None
 
     @staticmethod
     @pytest.mark.asyncio
@@ -0,0 +1,201 @@
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import BulkWriteError
+
+from src.common.mongo import is_valid_mongo_id
+from src.modules.conversations.helpers.update_journaled_message_pipeline import update_journaled_message_pipeline
+from src.modules.conversations.models.Message import Message
+from src.modules.conversations.protocols.IConversationJournalService import IConversationJournalService
+
+
+@dataclass
+class _JournaledMessage:
+    message: Message
+    journal_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    '''
+    Stored with the pushed message, so updates find it even when messages have been added after it.
+    '''
+    pushed: bool = False
+    dirty: bool = True
+    pending_appends: dict[str, str] = field(default_factory=dict)
+    '''
+    Text appended since the last flush, only relevant once the message has been pushed.
+    '''
+    pending_fields: dict[str, Any] = field(default_factory=dict)
+    '''
+    Fields replaced since the last flush, only relevant once the message has been pushed.
+    '''
+
+
+@dataclass
+class _JournalEntry:
+    messages: list[_JournaledMessage] = field(default_factory=list)
+    pending_chars: int = 0
+    flush_scheduled: bool = False
+
+
+class MongoConversationJournalService(IConversationJournalService):
+    def __init__(self, database: AsyncDatabase, flush_interval_seconds: float = 0.5, max_pending_chars: int = 2000):
+        self._database = database
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_pending_chars = max_pending_chars
+        self._entries: dict[tuple[str, str], _JournalEntry] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flusher: asyncio.Task | None = None
+        self._scheduled_flushes: set[asyncio.Task] = set()
+
+    async def begin_message(self, as_uid: str, conversation_id: str, message: Message) -> None:
+        if not is_valid_mongo_id(conversation_id):
+            return
+
+        entry = self._entries.setdefault((as_uid, conversation_id), _JournalEntry())
+        entry.messages.append(_JournaledMessage(message=message.model_copy()))
+        entry.pending_chars += self._count_chars(message.content, message.reasoning_content)
+
+        await self._after_write((as_uid, conversation_id), entry)
+
+    async def extend_message(
+            self,
+            as_uid: str,
+            conversation_id: str,
+            content: str | None = None,
+            reasoning_content: str | None = None,
+            tool_call_id: str | None = None,
+            tool_calls: list[dict] | None = None,
+            context_message_override: str | None = None,
+    ) -> None:
+        entry = self._entries.get((as_uid, conversation_id))
+
+        if entry is None or len(entry.messages) == 0:
+            return
+
+        journaled = entry.messages[-1]
+        message = journaled.message
+
+        for key, value in {'content': content, 'reasoning_content': reasoning_content}.items():
+            if value is not None:
+                setattr(message, key, (getattr(message, key) or '') + value)
+                journaled.pending_appends[key] = journaled.pending_appends.get(key, '') + value
+
+        replaced = {
+            'tool_call_id': tool_call_id,
+            'tool_calls': tool_calls,
+            'context_message_override': context_message_override,
+        }
+        for key, value in replaced.items():
+            if value is not None:
+                setattr(message, key, value)
+                journaled.pending_fields[key] = value
+
+        journaled.dirty = True
+        entry.pending_chars += self._count_chars(content, reasoning_content)
+
+        await self._after_write((as_uid, conversation_id), entry)
+
+    async def close(self, as_uid: str, conversation_id: str) -> None:
+        key = (as_uid, conversation_id)
+
+        if key not in self._entries:
+            return
+
+        await self._flush([key])
+        self._entries.pop(key, None)
+
+    async def _after_write(self, key: tuple[str, str], entry: _JournalEntry):
+        if entry.pending_chars >= self._max_pending_chars and not entry.flush_scheduled:
+            # Flushed in the background, so streaming doesn't wait for the write
+            entry.flush_scheduled = True
+            task = asyncio.create_task(self._run_scheduled_flush(key, entry))
+            self._scheduled_flushes.add(task)
+            task.add_done_callback(self._scheduled_flushes.discard)
+
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run_flusher())
+
+    async def _run_flusher(self):
+        while len(self._entries) > 0:
+            await asyncio.sleep(self._flush_interval_seconds)
+            await self._flush(list(self._entries.keys()))
+        self._flusher = None
+
+    async def _run_scheduled_flush(self, key: tuple[str, str], entry: _JournalEntry):
+        try:
+            await self._flush([key])
+        finally:
+            entry.flush_scheduled = False
+
+    async def _flush(self, keys: list[tuple[str, str]]):
+        async with self._flush_lock:
+            operations: list[UpdateOne] = []
+            written: list[tuple[_JournaledMessage, bool, dict[str, str], dict[str, Any]]] = []
+
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+
+                as_uid, conversation_id = key
+                query = {'_id': ObjectId(conversation_id), 'owner': as_uid}
+
+                for journaled in entry.messages:
+                    if not journaled.dirty:
+                        continue
+
+                    if journaled.pushed:
+                        operations.append(UpdateOne(query, update_journaled_message_pipeline(
+                            journaled.journal_id,
+                            append_fields=journaled.pending_appends,
+                            set_fields=journaled.pending_fields
+                        )))
+                    else:
+                        pushed = {**journaled.message.model_dump(), 'journal_id': journaled.journal_id}
+                        operations.append(UpdateOne(query, {'$push': {'messages': pushed}}))
+
+                    written.append((journaled, journaled.pushed, journaled.pending_appends, journaled.pending_fields))
+                    journaled.pushed = True
+                    journaled.dirty = False
+                    journaled.pending_appends = {}
+                    journaled.pending_fields = {}
+
+                entry.pending_chars = 0
+
+            if len(operations) == 0:
+                return
+
+            try:
+                await self._database['conversations'].bulk_write(operations, ordered=True)
+            except BulkWriteError as e:
+                print(f'error flushing conversation journal: {e}')
+                first_failed = e.details['writeErrors'][0]['index'] if e.details.get('writeErrors') else 0
+                self._restore(written[first_failed:])
+            except Exception as e:
+                print(f'error flushing conversation journal: {e}')
+                self._restore(written)
+
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    # Only the message currently being generated can receive further deltas
+                    entry.messages = [m for m in entry.messages[:-1] if m.dirty] + entry.messages[-1:]
+
+    @staticmethod
+    def _restore(written: list[tuple[_JournaledMessage, bool, dict[str, str], dict[str, Any]]]):
+        for journaled, was_pushed, appends, fields in written:
+            journaled.pushed = was_pushed
+            journaled.dirty = True
+
+            # Deltas that arrived while writing go after the ones that failed to be written
+            for key, value in journaled.pending_appends.items():
+                appends[key] = appends.get(key, '') + value
+            journaled.pending_appends = appends
+            journaled.pending_fields = {**fields, **journaled.pending_fields}
+
+    @staticmethod
+    def _count_chars(*values: str | None) -> int:
+        return sum(len(v) for v in values if v is not None)
@@ -1,10 +1,12 @@
 import datetime
+from typing import Any
 
 import pymongo
 from bson import ObjectId
 from pymongo.asynchronous.database import AsyncDatabase
 
 from src.common.mongo import is_valid_mongo_id
+from src.modules.conversations.helpers.update_last_message_pipeline import update_last_message_pipeline
 from src.modules.conversations.models.Conversation import Conversation
 from src.modules.conversations.models.Message import Message
 from src.modules.conversations.protocols.IConversationService import IConversationService
@@ -49,32 +51,42 @@ class MongoConversationService(IConversationService):
         return [self._doc_to_conversation(doc) async for doc in cursor]
 
     async def add_message_to_conversation(self, as_uid: str, conversation_id: str, message: Message) -> bool:
-        conversation = await self.get_conversation(as_uid, conversation_id)
-        if conversation:
-            conversation.messages.append(message)
-
-            result = await self._database['conversations'].update_one(
-                {'_id': ObjectId(conversation_id), 'owner': as_uid},
-                {'$set': {'messages': [m.model_dump() for m in conversation.messages]}})
-
-            return result.modified_count == 1
-
-        return False
+        return await self.append_message(as_uid, conversation_id, message)
 
     async def replace_conversation_last_message(self, as_uid: str, conversation_id: str, message: Message) -> bool:
-        conversation = await self.get_conversation(as_uid, conversation_id)
+        return await self._update_last_message(as_uid, conversation_id, update_last_message_pipeline(
+            set_fields=message.model_dump()
+        ))
 
-        if not conversation or len(conversation.messages) == 0:
+    async def append_message(self, as_uid: str, conversation_id: str, message: Message) -> bool:
+        if not is_valid_mongo_id(conversation_id):
             return False
 
-        conversation.messages[-1] = message
-
         result = await self._database['conversations'].update_one(
             {'_id': ObjectId(conversation_id), 'owner': as_uid},
-            {"$set": {'messages': conversation.model_dump(include={'messages'})['messages']}}
+            {'$push': {'messages': message.model_dump()}}
         )
         return result.modified_count == 1
 
+    async def append_to_last_message_content(
+            self,
+            as_uid: str,
+            conversation_id: str,
+            content: str | None = None,
+            reasoning_content: str | None = None
+    ) -> bool:
+        append_fields = {k: v for k, v in {'content': content, 'reasoning_content': reasoning_content}.items()
+                         if v is not None}
+        return await self._update_last_message(as_uid, conversation_id, update_last_message_pipeline(
+            append_fields=append_fields
+        ))
+
+    async def set_last_message_fields(self, as_uid: str, conversation_id: str, fields: dict[str, Any]) -> bool:
+        valid_fields = {k: v for k, v in fields.items() if k in Message.model_fields}
+        return await self._update_last_message(as_uid, conversation_id, update_last_message_pipeline(
+            set_fields=valid_fields
+        ))
+
     async def set_conversation_title(self, as_uid: str, conversation_id: str, title: str) -> bool:
         if not is_valid_mongo_id(conversation_id):
             return False
@@ -90,6 +102,16 @@ class MongoConversationService(IConversationService):
             {'_id': ObjectId(conversation_id), 'owner': as_uid}
         )
 
+    async def _update_last_message(self, as_uid: str, conversation_id: str, pipeline: list[dict]) -> bool:
+        if not is_valid_mongo_id(conversation_id):
+            return False
+
+        result = await self._database['conversations'].update_one(
+            {'_id': ObjectId(conversation_id), 'owner': as_uid, 'messages.0': {'$exists': True}},
+            pipeline
+        )
+        return result.matched_count == 1
+
     @staticmethod
     def _doc_to_conversation(doc):
         title = doc['title']
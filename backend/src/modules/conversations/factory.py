@@ -1,6 +1,8 @@
 from pymongo.asynchronous.database import AsyncDatabase
 
+from src.modules.conversations.MongoConversationJournalService import MongoConversationJournalService
 from src.modules.conversations.MongoConversationService import MongoConversationService
+from src.modules.conversations.protocols.IConversationJournalService import IConversationJournalService
 from src.modules.conversations.protocols.IConversationService import IConversationService
 
 
@@ -10,3 +12,15 @@ class ConversationServiceFactory:
 
     def get(self) -> IConversationService:
         return MongoConversationService(self._mongo_database)
+
+
+class ConversationJournalServiceFactory:
+    def __init__(self, mongo_database: AsyncDatabase):
+        self._mongo_database = mongo_database
+
+    def get(self) -> IConversationJournalService:
+        return MongoConversationJournalService(
+            database=self._mongo_database,
+            flush_interval_seconds=0.5,
+            max_pending_chars=2000
+        )
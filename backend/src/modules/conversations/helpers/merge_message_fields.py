@@ -0,0 +1,22 @@
+from typing import Any
+
+
+def merge_message_fields(message_var: str, append_fields: dict[str, str] | None = None,
+                         set_fields: dict[str, Any] | None = None) -> dict:
+    """
+    Build the fields to `$mergeObjects` into a message in an update pipeline.
+
+    :param message_var: Name of the pipeline variable holding the message, such as `last`.
+    :param append_fields: String values to concatenate to the current value of each field.
+    :param set_fields: Values that replace the current value of each field.
+    """
+    merged: dict[str, Any] = {}
+
+    for key, value in (append_fields or {}).items():
+        merged[key] = {'$concat': [{'$ifNull': [f'$${message_var}.{key}', '']}, {'$literal': value}]}
+
+    for key, value in (set_fields or {}).items():
+        # Values are wrapped in $literal since strings starting with "$" would otherwise be read as paths
+        merged[key] = {'$literal': value}
+
+    return merged
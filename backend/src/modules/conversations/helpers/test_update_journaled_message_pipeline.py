@@ -0,0 +1,25 @@
+from src.modules.conversations.helpers.update_journaled_message_pipeline import update_journaled_message_pipeline
+
+
+def _get_map(pipeline: list[dict]) -> dict:
+    return pipeline[0]['$set']['messages']['$map']
+
+
+def test_matches_journal_id():
+    condition = _get_map(update_journaled_message_pipeline('abc'))['in']['$cond']
+
+    assert condition[0] == {'$eq': ['$$message.journal_id', 'abc']}
+    assert condition[2] == '$$message'
+
+
+def test_append_and_set_fields():
+    merged = _get_map(update_journaled_message_pipeline(
+        'abc',
+        append_fields={'content': 'hello'},
+        set_fields={'tool_calls': [{'id': '$a'}]}
+    ))['in']['$cond'][1]['$mergeObjects'][1]
+
+    assert merged == {
+        'content': {'$concat': [{'$ifNull': ['$$message.content', '']}, {'$literal': 'hello'}]},
+        'tool_calls': {'$literal': [{'id': '$a'}]},
+    }
@@ -0,0 +1,23 @@
+from src.modules.conversations.helpers.update_last_message_pipeline import update_last_message_pipeline
+
+
+def _get_merged(pipeline: list[dict]) -> dict:
+    return pipeline[0]['$set']['messages']['$concatArrays'][1]['$let']['in'][0]['$mergeObjects'][1]
+
+
+def test_append_fields():
+    merged = _get_merged(update_last_message_pipeline(append_fields={'content': 'hello'}))
+
+    assert merged == {'content': {'$concat': [{'$ifNull': ['$$last.content', '']}, {'$literal': 'hello'}]}}
+
+
+def test_set_fields_are_literal():
+    merged = _get_merged(update_last_message_pipeline(set_fields={'content': '$100', 'tool_calls': [{'id': '$a'}]}))
+
+    assert merged == {'content': {'$literal': '$100'}, 'tool_calls': {'$literal': [{'id': '$a'}]}}
+
+
+def test_empty():
+    merged = _get_merged(update_last_message_pipeline())
+
+    assert merged == {}
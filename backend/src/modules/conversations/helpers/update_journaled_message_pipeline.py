@@ -0,0 +1,25 @@
+from typing import Any
+
+from src.modules.conversations.helpers.merge_message_fields import merge_message_fields
+
+
+def update_journaled_message_pipeline(journal_id: str, append_fields: dict[str, str] | None = None,
+                                      set_fields: dict[str, Any] | None = None) -> list[dict]:
+    """
+    Build a pipeline update that changes the message with the given `journal_id` server side,
+    also when other messages have been added to the conversation after it.
+
+    :param append_fields: String values to concatenate to the current value of each field.
+    :param set_fields: Values that replace the current value of each field.
+    """
+    merged = merge_message_fields('message', append_fields, set_fields)
+
+    return [{'$set': {'messages': {'$map': {
+        'input': '$messages',
+        'as': 'message',
+        'in': {'$cond': [
+            {'$eq': ['$$message.journal_id', journal_id]},
+            {'$mergeObjects': ['$$message', merged]},
+            '$$message'
+        ]}
+    }}}}]
@@ -0,0 +1,23 @@
+from typing import Any
+
+from src.modules.conversations.helpers.merge_message_fields import merge_message_fields
+
+
+def update_last_message_pipeline(append_fields: dict[str, str] | None = None,
+                                 set_fields: dict[str, Any] | None = None) -> list[dict]:
+    """
+    Build a pipeline update that changes the last element of `messages` server side,
+    so only the changed values are sent over the wire instead of the full history.
+
+    :param append_fields: String values to concatenate to the current value of each field.
+    :param set_fields: Values that replace the current value of each field.
+    """
+    merged = merge_message_fields('last', append_fields, set_fields)
+
+    return [{'$set': {'messages': {'$concatArrays': [
+        {'$slice': ['$messages', {'$max': [0, {'$subtract': [{'$size': '$messages'}, 1]}]}]},
+        {'$let': {
+            'vars': {'last': {'$arrayElemAt': ['$messages', -1]}},
+            'in': [{'$mergeObjects': ['$$last', merged]}]
+        }}
+    ]}}}]
@@ -0,0 +1,38 @@
+from typing import Protocol
+
+from src.modules.conversations.models.Message import Message
+
+
+class IConversationJournalService(Protocol):
+    """
+    Write-behind journal for messages that are still being generated.
+
+    The in-flight message is kept in memory and persisted to the conversation
+    in batches instead of on every streamed delta.
+    """
+
+    async def begin_message(self, as_uid: str, conversation_id: str, message: Message) -> None:
+        ...
+
+    async def extend_message(
+            self,
+            as_uid: str,
+            conversation_id: str,
+            content: str | None = None,
+            reasoning_content: str | None = None,
+            tool_call_id: str | None = None,
+            tool_calls: list[dict] | None = None,
+            context_message_override: str | None = None,
+    ) -> None:
+        """
+        Extend the message last started by `begin_message`.
+        `content` and `reasoning_content` are appended, remaining fields replace the current value.
+        """
+        ...
+
+    async def close(self, as_uid: str, conversation_id: str) -> None:
+        """
+        Flush everything journaled for the conversation and stop tracking it.
+        Should be called at the end of a stream, including on cancellation.
+        """
+        ...
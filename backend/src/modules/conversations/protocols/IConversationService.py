@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Protocol, Any
 
 from src.modules.conversations.models.Conversation import Conversation
 from src.modules.conversations.models.Message import Message
@@ -20,6 +20,30 @@ class IConversationService(Protocol):
     async def replace_conversation_last_message(self, as_uid: str, conversation_id: str, message: Message) -> bool:
         ...
 
+    async def append_message(self, as_uid: str, conversation_id: str, message: Message) -> bool:
+        """
+        Atomically append a message without reading or rewriting the existing messages.
+        """
+        ...
+
+    async def append_to_last_message_content(
+            self,
+            as_uid: str,
+            conversation_id: str,
+            content: str | None = None,
+            reasoning_content: str | None = None
+    ) -> bool:
+        """
+        Atomically concatenate text to the content and/or reasoning content of the last message.
+        """
+        ...
+
+    async def set_last_message_fields(self, as_uid: str, conversation_id: str, fields: dict[str, Any]) -> bool:
+        """
+        Atomically replace the given fields of the last message, leaving other fields untouched.
+        """
+        ...
+
     async def set_conversation_title(self, as_uid: str, conversation_id: str, title: str) -> bool:
         ...
 
@@ -0,0 +1,20 @@
+import pytest_asyncio
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.modules.conversations.MongoConversationJournalService import MongoConversationJournalService
+from src.modules.conversations.MongoConversationService import MongoConversationService
+from src.modules.conversations.test_conversation_journal_service import BaseConversationJournalServiceTestClass
+
+
+@pytest_asyncio.fixture
+def conversation_service(mongo_test_db: AsyncDatabase):
+    return MongoConversationService(mongo_test_db)
+
+
+@pytest_asyncio.fixture
+def service(mongo_test_db: AsyncDatabase):
+    return MongoConversationJournalService(mongo_test_db, flush_interval_seconds=0.2, max_pending_chars=2000)
+
+
+class TestMongoConversationJournalServiceClass(BaseConversationJournalServiceTestClass):
+    ...
@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+from src.common.get_timestamp import get_timestamp
+from src.modules.conversations.models.Message import Message
+from src.modules.conversations.protocols.IConversationJournalService import IConversationJournalService
+from src.modules.conversations.protocols.IConversationService import IConversationService
+
+
+async def _create_conversation(conversation_service: IConversationService, as_uid: str = 'john') -> str:
+    cid = await conversation_service.create_conversation(as_uid=as_uid, assistant_id='a')
+    await conversation_service.add_message_to_conversation(
+        as_uid=as_uid,
+        conversation_id=cid,
+        message=Message(timestamp=get_timestamp(), role='user', content='What is 2+2')
+    )
+    return cid
+
+
+class BaseConversationJournalServiceTestClass:
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_close_flushes_message(service: IConversationJournalService,
+                                         conversation_service: IConversationService):
+        cid = await _create_conversation(conversation_service)
+
+        await service.begin_message(as_uid='john', conversation_id=cid,
+                                    message=Message(timestamp=get_timestamp(), role='assistant', content='the'))
+        await service.extend_message(as_uid='john', conversation_id=cid, content=' answer')
+        await service.extend_message(as_uid='john', conversation_id=cid, content=' is 4', reasoning_content='2+2=4')
+        await service.close(as_uid='john', conversation_id=cid)
+
+        conversation = await conversation_service.get_conversation(as_uid='john', conversation_id=cid)
+
+        assert len(conversation.messages) == 2
+        assert conversation.messages[1].role == 'assistant'
+        assert conversation.messages[1].content == 'the answer is 4'
+        assert conversation.messages[1].reasoning_content == '2+2=4'
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_writes_are_deferred(service: IConversationJournalService,
+                                       conversation_service: IConversationService):
+        cid = await _create_conversation(conversation_service)
+
+        await service.begin_message(as_uid='john', conversation_id=cid,
+                                    message=Message(timestamp=get_timestamp(), role='assistant', content='4'))
+
+        before_flush = await conversation_service.get_conversation(as_uid='john', conversation_id=cid)
+        await asyncio.sleep(0.5)
+        after_flush = await conversation_service.get_conversation(as_uid='john', conversation_id=cid)
+
+        await service.close(as_uid='john', conversation_id=cid)
+
+        assert len(before_flush.messages) == 1
+        assert len(after_flush.messages) == 2
+        assert after_flush.messages[1].content == '4'
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_extend_after_flush(service: IConversationJournalService,
+                                      conversation_service: IConversationService):
+        cid = await _create_conversation(conversation_service)
+
+        await service.begin_message(as_uid='john', conversation_id=cid,
+                                    message=Message(timestamp=get_timestamp(), role='assistant', content='$100'))
+        await asyncio.sleep(0.5)
+        await service.extend_message(as_uid='john', conversation_id=cid, content=' and $200')
+        await service.close(as_uid='john', conversation_id=cid)
+
+        conversation = await conversation_service.get_conversation(as_uid='john', conversation_id=cid)
+
+        assert len(conversation.messages) == 2
+        assert conversation.messages[1].content == '$100 and $200'
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_multiple_messages(service: IConversationJournalService,
+                                     conversation_service: IConversationService):
+        cid = await _create_conversation(conversation_service)
+
+        await service.begin_message(as_uid='john', conversation_id=cid,
+                                    message=Message(timestamp=get_timestamp(), role='assistant', content='calling'))
+        await service.extend_message(as_uid='john', conversation_id=cid, tool_calls=[{'id': 'my_tool_call'}])
+        await service.begin_message(as_uid='john', conversation_id=cid,
+                                    message=Message(timestamp=get_timestamp(), role='tool', content='result',
+                                                    tool_call_id='my_tool_call'))
+        await service.close(as_uid='john', conversation_id=cid)
+
+        conversation = await conversation_service.get_conversation(as_uid='john', conversation_id=cid)
+
+        assert len(conversation.messages) == 3
+        assert conversation.messages[1].content == 'calling'
+        assert conversation.messages[1].tool_calls == [{'id': 'my_tool_call'}]
+        assert conversation.messages[2].role == 'tool'
+        assert conversation.messages[2].tool_call_id == 'my_tool_call'
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_extend_after_other_message(service: IConversationJournalService,
+                                              conversation_service: IConversationService):
+        cid = await _create_conversation(conversation_service)
+
+        await service.begin_message(as_uid='john', conversation_id=cid,
+                                    message=Message(timestamp=get_timestamp(), role='assistant', content='the'))
+        await asyncio.sleep(0.5)
+        await conversation_service.add_message_to_conversation(
+            as_uid='john',
+            conversation_id=cid,
+            message=Message(timestamp=get_timestamp(), role='user', content='And 3+3?')
+        )
+        await service.extend_message(as_uid='john', conversation_id=cid, content=' answer is 4')
+        await service.close(as_uid='john', conversation_id=cid)
+
+        conversation = await conversation_service.get_conversation(as_uid='john', conversation_id=cid)
+
+        assert len(conversation.messages) == 3
+        assert conversation.messages[1].content == 'the answer is 4'
+        assert conversation.messages[2].content == 'And 3+3?'
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_large_write_flushes_early(service: IConversationJournalService,
+                                             conversation_service: IConversationService):
+        cid = await _create_conversation(conversation_service)
+
+        await service.begin_message(as_uid='john', conversation_id=cid,
+                                    message=Message(timestamp=get_timestamp(), role='assistant', content=''))
+        await service.extend_message(as_uid='john', conversation_id=cid, content='a' * 5000)
+        await asyncio.sleep(0.05)
+
+        conversation = await conversation_service.get_conversation(as_uid='john', conversation_id=cid)
+        await service.close(as_uid='john', conversation_id=cid)
+
+        assert len(conversation.messages) == 2
+        assert conversation.messages[1].content == 'a' * 5000
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_invalid_uid(service: IConversationJournalService, conversation_service: IConversationService):
+        cid = await _create_conversation(conversation_service)
+
+        await service.begin_message(as_uid='jane', conversation_id=cid,
+                                    message=Message(timestamp=get_timestamp(), role='assistant', content='evil'))
+        await service.close(as_uid='jane', conversation_id=cid)
+
+        conversation = await conversation_service.get_conversation(as_uid='john', conversation_id=cid)
+
+        assert len(conversation.messages) == 1
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_invalid_id(service: IConversationJournalService):
+        await service.begin_message(as_uid='john', conversation_id='does not exist',
+                                    message=Message(timestamp=get_timestamp(), role='assistant', content='4'))
+        await service.extend_message(as_uid='john', conversation_id='does not exist', content='4')
+        await service.close(as_uid='john', conversation_id='does not exist')
+        assert True
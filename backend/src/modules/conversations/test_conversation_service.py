@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from src.common.get_timestamp import get_timestamp
@@ -257,6 +259,114 @@ class BaseConversationServiceTestClass:
                                                                                  content='world'))
         assert result is False
 
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_append_message_concurrent(service: IConversationService):
+        cid = await service.create_conversation(as_uid='john', assistant_id='a')
+
+        results = await asyncio.gather(*[
+            service.append_message(
+                as_uid='john',
+                conversation_id=cid,
+                message=Message(timestamp=get_timestamp(), role='user', content=str(i))
+            ) for i in range(10)
+        ])
+
+        conversation = await service.get_conversation(as_uid='john', conversation_id=cid)
+
+        assert all(results)
+        assert len(conversation.messages) == 10
+        assert sorted(m.content for m in conversation.messages) == sorted(str(i) for i in range(10))
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_append_message_invalid_uid(service: IConversationService):
+        cid = await service.create_conversation(as_uid='john', assistant_id='a')
+
+        success = await service.append_message(
+            as_uid='jane',
+            conversation_id=cid,
+            message=Message(timestamp=get_timestamp(), role='user', content='hello')
+        )
+        result = await service.get_conversation(as_uid='john', conversation_id=cid)
+
+        assert success is False
+        assert len(result.messages) == 0
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_append_to_last_message_content(service: IConversationService):
+        cid = await service.create_conversation(as_uid='john', assistant_id='a')
+        await service.append_message(as_uid='john', conversation_id=cid,
+                                     message=Message(timestamp=get_timestamp(), role='user', content='What is 2+2'))
+        await service.append_message(as_uid='john', conversation_id=cid,
+                                     message=Message(timestamp=get_timestamp(), role='assistant', content='the'))
+
+        success1 = await service.append_to_last_message_content(as_uid='john', conversation_id=cid,
+                                                                content=' answer is $4')
+        success2 = await service.append_to_last_message_content(as_uid='john', conversation_id=cid,
+                                                                reasoning_content='2+2=4')
+
+        conversation = await service.get_conversation(as_uid='john', conversation_id=cid)
+
+        assert success1 is True
+        assert success2 is True
+        assert len(conversation.messages) == 2
+        assert conversation.messages[0].content == 'What is 2+2'
+        assert conversation.messages[1].content == 'the answer is $4'
+        assert conversation.messages[1].reasoning_content == '2+2=4'
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_append_to_last_message_content_empty(service: IConversationService):
+        cid = await service.create_conversation(as_uid='john', assistant_id='a')
+
+        success = await service.append_to_last_message_content(as_uid='john', conversation_id=cid, content='hello')
+        conversation = await service.get_conversation(as_uid='john', conversation_id=cid)
+
+        assert success is False
+        assert len(conversation.messages) == 0
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_set_last_message_fields(service: IConversationService):
+        cid = await service.create_conversation(as_uid='john', assistant_id='a')
+        await service.append_message(as_uid='john', conversation_id=cid,
+                                     message=Message(timestamp=get_timestamp(), role='assistant', content='calling'))
+
+        success = await service.set_last_message_fields(as_uid='john', conversation_id=cid, fields={
+            'tool_calls': [{'id': 'cool_tool_id', 'type': 'function'}],
+            'context_message_override': '$override',
+        })
+
+        conversation = await service.get_conversation(as_uid='john', conversation_id=cid)
+        message = conversation.messages[-1]
+
+        assert success is True
+        assert message.content == 'calling'
+        assert message.tool_calls == [{'id': 'cool_tool_id', 'type': 'function'}]
+        assert message.context_message_override == '$override'
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_set_last_message_fields_invalid_uid(service: IConversationService):
+        cid = await service.create_conversation(as_uid='john', assistant_id='a')
+        await service.append_message(as_uid='john', conversation_id=cid,
+                                     message=Message(timestamp=get_timestamp(), role='assistant', content='hello'))
+
+        success = await service.set_last_message_fields(as_uid='jane', conversation_id=cid,
+                                                        fields={'content': 'world'})
+        result = await service.get_conversation(as_uid='john', conversation_id=cid)
+
+        assert success is False
+        assert result.messages[0].content == 'hello'
+
     @staticmethod
     @pytest.mark.asyncio
     @pytest.mark.mongo
@@ -0,0 +1,37 @@
+import importlib.util
+
+import httpx
+
+from src.modules.http_clients.protocols.IHttpClientService import IHttpClientService
+
+
+class PooledHttpClientService(IHttpClientService):
+    def __init__(self, max_connections: int = 200, max_keepalive_connections: int = 50,
+                 keepalive_expiry_seconds: float = 60, timeout_seconds: float = 600,
+                 connect_timeout_seconds: float = 5):
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        )
+        self._timeout = httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds)
+        # HTTP/2 needs the optional h2 package
+        self._http2 = importlib.util.find_spec('h2') is not None
+        self._async_client: httpx.AsyncClient | None = None
+        self._sync_client: httpx.Client | None = None
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(limits=self._limits, timeout=self._timeout, http2=self._http2)
+        return self._async_client
+
+    def get_sync_client(self) -> httpx.Client:
+        if self._sync_client is None or self._sync_client.is_closed:
+            self._sync_client = httpx.Client(limits=self._limits, timeout=self._timeout, http2=self._http2)
+        return self._sync_client
+
+    async def close(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+        if self._sync_client is not None:
+            self._sync_client.close()
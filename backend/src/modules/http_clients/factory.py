@@ -0,0 +1,7 @@
+from src.modules.http_clients.PooledHttpClientService import PooledHttpClientService
+from src.modules.http_clients.protocols.IHttpClientService import IHttpClientService
+
+
+class HttpClientServiceFactory:
+    def get(self) -> IHttpClientService:
+        return PooledHttpClientService()
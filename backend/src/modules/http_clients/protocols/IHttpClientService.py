@@ -0,0 +1,25 @@
+from typing import Protocol
+
+import httpx
+
+
+class IHttpClientService(Protocol):
+    """
+    Long-lived HTTP clients shared by everything calling external providers,
+    so connections (and TLS sessions) are reused between requests.
+    """
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        ...
+
+    def get_sync_client(self) -> httpx.Client:
+        """
+        For libraries that only make blocking calls, like the embedding functions.
+        """
+        ...
+
+    async def close(self) -> None:
+        """
+        Close all connections. Should be called on shutdown.
+        """
+        ...
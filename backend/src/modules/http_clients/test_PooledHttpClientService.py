@@ -0,0 +1,13 @@
+import pytest
+
+from src.modules.http_clients.PooledHttpClientService import PooledHttpClientService
+from src.modules.http_clients.test_http_client_service import BaseHttpClientServiceTestClass
+
+
+@pytest.fixture
+def service():
+    return PooledHttpClientService()
+
+
+class TestPooledHttpClientServiceClass(BaseHttpClientServiceTestClass):
+    ...
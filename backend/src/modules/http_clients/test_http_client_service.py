@@ -0,0 +1,29 @@
+import pytest
+
+from src.modules.http_clients.protocols.IHttpClientService import IHttpClientService
+
+
+class BaseHttpClientServiceTestClass:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_http_client_service_shared(service: IHttpClientService):
+        assert service.get_async_client() is service.get_async_client()
+        assert service.get_sync_client() is service.get_sync_client()
+
+        await service.close()
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_http_client_service_close(service: IHttpClientService):
+        async_client = service.get_async_client()
+        sync_client = service.get_sync_client()
+
+        await service.close()
+
+        assert async_client.is_closed
+        assert sync_client.is_closed
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_http_client_service_close_unused(service: IHttpClientService):
+        await service.close()
@@ -0,0 +1,66 @@
+import hashlib
+import uuid
+from collections.abc import AsyncGenerator
+
+from gridfs import AsyncGridFSBucket, NoFile
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.modules.image_store.models.StoredImage import StoredImage
+from src.modules.image_store.protocols.IImageStoreService import IImageStoreService
+
+
+class GridFSImageStoreService(IImageStoreService):
+    def __init__(self, database: AsyncDatabase):
+        self._database = database
+        self._bucket = AsyncGridFSBucket(database, bucket_name='images')
+
+    async def init(self):
+        await self._database['images.files'].create_index(['metadata.sha256', 'metadata.content_type'])
+
+    async def store_image(self, data: bytes, content_type: str) -> str:
+        sha256 = hashlib.sha256(data).hexdigest()
+
+        existing = await self._database['images.files'].find_one(
+            {'metadata.sha256': sha256, 'metadata.content_type': content_type},
+            projection=['_id']
+        )
+
+        if existing is not None:
+            return existing['_id']
+
+        image_id = uuid.uuid4().hex
+
+        await self._bucket.upload_from_stream_with_id(image_id, image_id, data, metadata={
+            'content_type': content_type,
+            'sha256': sha256,
+        })
+
+        return image_id
+
+    async def get_image(self, image_id: str) -> StoredImage | None:
+        try:
+            grid_out = await self._bucket.open_download_stream(image_id)
+        except NoFile:
+            return None
+
+        try:
+            return StoredImage(
+                id=image_id,
+                content_type=grid_out.metadata['content_type'],
+                length=grid_out.length,
+                etag=grid_out.metadata['sha256'],
+            )
+        finally:
+            await grid_out.close()
+
+    async def read_image(self, image_id: str) -> AsyncGenerator[bytes, None]:
+        try:
+            grid_out = await self._bucket.open_download_stream(image_id)
+        except NoFile:
+            return
+
+        try:
+            while chunk := await grid_out.readchunk():
+                yield chunk
+        finally:
+            await grid_out.close()
@@ -0,0 +1,14 @@
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.modules.image_store.GridFSImageStoreService import GridFSImageStoreService
+from src.modules.image_store.protocols.IImageStoreService import IImageStoreService
+
+
+class ImageStoreServiceFactory:
+    def __init__(self, mongo_database: AsyncDatabase):
+        self._mongo_database = mongo_database
+
+    async def get(self) -> IImageStoreService:
+        service = GridFSImageStoreService(self._mongo_database)
+        await service.init()
+        return service
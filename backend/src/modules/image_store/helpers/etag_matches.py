@@ -0,0 +1,10 @@
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an `If-None-Match` header against a (quoted) ETag, using weak comparison.
+    """
+    if if_none_match is None:
+        return False
+
+    candidates = [c.strip() for c in if_none_match.split(',')]
+
+    return '*' in candidates or etag.removeprefix('W/') in [c.removeprefix('W/') for c in candidates]
@@ -0,0 +1,17 @@
+import pytest
+
+from src.modules.image_store.helpers.etag_matches import etag_matches
+
+
+@pytest.mark.parametrize('if_none_match, expected', [
+    (None, False),
+    ('', False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"def", "abc"', True),
+    ('"def"', False),
+    ('abc', False),
+    ('*', True),
+])
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, '"abc"') == expected
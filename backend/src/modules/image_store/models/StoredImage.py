@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class StoredImage(BaseModel):
+    id: str
+    content_type: str
+    length: int
+    etag: str
+    '''
+    Hash of the image data, images are never modified so it identifies the content for good.
+    '''
@@ -0,0 +1,29 @@
+from collections.abc import AsyncGenerator
+from typing import Protocol
+
+from src.modules.image_store.models.StoredImage import StoredImage
+
+
+class IImageStoreService(Protocol):
+    """
+    Blob store for generated images, so messages can reference them by URL
+    instead of carrying the image data inline.
+    """
+
+    async def store_image(self, data: bytes, content_type: str) -> str:
+        """
+        Storing the same image again returns the id of the stored image instead of storing another copy.
+
+        :return: The id of the stored image, hard to guess since it is all that is needed to read the image.
+                 Images are not tied to a user, identical images generated by different users are stored once.
+        """
+        ...
+
+    async def get_image(self, image_id: str) -> StoredImage | None:
+        ...
+
+    def read_image(self, image_id: str) -> AsyncGenerator[bytes, None]:
+        """
+        Stream the image data in chunks. Yields nothing if there is no such image.
+        """
+        ...
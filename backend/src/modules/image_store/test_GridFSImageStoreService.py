@@ -0,0 +1,16 @@
+import pytest_asyncio
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.modules.image_store.GridFSImageStoreService import GridFSImageStoreService
+from src.modules.image_store.test_image_store_service import BaseImageStoreServiceTestClass
+
+
+@pytest_asyncio.fixture
+async def service(mongo_test_db: AsyncDatabase):
+    service = GridFSImageStoreService(mongo_test_db)
+    await service.init()
+    return service
+
+
+class TestGridFSImageStoreServiceClass(BaseImageStoreServiceTestClass):
+    ...
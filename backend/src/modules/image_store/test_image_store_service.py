@@ -0,0 +1,47 @@
+import pytest
+
+from src.modules.image_store.protocols.IImageStoreService import IImageStoreService
+
+
+class BaseImageStoreServiceTestClass:
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_store_and_read_image(service: IImageStoreService):
+        data = bytes(range(256)) * 2000
+        image_id = await service.store_image(data, 'image/png')
+
+        image = await service.get_image(image_id)
+        chunks = [chunk async for chunk in service.read_image(image_id)]
+
+        assert image.id == image_id
+        assert image.content_type == 'image/png'
+        assert image.length == len(data)
+        assert b''.join(chunks) == data
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_etag_follows_content(service: IImageStoreService):
+        first = await service.get_image(await service.store_image(b'first', 'image/png'))
+        second = await service.get_image(await service.store_image(b'second', 'image/png'))
+
+        assert first.etag != second.etag
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_store_same_image_once(service: IImageStoreService):
+        first = await service.store_image(b'first', 'image/png')
+        first_again = await service.store_image(b'first', 'image/png')
+        first_as_jpeg = await service.store_image(b'first', 'image/jpeg')
+
+        assert first_again == first
+        assert first_as_jpeg != first
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.mongo
+    async def test_missing_image(service: IImageStoreService):
+        assert await service.get_image('does not exist') is None
+        assert [chunk async for chunk in service.read_image('does not exist')] == []
@@ -0,0 +1,50 @@
+import asyncio
+import os
+import time
+
+from src.modules.models.helpers.get_model_capabilities import get_model_capabilities
+from src.modules.models.models.ModelCapabilities import ModelCapabilities
+from src.modules.models.protocols.IModelCapabilityService import IModelCapabilityService
+from src.modules.models.protocols.IModelService import IModelService
+
+
+class CachedModelCapabilityService(IModelCapabilityService):
+    """
+    Builds the capability table from all configured models. The table is also rebuilt when
+    older than `ttl_seconds`, to pick up changes made through other processes.
+    """
+
+    def __init__(self, model_service: IModelService, ttl_seconds: float = 60):
+        self._model_service = model_service
+        self._ttl_seconds = ttl_seconds
+        self._capabilities: dict[str, ModelCapabilities] = {}
+        self._unconfigured: dict[str, ModelCapabilities] = {}
+        self._refreshed_at: float | None = None
+        self._refresh_lock = asyncio.Lock()
+
+    async def get_capabilities(self, model: str) -> ModelCapabilities:
+        if self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self._ttl_seconds:
+            async with self._refresh_lock:
+                if self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self._ttl_seconds:
+                    await self._refresh()
+
+        capabilities = self._capabilities.get(model) or self._capabilities.get(model.replace(':', '/'))
+
+        if capabilities is None:
+            capabilities = self._unconfigured.get(model)
+
+        if capabilities is None:
+            capabilities = self._unconfigured[model] = get_model_capabilities(model)
+
+        return capabilities
+
+    async def refresh(self) -> None:
+        async with self._refresh_lock:
+            await self._refresh()
+
+    async def _refresh(self):
+        models = await self._model_service.get_available_models(as_uid=os.environ.get('SETUP_ADMIN', ''))
+
+        self._capabilities = {model.key: get_model_capabilities(model.key, model.meta) for model in models}
+        self._unconfigured = {}
+        self._refreshed_at = time.monotonic()
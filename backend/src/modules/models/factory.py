@@ -1,6 +1,8 @@
 from pymongo.asynchronous.database import AsyncDatabase
 
+from src.modules.models.CachedModelCapabilityService import CachedModelCapabilityService
 from src.modules.models.MongoModelService import MongoModelService
+from src.modules.models.protocols.IModelCapabilityService import IModelCapabilityService
 from src.modules.models.protocols.IModelService import IModelService
 
 
@@ -9,4 +11,12 @@ class ModelServiceFactory:
         self._mongo_database = mongo_database
 
     def get(self) -> IModelService:
-        return MongoModelService(database=self._mongo_database)
\ No newline at end of file
+        return MongoModelService(database=self._mongo_database)
+
+
+class ModelCapabilityServiceFactory:
+    def __init__(self, model_service: IModelService):
+        self._model_service = model_service
+
+    def get(self) -> IModelCapabilityService:
+        return CachedModelCapabilityService(model_service=self._model_service)
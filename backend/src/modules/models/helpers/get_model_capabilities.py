@@ -0,0 +1,36 @@
+from typing import Any
+
+import litellm
+
+from src.modules.models.models.ModelCapabilities import ModelCapabilities
+
+
+def get_model_capabilities(key: str, meta: dict[str, Any] | None = None) -> ModelCapabilities:
+    """
+    Capabilities of a model according to litellm's model metadata, overridden by the `meta` stored with the model.
+    Models unknown to litellm support nothing unless `meta` says otherwise.
+    """
+    litellm_model = key.replace(':', '/')  # patch for old model format
+    meta = meta or {}
+
+    try:
+        info = litellm.get_model_info(litellm_model)
+    except Exception:
+        info = {}
+
+    def supports(check) -> bool:
+        try:
+            return bool(check(litellm_model))
+        except Exception:
+            return False
+
+    return ModelCapabilities(
+        key=key,
+        litellm_model=litellm_model,
+        context_window=meta.get('context_window', info.get('max_input_tokens')),
+        max_output_tokens=meta.get('max_output_tokens', info.get('max_output_tokens')),
+        supports_reasoning=meta.get('supports_reasoning', supports(litellm.supports_reasoning)),
+        supports_web_search=meta.get('supports_web_search', supports(litellm.supports_web_search)),
+        supports_function_calling=meta.get('supports_function_calling', supports(litellm.supports_function_calling)),
+        supports_imagegen=meta.get('supports_imagegen', False),
+    )
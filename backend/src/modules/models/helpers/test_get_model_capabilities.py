@@ -0,0 +1,43 @@
+from src.modules.models.helpers.get_model_capabilities import get_model_capabilities
+
+
+def test_get_model_capabilities_from_litellm():
+    capabilities = get_model_capabilities('openai/o3-mini')
+
+    assert capabilities.litellm_model == 'openai/o3-mini'
+    assert capabilities.context_window == 200000
+    assert capabilities.max_output_tokens == 100000
+    assert capabilities.supports_reasoning
+    assert capabilities.supports_function_calling
+    assert not capabilities.supports_web_search
+    assert not capabilities.supports_imagegen
+
+
+def test_get_model_capabilities_meta_overrides():
+    capabilities = get_model_capabilities('openai/o3-mini', {
+        'context_window': 1000,
+        'supports_imagegen': True,
+        'supports_web_search': True,
+    })
+
+    assert capabilities.context_window == 1000
+    assert capabilities.max_output_tokens == 100000
+    assert capabilities.supports_imagegen
+    assert capabilities.supports_web_search
+
+
+def test_get_model_capabilities_old_format():
+    capabilities = get_model_capabilities('openai:gpt-4o')
+
+    assert capabilities.key == 'openai:gpt-4o'
+    assert capabilities.litellm_model == 'openai/gpt-4o'
+    assert capabilities.context_window == 128000
+
+
+def test_get_model_capabilities_unknown_model():
+    capabilities = get_model_capabilities('local/my-model', {'context_window': 4096})
+
+    assert capabilities.context_window == 4096
+    assert capabilities.max_output_tokens is None
+    assert not capabilities.supports_reasoning
+    assert not capabilities.supports_function_calling
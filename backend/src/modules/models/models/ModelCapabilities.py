@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ModelCapabilities:
+    key: str
+    litellm_model: str
+    '''
+    The key in `provider/model` format, as expected by litellm.
+    '''
+    context_window: int | None = None
+    max_output_tokens: int | None = None
+    supports_reasoning: bool = False
+    supports_web_search: bool = False
+    supports_function_calling: bool = False
+    supports_imagegen: bool = False
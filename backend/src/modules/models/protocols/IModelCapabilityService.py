@@ -0,0 +1,22 @@
+from typing import Protocol
+
+from src.modules.models.models.ModelCapabilities import ModelCapabilities
+
+
+class IModelCapabilityService(Protocol):
+    """
+    Lookup table of what each model supports, so it doesn't have to be worked out on every request.
+    """
+
+    async def get_capabilities(self, model: str) -> ModelCapabilities:
+        """
+        :param model: Model key, like an assistant's `model`. Models not configured in the
+            model service get the capabilities litellm knows of.
+        """
+        ...
+
+    async def refresh(self) -> None:
+        """
+        Rebuild the table, should be called when models are changed.
+        """
+        ...
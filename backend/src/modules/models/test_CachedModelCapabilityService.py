@@ -0,0 +1,31 @@
+import pytest
+
+from src.modules.models.CachedModelCapabilityService import CachedModelCapabilityService
+from src.modules.models.models.Model import Model
+from src.modules.models.test_model_capability_service import BaseModelCapabilityServiceTestClass
+
+
+class _InMemoryModelService:
+    def __init__(self):
+        self.models: list[Model] = []
+
+    async def get_available_models(self, as_uid: str) -> list[Model]:
+        return self.models
+
+    async def set_available_models(self, models: list[Model]) -> bool:
+        self.models = models
+        return True
+
+
+@pytest.fixture
+def model_service():
+    return _InMemoryModelService()
+
+
+@pytest.fixture
+def service(model_service):
+    return CachedModelCapabilityService(model_service=model_service)
+
+
+class TestCachedModelCapabilityServiceClass(BaseModelCapabilityServiceTestClass):
+    ...
@@ -0,0 +1,62 @@
+import pytest
+
+from src.modules.models.models.Model import Model
+from src.modules.models.protocols.IModelCapabilityService import IModelCapabilityService
+
+
+class BaseModelCapabilityServiceTestClass:
+    """
+    Expects a service reading models from `model_service`.
+    """
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_get_capabilities(service: IModelCapabilityService, model_service):
+        await model_service.set_available_models([
+            Model(key='openai/o3-mini', provider='OpenAI', display_name='o3-mini', meta={
+                'context_window': 1000,
+                'supports_imagegen': True,
+            }),
+        ])
+
+        capabilities = await service.get_capabilities('openai/o3-mini')
+
+        assert capabilities.context_window == 1000
+        assert capabilities.supports_imagegen
+        assert capabilities.supports_reasoning
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_get_capabilities_old_format(service: IModelCapabilityService, model_service):
+        await model_service.set_available_models([
+            Model(key='openai/o3-mini', provider='OpenAI', display_name='o3-mini', meta={'context_window': 1000}),
+        ])
+
+        capabilities = await service.get_capabilities('openai:o3-mini')
+
+        assert capabilities.context_window == 1000
+        assert capabilities.litellm_model == 'openai/o3-mini'
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_get_capabilities_unconfigured(service: IModelCapabilityService, model_service):
+        capabilities = await service.get_capabilities('openai/gpt-4o')
+
+        assert capabilities.context_window == 128000
+        assert not capabilities.supports_imagegen
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_get_capabilities_refresh(service: IModelCapabilityService, model_service):
+        await model_service.set_available_models([
+            Model(key='openai/o3-mini', provider='OpenAI', display_name='o3-mini', meta={'context_window': 1000}),
+        ])
+        assert (await service.get_capabilities('openai/o3-mini')).context_window == 1000
+
+        await model_service.set_available_models([
+            Model(key='openai/o3-mini', provider='OpenAI', display_name='o3-mini', meta={'context_window': 2000}),
+        ])
+        assert (await service.get_capabilities('openai/o3-mini')).context_window == 1000
+
+        await service.refresh()
+        assert (await service.get_capabilities('openai/o3-mini')).context_window == 2000
@@ -0,0 +1,7 @@
+from src.modules.rerank.LexicalRerankService import LexicalRerankService
+from src.modules.rerank.protocols.IRerankService import IRerankService
+
+
+class RerankServiceFactory:
+    def get(self) -> IRerankService:
+        return LexicalRerankService()
@@ -0,0 +1,11 @@
+from typing import Protocol
+
+
+class IRerankService(Protocol):
+    async def score(self, query: str, documents: list[str]) -> list[int]:
+        """
+        Score how relevant each document is to the query.
+
+        :return: One score from 0-100 per document, in the same order as `documents`.
+        """
+        ...
@@ -0,0 +1,45 @@
+import pytest
+
+from src.modules.rerank.LexicalRerankService import LexicalRerankService
+from src.modules.rerank.test_rerank_service import BaseRerankServiceTestClass
+
+
+@pytest.fixture
+def service():
+    return LexicalRerankService()
+
+
+class TestLexicalRerankServiceClass(BaseRerankServiceTestClass):
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_lexical_rerank_service_matches_inflections(service: LexicalRerankService):
+        scores = await service.score('bibliotekets öppettider', ['Biblioteket har öppettider 10-18.', 'Simhallen.'])
+
+        assert scores == [100, 0]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_lexical_rerank_service_ignores_stopwords(service: LexicalRerankService):
+        scores = await service.score('parking fee at the city hall', [
+            '(source:a.pdf, page: 1)\nThe pool is closed on Sundays.'
+        ])
+
+        assert scores == [0]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_lexical_rerank_service_counts_unmatched_terms(service: LexicalRerankService):
+        scores = await service.score('what are the opening hours of the library', [
+            'The swimming pool is closed on Sundays.',
+            'The gym opening times are posted at the entrance.',
+        ])
+
+        assert scores[0] == 0
+        assert scores[1] < 50
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_lexical_rerank_service_ignores_source_header(service: LexicalRerankService):
+        scores = await service.score('source page', ['(source:a.pdf, page: 1)\nThe pool is closed on Sundays.'])
+
+        assert scores == [0]
@@ -0,0 +1,32 @@
+import pytest
+
+from src.modules.rerank.protocols.IRerankService import IRerankService
+
+
+class BaseRerankServiceTestClass:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rerank_service_order(service: IRerankService):
+        scores = await service.score('opening hours of the library', [
+            'The swimming pool is closed on Sundays.',
+            'The library opening hours are 10-18 on weekdays.',
+            'The library has a large collection of books.',
+        ])
+
+        assert len(scores) == 3
+        assert scores[1] > scores[2] > scores[0]
+        assert all(0 <= s <= 100 for s in scores)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rerank_service_no_overlap(service: IRerankService):
+        scores = await service.score('pizza recipe', ['The library opening hours.', 'Swimming pool.'])
+
+        assert scores == [0, 0]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rerank_service_empty(service: IRerankService):
+        scores = await service.score('anything', [])
+
+        assert scores == []
@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+from src.modules.settings.models.SettingValue import SettingValue, SettingsDict
+from src.modules.settings.protocols.ISettingsService import ISettingsService
+
+
+class CachedSettingsService(ISettingsService):
+    """
+    Serves reads from a snapshot of all settings, refreshed from the wrapped service at most
+    every `ttl_seconds`. Writes go straight through and invalidate the snapshot, writes made
+    by other processes are picked up when the snapshot expires.
+    """
+
+    def __init__(self, settings_service: ISettingsService, ttl_seconds: float = 10):
+        self._settings_service = settings_service
+        self._ttl_seconds = ttl_seconds
+        self._snapshot: SettingsDict | None = None
+        self._snapshot_at = 0.0
+        self._writes = 0
+        self._refresh_lock = asyncio.Lock()
+
+    async def get_setting(self, key: str, fallback_value: SettingValue | None = None) -> SettingValue | None:
+        snapshot = await self._get_snapshot()
+        return snapshot.get(key, fallback_value)
+
+    async def get_settings(self) -> SettingsDict:
+        return dict(await self._get_snapshot())
+
+    async def set_setting(self, key: str, value: SettingValue) -> None:
+        await self._settings_service.set_setting(key, value)
+        self._invalidate()
+
+    async def patch_settings(self, patch: SettingsDict) -> None:
+        await self._settings_service.patch_settings(patch)
+        self._invalidate()
+
+    async def _get_snapshot(self) -> SettingsDict:
+        if self._is_fresh():
+            return self._snapshot
+
+        async with self._refresh_lock:
+            # another request may have refreshed while this one was waiting
+            if self._is_fresh():
+                return self._snapshot
+
+            writes = self._writes
+            snapshot = await self._settings_service.get_settings()
+
+            # a snapshot read while writing may not include the write, use it once but don't keep it
+            if writes == self._writes:
+                self._snapshot, self._snapshot_at = snapshot, time.monotonic()
+
+            return snapshot
+
+    def _invalidate(self):
+        self._snapshot = None
+        self._writes += 1
+
+    def _is_fresh(self) -> bool:
+        return self._snapshot is not None and time.monotonic() - self._snapshot_at < self._ttl_seconds
@@ -1,5 +1,6 @@
 from pymongo.asynchronous.database import AsyncDatabase
 
+from src.modules.settings.CachedSettingsService import CachedSettingsService
 from src.modules.settings.MongoSettingsService import MongoSettingsService
 from src.modules.settings.protocols.ISettingsService import ISettingsService
 
@@ -9,4 +10,4 @@ class SettingsServiceFactory:
         self._mongo_database = mongo_database
 
     def get(self) -> ISettingsService:
-        return MongoSettingsService(self._mongo_database)
+        return CachedSettingsService(MongoSettingsService(self._mongo_database))
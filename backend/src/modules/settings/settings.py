@@ -29,6 +29,42 @@ class SettingKey(metaclass=SettingKeyMeta):
     ANTHROPIC_API_KEY = Setting('anthropic.api_key', '')
     MISTRAL_API_KEY = Setting('mistral.api_key', '')
 
+    RAG_SCORING_MAX_CONCURRENCY = Setting('rag.scoring_max_concurrency', 5)
+    RAG_SCORING_TIMEOUT_SECONDS = Setting('rag.scoring_timeout_seconds', 20)
+    RAG_SCORING_EARLY_STOP_COUNT = Setting('rag.scoring_early_stop_count', 0)  # 0 = score all results
+    RAG_RERANK_SCORE_THRESHOLD = Setting('rag.rerank_score_threshold', 50)
+    RAG_RETRIEVAL_GATING = Setting('rag.retrieval_gating', True)  # skip/reuse retrieval for trivial follow-ups
+    RAG_RETRIEVAL_GATING_LOG = Setting('rag.retrieval_gating_log', False)  # log each decision, to measure savings
+    RAG_DUPLICATE_SIMILARITY = Setting('rag.duplicate_similarity', 0.8)  # > 1 = keep near-duplicates
+    RAG_CONTEXT_MAX_TOKENS = Setting('rag.context_max_tokens', 8000)  # further limited by the model's context window
+
+    # Max concurrently running LLM generations, 0 = unlimited
+    GENERATION_MAX_CONCURRENT = Setting('generation.max_concurrent', 64)
+    GENERATION_MAX_CONCURRENT_PER_USER = Setting('generation.max_concurrent_per_user', 4)
+    GENERATION_MAX_CONCURRENT_PER_ASSISTANT = Setting('generation.max_concurrent_per_assistant', 32)
+    GENERATION_MAX_CONCURRENT_PER_MODEL = Setting('generation.max_concurrent_per_model', 32)
+
+    # Retries when the provider responds 429 before anything has been streamed
+    LLM_RATE_LIMIT_MAX_RETRIES = Setting('llm.rate_limit_max_retries', 3)
+    LLM_RATE_LIMIT_MAX_RETRY_SECONDS = Setting('llm.rate_limit_max_retry_seconds', 30)
+
+    # Model calls per answer when tool results are fed back into the model
+    LLM_TOOL_MAX_STEPS = Setting('llm.tool_max_steps', 5)
+    LLM_TOOL_TIMEOUT_SECONDS = Setting('llm.tool_timeout_seconds', 120)
+
+    # Share cached /ai/completions responses between workers through Mongo
+    COMPLETIONS_CACHE_SHARED = Setting('completions_cache.shared', False)
+
+    # Assistants with semantic_cache on answer a new chat from a similar earlier first message (cosine similarity)
+    SEMANTIC_CACHE_MIN_SIMILARITY = Setting('semantic_cache.min_similarity', 0.9)
+    SEMANTIC_CACHE_EMBEDDING_MODEL = Setting('semantic_cache.embedding_model', 'default')
+
+    # Streamed message deltas are merged into one SSE frame for up to this long (0 = a frame per delta)
+    SSE_FLUSH_INTERVAL_SECONDS = Setting('sse.flush_interval_seconds', 0.03)
+    SSE_FLUSH_MAX_CHARS = Setting('sse.flush_max_chars', 400)  # 0 = no limit
+    # Keep-alive comment sent on open SSE streams, so proxies don't close them during long pauses
+    SSE_PING_INTERVAL_SECONDS = Setting('sse.ping_interval_seconds', 10)
+
 
 if __name__ == '__main__':
     print(SettingKey.JWT_USER_SECRET)
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.modules.settings.CachedSettingsService import CachedSettingsService
+from src.modules.settings.MongoSettingsService import MongoSettingsService
+from src.modules.settings.models.SettingValue import SettingValue, SettingsDict
+from src.modules.settings.test_settings_service import BaseSettingsServiceTest
+
+
+@pytest_asyncio.fixture
+def service(mongo_test_db: AsyncDatabase):
+    return CachedSettingsService(MongoSettingsService(mongo_test_db))
+
+
+class TestCachedSettingsService(BaseSettingsServiceTest):
+    ...
+
+
+class _InMemorySettingsService:
+    def __init__(self):
+        self.settings: SettingsDict = {}
+        self.reads = 0
+
+    async def get_setting(self, key: str, fallback_value: SettingValue | None = None) -> SettingValue | None:
+        self.reads += 1
+        return self.settings.get(key, fallback_value)
+
+    async def get_settings(self) -> SettingsDict:
+        self.reads += 1
+        await asyncio.sleep(0)
+        return dict(self.settings)
+
+    async def set_setting(self, key: str, value: SettingValue) -> None:
+        self.settings[key] = value
+
+    async def patch_settings(self, patch: SettingsDict) -> None:
+        self.settings.update(patch)
+
+
+@pytest.mark.asyncio
+async def test_cached_settings_reads_snapshot_once():
+    inner = _InMemorySettingsService()
+    inner.settings = {'a': 1, 'b': 'two'}
+    service = CachedSettingsService(inner)
+
+    results = await asyncio.gather(*[service.get_setting(key, 'fallback') for key in ['a', 'b', 'c'] * 10])
+
+    assert results == [1, 'two', 'fallback'] * 10
+    assert inner.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_settings_invalidated_on_write():
+    inner = _InMemorySettingsService()
+    service = CachedSettingsService(inner)
+
+    assert await service.get_setting('a') is None
+
+    await service.set_setting('a', 1)
+    assert await service.get_setting('a') == 1
+
+    await service.patch_settings({'a': 2})
+    assert await service.get_settings() == {'a': 2}
+
+
+@pytest.mark.asyncio
+async def test_cached_settings_expires():
+    inner = _InMemorySettingsService()
+    service = CachedSettingsService(inner, ttl_seconds=0.01)
+
+    assert await service.get_setting('a') is None
+
+    inner.settings['a'] = 1  # written by another process
+    assert await service.get_setting('a') is None
+
+    await asyncio.sleep(0.02)
+    assert await service.get_setting('a') == 1
@@ -2,13 +2,16 @@ from litellm import token_counter
 
 from src.modules.assistants.protocols.IAssistantService import IAssistantService
 from src.modules.conversations.protocols.IConversationService import IConversationService
+from src.modules.models.protocols.IModelCapabilityService import IModelCapabilityService
 from src.modules.token.protocols.ITokenService import ITokenService
 
 
 class LiteLLMTokenService(ITokenService):
-    def __init__(self, assistant_service: IAssistantService, conversation_service: IConversationService):
+    def __init__(self, assistant_service: IAssistantService, conversation_service: IConversationService,
+                 model_capability_service: IModelCapabilityService):
         self._assistant_service = assistant_service
         self._conversation_service = conversation_service
+        self._model_capability_service = model_capability_service
 
     async def get_token_count(self, as_uid: str, assistant_id: str, message: str) -> int:
         assistant = await self._assistant_service.get_assistant(as_uid=as_uid, assistant_id=assistant_id,
@@ -17,7 +20,8 @@ class LiteLLMTokenService(ITokenService):
         if not assistant:
             return -1
 
-        tokens = token_counter(assistant.model, messages=[
+        capabilities = await self._model_capability_service.get_capabilities(assistant.model)
+        tokens = token_counter(capabilities.litellm_model, messages=[
             {'role': 'system', 'content': assistant.instructions},
             {'role': 'user', 'content': message},
         ])
@@ -35,8 +39,9 @@ class LiteLLMTokenService(ITokenService):
         if not assistant:
             return -1
 
+        capabilities = await self._model_capability_service.get_capabilities(assistant.model)
         return token_counter(
-            model=assistant.model,
+            model=capabilities.litellm_model,
             messages=[
                          {'role': m.role, 'content': m.content} for m in conversation.messages
                      ] + [{'role': 'user', 'content': message}]
@@ -1,13 +1,16 @@
 from src.modules.assistants.protocols.IAssistantService import IAssistantService
 from src.modules.conversations.protocols.IConversationService import IConversationService
+from src.modules.models.protocols.IModelCapabilityService import IModelCapabilityService
 from src.modules.token.LiteLLMTokenService import LiteLLMTokenService
 from src.modules.token.protocols.ITokenService import ITokenService
 
 
 class TokenServiceFactory:
-    def __init__(self, assistant_service: IAssistantService, conversation_service: IConversationService):
+    def __init__(self, assistant_service: IAssistantService, conversation_service: IConversationService,
+                 model_capability_service: IModelCapabilityService):
         self._assistant_service = assistant_service
         self._conversation_service = conversation_service
+        self._model_capability_service = model_capability_service
 
     def get(self) -> ITokenService:
-        return LiteLLMTokenService(self._assistant_service, self._conversation_service)
+        return LiteLLMTokenService(self._assistant_service, self._conversation_service, self._model_capability_service)
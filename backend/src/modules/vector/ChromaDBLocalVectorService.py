@@ -2,18 +2,21 @@ import chromadb
 from chromadb import EmbeddingFunction
 from chromadb.errors import InvalidCollectionException
 from chromadb.utils import embedding_functions
-from chromadb.utils.embedding_functions.openai_embedding_function import OpenAIEmbeddingFunction
 
+from src.modules.http_clients.protocols.IHttpClientService import IHttpClientService
 from src.modules.settings.protocols.ISettingsService import ISettingsService
 from src.modules.settings.settings import SettingKey
+from src.modules.vector.PooledOpenAIEmbeddingFunction import PooledOpenAIEmbeddingFunction
 from src.modules.vector.models.VectorDocument import VectorDocument
 from src.modules.vector.models.VectorSpace import VectorSpace
 from src.modules.vector.protocols.IVectorService import IVectorService
 
 
 class ChromaDBLocalVectorService(IVectorService):
-    def __init__(self, settings_service: ISettingsService, db_path='./__chromadb'):
+    def __init__(self, settings_service: ISettingsService, http_client_service: IHttpClientService,
+                 db_path='./__chromadb'):
         self._settings_service = settings_service
+        self._http_client_service = http_client_service
         self._chroma_client = chromadb.PersistentClient(
             path=db_path,
             settings=chromadb.Settings(
@@ -78,11 +81,13 @@ class ChromaDBLocalVectorService(IVectorService):
         ids = query_results['ids'][0]
         documents = query_results['documents'][0]
         metadatas = query_results['metadatas'][0]
+        distances = query_results['distances'][0]
 
         return [VectorDocument(
             id=ids[i],
             content=documents[i],
-            metadata=dict(metadatas[i]) if metadatas[i] else None
+            metadata=dict(metadatas[i]) if metadatas[i] else None,
+            distance=distances[i]
         ) for i in range(len(ids))
         ]
 
@@ -90,9 +95,10 @@ class ChromaDBLocalVectorService(IVectorService):
         openai_api_key = await self._settings_service.get_setting(SettingKey.OPENAI_API_KEY.key)
         embedding_model_map = {
             'default': lambda: embedding_functions.DefaultEmbeddingFunction(),
-            'text-embedding-3-small': lambda: OpenAIEmbeddingFunction(
+            'text-embedding-3-small': lambda: PooledOpenAIEmbeddingFunction(
                 api_key=openai_api_key,
-                model_name='text-embedding-3-small'
+                model_name='text-embedding-3-small',
+                http_client=self._http_client_service.get_sync_client()
             )
         }
         return embedding_model_map[embedding_model_name or 'default']()
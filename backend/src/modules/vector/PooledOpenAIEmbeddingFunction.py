@@ -0,0 +1,23 @@
+from typing import cast
+
+import httpx
+import openai
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+
+class PooledOpenAIEmbeddingFunction(EmbeddingFunction[Documents]):
+    """
+    Like chroma's OpenAIEmbeddingFunction, but on a shared HTTP client instead of one client per instance.
+    """
+
+    def __init__(self, api_key: str, model_name: str, http_client: httpx.Client):
+        self._client = openai.OpenAI(api_key=api_key, http_client=http_client).embeddings
+        self._model_name = model_name
+
+    def __call__(self, input: Documents) -> Embeddings:
+        # replace newlines, which can negatively affect performance.
+        input = [t.replace('\n', ' ') for t in input]
+
+        embeddings = self._client.create(input=input, model=self._model_name).data
+
+        return cast(Embeddings, [result.embedding for result in sorted(embeddings, key=lambda e: e.index)])
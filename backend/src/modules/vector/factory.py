@@ -1,5 +1,6 @@
 import os
 
+from src.modules.http_clients.protocols.IHttpClientService import IHttpClientService
 from src.modules.settings.protocols.ISettingsService import ISettingsService
 from src.modules.vector.ChromaDBClientVectorService import ChromaDBClientVectorService
 from src.modules.vector.ChromaDBLocalVectorService import ChromaDBLocalVectorService
@@ -7,8 +8,9 @@ from src.modules.vector.protocols.IVectorService import IVectorService
 
 
 class VectorServiceFactory:
-    def __init__(self, settings_service: ISettingsService):
+    def __init__(self, settings_service: ISettingsService, http_client_service: IHttpClientService):
         self._settings_service = settings_service
+        self._http_client_service = http_client_service
 
     def get(self) -> IVectorService:
         server_host = os.environ.get("CHROMADB_HOST")
@@ -16,6 +18,9 @@ class VectorServiceFactory:
 
         if server_host is not None and len(server_host) > 0:
             port = int(server_port) if server_port is not None and server_port.isdigit() else int(server_port)
-            return ChromaDBClientVectorService(settings_service=self._settings_service, host=server_host, port=port)
+            return ChromaDBClientVectorService(settings_service=self._settings_service,
+                                               http_client_service=self._http_client_service,
+                                               host=server_host, port=port)
 
-        return ChromaDBLocalVectorService(settings_service=self._settings_service)
+        return ChromaDBLocalVectorService(settings_service=self._settings_service,
+                                          http_client_service=self._http_client_service)
@@ -7,3 +7,7 @@ class VectorDocument(BaseModel):
     id: str
     content: str
     metadata: dict[str, Any] | None
+    distance: float | None = None
+    '''
+    Squared L2 distance to the query, for documents returned by a query.
+    '''
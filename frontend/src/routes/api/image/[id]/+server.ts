@@ -0,0 +1,11 @@
+import type { RequestHandler } from './$types.js'
+import { BackendApiServiceFactory } from '$lib/backendApi/backendApi.js'
+
+/** Generated images are referenced as /api/image/<id> in messages, stream them from the backend */
+export const GET: RequestHandler = async (event) => {
+  const { id } = event.params
+
+  const api = new BackendApiServiceFactory().get(event)
+
+  return api.getRaw(`/api/image/${encodeURIComponent(id)}`)
+}